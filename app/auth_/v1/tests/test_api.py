@@ -1,3 +1,4 @@
+import msgpack
 from django.urls import reverse
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
@@ -28,6 +29,19 @@ class AuthV1LoginTestCase(BaseAPITestCase):
         self.assertIn("refresh", response_json)
         self.assertTrue(RefreshToken(response_json["refresh"]))
 
+    def test_success_msgpack(self):
+        response = self.client.post(
+            self.url,
+            msgpack.packb(self.valid_data),
+            content_type="application/msgpack",
+            headers={"Accept": "application/msgpack"},
+        )
+        response_data = msgpack.unpackb(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertTrue(RefreshToken(response_data["refresh"]))
+
     def test_not_exist(self):
         self.user.delete()
 
@@ -0,0 +1,227 @@
+"""
+Compare synchronous and native async views of the chat endpoints
+
+Usage:
+    python -m benchmarks.async_views --requests 2000 --concurrency 32
+
+Requests are sent in-process to the ASGI application, every endpoint
+is served by its async view and by a synchronous baseline of the same
+view, which Django runs through sync_to_async.
+A `benchmark` user with a thread and messages is created
+in the configured database on the first run
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.core.asgi import get_asgi_application  # noqa: E402
+from django.urls import path  # noqa: E402
+from rest_framework.views import APIView  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from chat.models import Message, Thread  # noqa: E402
+from chat.v1.views import ChatV1ThreadListView  # noqa: E402
+from chat.v1.views.message_create import ChatV1MessageCreateView  # noqa: E402
+from chat.v1.views.message_list import ChatV1MessageListView  # noqa: E402
+
+
+class SyncThreadListView(ChatV1ThreadListView):
+    dispatch = APIView.dispatch
+
+    def get(self, *args, **kwargs):
+        request_data = self._get_request_query()
+        result = self._service.list(user=self.request.user, **request_data)
+        return self._get_response_paginated(**result)
+
+
+class SyncMessageListView(ChatV1MessageListView):
+    dispatch = APIView.dispatch
+
+    def get(self, _, pk: int, *args, **kwargs):
+        request_data = self._get_request_query()
+        result = self._service.list(
+            user=self.request.user, thread_id=pk, **request_data
+        )
+        return self._get_response_paginated(**result)
+
+
+class SyncMessageCreateView(ChatV1MessageCreateView):
+    dispatch = APIView.dispatch
+
+    def post(self, _, pk: int, *args, **kwargs):
+        data = self._get_request_body()
+        message = self._service.create(
+            user=self.request.user, thread_id=pk, **data
+        )
+        return self._get_response(message)
+
+
+urlpatterns = [
+    path("sync/threads/", SyncThreadListView.as_view()),
+    path("sync/threads/<int:pk>/messages/", SyncMessageListView.as_view()),
+    path(
+        "sync/threads/<int:pk>/messages/create/",
+        SyncMessageCreateView.as_view(),
+    ),
+    path("async/threads/", ChatV1ThreadListView.as_view()),
+    path("async/threads/<int:pk>/messages/", ChatV1MessageListView.as_view()),
+    path(
+        "async/threads/<int:pk>/messages/create/",
+        ChatV1MessageCreateView.as_view(),
+    ),
+]
+
+
+def get_fixture(messages: int) -> tuple[str, int]:
+    user_model = get_user_model()
+    user, _ = user_model.objects.get_or_create(username="benchmark")
+    peer, _ = user_model.objects.get_or_create(username="benchmark-peer")
+
+    participants_key = Thread.get_participants_key([user.id, peer.id])
+    thread, created = Thread.objects.get_or_create(
+        participants_key=participants_key
+    )
+    if created:
+        thread.participants.add(user, peer, through_defaults={})
+        Message.objects.bulk_create(
+            Message(thread=thread, sender=peer, text=f"message {i}")
+            for i in range(messages)
+        )
+
+    return str(RefreshToken.for_user(user).access_token), thread.id
+
+
+async def request(
+    application, method: str, url: str, token: str, body: dict = None
+) -> int:
+    path, _, query_string = url.partition("?")
+    data = json.dumps(body).encode() if body is not None else b""
+    headers = [
+        (b"host", b"localhost"),
+        (b"authorization", f"Bearer {token}".encode()),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(data)).encode()),
+    ]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    messages = [{"type": "http.request", "body": data, "more_body": False}]
+    status = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await application(scope, receive, send)
+    return status[0]
+
+
+async def run(
+    application, method, url, token, body, requests, concurrency
+) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, failed = [], []
+
+    async def run_one():
+        async with semaphore:
+            started_at = time.perf_counter()
+            status = await request(application, method, url, token, body)
+            latencies.append(time.perf_counter() - started_at)
+            if status >= 400:
+                failed.append(status)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[run_one() for _ in range(requests)])
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "failed": len(failed),
+    }
+
+
+async def main(args) -> None:
+    token, thread_id = await sync_to_async(get_fixture)(args.messages)
+    settings.ROOT_URLCONF = sys.modules[__name__]
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "localhost"]
+    application = get_asgi_application()
+
+    endpoints = [
+        ("thread list", "GET", "threads/?page_size=20", None),
+        (
+            "message list",
+            "GET",
+            f"threads/{thread_id}/messages/?page_size=20",
+            None,
+        ),
+        (
+            "message create",
+            "POST",
+            f"threads/{thread_id}/messages/create/",
+            {"text": "benchmark"},
+        ),
+    ]
+
+    print(
+        f"{'endpoint':<16}{'mode':<7}{'req/s':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'failed':>8}"
+    )
+    for name, method, url, body in endpoints:
+        for mode in ["sync", "async"]:
+            result = await run(
+                application,
+                method,
+                f"/{mode}/{url}",
+                token,
+                body,
+                args.requests,
+                args.concurrency,
+            )
+            print(
+                f"{name:<16}{mode:<7}{result['rps']:>9.0f}"
+                f"{result['p50']:>9.1f}{result['p95']:>9.1f}"
+                f"{result['failed']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--messages", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
@@ -0,0 +1,94 @@
+"""
+Compare the stock JSON renderer with the orjson based renderer
+
+Usage:
+    python -m benchmarks.json_renderer --iterations 2000
+
+Message list pages of different sizes are built by the message list
+values serializer and rendered in-process by both renderers,
+no database is needed
+"""
+
+import argparse
+import os
+import time
+from datetime import timedelta
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from chat.v1.serializers import (  # noqa: E402
+    ChatV1MessageListValuesSerializer,
+)
+from common.renderers import FastJSONRenderer  # noqa: E402
+from common.renderers.fast_json import orjson  # noqa: E402
+
+RENDERERS = [("json", JSONRenderer()), ("orjson", FastJSONRenderer())]
+
+
+def get_page(page_size: int) -> dict:
+    serializer = ChatV1MessageListValuesSerializer()
+    now = timezone.now()
+    return {
+        "results": [
+            serializer.to_representation(
+                {
+                    "id": i,
+                    "text": f"message {i} " * 8,
+                    "sender_id": 1 + i % 2,
+                    "sender__username": f"user{1 + i % 2}",
+                    "is_read": bool(i % 2),
+                    "created_at": now - timedelta(seconds=i),
+                }
+            )
+            for i in range(page_size)
+        ],
+        "next_cursor": "eyJ2IjpbIjIwMjUtMDEtMDFUMDA6MDA6MDBaIiwxXX0",
+        "prev_cursor": None,
+    }
+
+
+def run(renderer, data: dict, iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        renderer.render(data)
+
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+
+def main(args) -> None:
+    if orjson is None:
+        print("orjson is not installed, both renderers use json")
+
+    print(
+        f"{'page size':<11}"
+        + "".join(f"{name + ' us':>12}" for name, _ in RENDERERS)
+        + f"{'speedup':>10}"
+    )
+    for page_size in args.page_sizes:
+        data = get_page(page_size)
+        assert len({r.render(data) for _, r in RENDERERS}) == 1
+
+        results = [run(r, data, args.iterations) for _, r in RENDERERS]
+        print(
+            f"{page_size:<11}"
+            + "".join(f"{r:>12.1f}" for r in results)
+            + f"{results[0] / results[1]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=[10, 50, 100, 500]
+    )
+    args = parser.parse_args()
+
+    main(args)
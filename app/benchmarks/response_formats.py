@@ -0,0 +1,75 @@
+"""
+Compare JSON and MessagePack message list pages
+
+Usage:
+    python -m benchmarks.response_formats --iterations 2000
+
+Pages of different sizes are built by the message list values
+serializer, rendered by the JSON and MessagePack renderers and decoded
+again as a client would, no database is needed.
+Sizes are reported raw and gzip compressed
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import msgpack  # noqa: E402
+
+from benchmarks.json_renderer import get_page  # noqa: E402
+from common.renderers import (  # noqa: E402
+    FastJSONRenderer,
+    MessagePackRenderer,
+)
+
+FORMATS = [
+    ("json", FastJSONRenderer(), json.loads),
+    ("msgpack", MessagePackRenderer(), msgpack.unpackb),
+]
+
+
+def run(func, data, iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        func(data)
+
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+
+def main(args) -> None:
+    print(
+        f"{'page size':<11}{'format':<9}{'bytes':>9}{'gzip':>9}"
+        f"{'render us':>11}{'decode us':>11}"
+    )
+    for page_size in args.page_sizes:
+        data = get_page(page_size)
+        for name, renderer, decode in FORMATS:
+            content = renderer.render(data)
+            assert decode(content) == data
+
+            render_time = run(renderer.render, data, args.iterations)
+            decode_time = run(decode, content, args.iterations)
+            print(
+                f"{page_size:<11}{name:<9}{len(content):>9}"
+                f"{len(gzip.compress(content)):>9}"
+                f"{render_time:>11.1f}{decode_time:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=[10, 50, 100, 500]
+    )
+    args = parser.parse_args()
+
+    main(args)
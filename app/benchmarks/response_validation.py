@@ -0,0 +1,72 @@
+"""
+Measure the cost of validating dict responses against their serializers
+
+Usage:
+    python -m benchmarks.response_validation --iterations 20000
+
+Responses of the token refresh, thread delete and bulk message read
+endpoints are built in-process with different
+RESPONSE_VALIDATION_SAMPLE_RATE values, no database is needed
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import override_settings  # noqa: E402
+
+from auth_.v1.views.refresh import AuthV1RefreshView  # noqa: E402
+from chat.v1.views import ChatV1ThreadDeleteView  # noqa: E402
+from chat.v1.views.message_read_many import (  # noqa: E402
+    ChatV1MessageReadManyView,
+)
+
+RESPONSES = [
+    ("refresh", AuthV1RefreshView, {"access": "x" * 220}),
+    ("thread delete", ChatV1ThreadDeleteView, {"detail": "Deleted"}),
+    (
+        "read many (500)",
+        ChatV1MessageReadManyView,
+        {"message_ids": list(range(1, 501))},
+    ),
+]
+
+
+def run(view, data: dict, iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        view._get_response(data)
+
+    return iterations / (time.perf_counter() - started_at)
+
+
+def main(args) -> None:
+    print(f"{'response':<18}" + "".join(f"{r:>12}" for r in args.rates))
+    for name, view_class, data in RESPONSES:
+        view = view_class()
+        results = []
+        for rate in args.rates:
+            with override_settings(
+                RESPONSE_VALIDATION_SAMPLE_RATE=rate,
+                RESPONSE_VALIDATION_STRICT=False,
+            ):
+                results.append(run(view, data, args.iterations))
+
+        print(f"{name:<18}" + "".join(f"{r:>10.0f}/s" for r in results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument(
+        "--rates", type=float, nargs="+", default=[1.0, 0.1, 0.01, 0.0]
+    )
+    args = parser.parse_args()
+
+    main(args)
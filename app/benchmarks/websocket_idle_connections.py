@@ -0,0 +1,81 @@
+"""
+Open idle connections to the events endpoint and keep them open
+
+Usage:
+    python benchmarks/websocket_idle_connections.py \\
+        --url ws://127.0.0.1:8000/chat/v1/events/ \\
+        --token <access token> --connections 10000 --idle 60
+
+Every connection is a separate WebSocket client of the same user,
+the server process is expected to keep all of them open while idle
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+
+from websockets.asyncio.client import connect
+
+
+async def open_connection(
+    url: str,
+    handshakes: asyncio.Semaphore,
+    release: asyncio.Event,
+    opened: list,
+    failed: list,
+) -> None:
+    try:
+        # Connections are ramped up, handshakes authenticate against the DB
+        async with handshakes:
+            ws = await connect(url, open_timeout=60, ping_interval=None)
+        opened.append(ws)
+        async with ws:
+            await release.wait()
+    except Exception as e:
+        failed.append(e)
+
+
+async def main(args) -> None:
+    url = f"{args.url}?token={args.token}"
+    handshakes = asyncio.Semaphore(args.handshakes)
+    release = asyncio.Event()
+    opened, failed = [], []
+
+    started_at = time.monotonic()
+    tasks = [
+        asyncio.create_task(
+            open_connection(url, handshakes, release, opened, failed)
+        )
+        for _ in range(args.connections)
+    ]
+
+    while len(opened) + len(failed) < args.connections:
+        await asyncio.sleep(0.5)
+    opened_in = time.monotonic() - started_at
+
+    print(f"opened: {len(opened)} in {opened_in:.1f}s, failed: {len(failed)}")
+    if failed:
+        print(f"first failure: {failed[0]!r}")
+
+    await asyncio.sleep(args.idle)
+    still_open = sum(1 for ws in opened if ws.close_code is None)
+    print(f"still open after {args.idle:.0f}s idle: {still_open}")
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="ws://127.0.0.1:8000/chat/v1/events/")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--handshakes", type=int, default=100)
+    parser.add_argument("--idle", type=float, default=60)
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    asyncio.run(main(args))
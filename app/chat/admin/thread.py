@@ -1,21 +1,53 @@
 from django.contrib.admin import ModelAdmin, register, TabularInline
+from django.db.models import F
 
 from chat.models import Thread, ThreadUser
+from chat.v1.services.thread_list_cache import ChatV1ThreadListCacheService
 
 
 class ThreadUserInline(TabularInline):
     model = ThreadUser
     extra = 0
     autocomplete_fields = ["user"]
+    readonly_fields = ["unread_count", "last_read_message_id"]
 
 
 @register(Thread)
 class ThreadAdmin(ModelAdmin):
-    list_display = ["id", "updated_at", "created_at"]
+    list_display = ["id", "last_message_sent_at", "updated_at", "created_at"]
     search_fields = ["participants__username"]
     autocomplete_fields = [
         "participants",
     ]
+    readonly_fields = [
+        "participants_key",
+        "last_message",
+        "last_message_sent_at",
+    ]
     ordering = ["-created_at"]
 
     inlines = [ThreadUserInline]
+
+    def save_related(self, request, form, formsets, change):
+        thread = form.instance
+        previous_ids = set(thread.participants.values_list("id", flat=True))
+
+        super().save_related(request, form, formsets, change)
+
+        participant_ids = set(thread.participants.values_list("id", flat=True))
+        participants_key = Thread.get_participants_key(participant_ids)
+        is_taken = (
+            Thread.objects.filter(participants_key=participants_key)
+            .exclude(id=thread.id)
+            .exists()
+        )
+        # Threads duplicating participants of another one are not keyed,
+        # the version invalidates thread lists of other participants
+        Thread.objects.filter(id=thread.id).update(
+            participants_key=None if is_taken else participants_key,
+            version=F("version") + 1,
+        )
+        # Removed participants have the thread in their cached lists too
+        ChatV1ThreadListCacheService().invalidate(
+            previous_ids | participant_ids
+        )
@@ -0,0 +1,58 @@
+from datetime import date, datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from chat.v1.services import ChatV1MessagePartitionService
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert the message table to monthly partitions, pre-create"
+        " partitions and detach old ones"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert the message table to a partitioned table (once)",
+        )
+        parser.add_argument("--months-ahead", type=int, default=3)
+        parser.add_argument(
+            "--detach-before",
+            type=date.fromisoformat,
+            help="Detach partitions ending on or before the date",
+        )
+
+    def handle(
+        self,
+        *args,
+        convert: bool,
+        months_ahead: int,
+        detach_before: date | None,
+        **options,
+    ):
+        service = ChatV1MessagePartitionService()
+
+        if convert:
+            converted = service.convert(months_ahead=months_ahead)
+            self.stdout.write(
+                f"Converted the message table: {', '.join(converted)}"
+            )
+        elif not service.is_partitioned():
+            raise CommandError(
+                "The message table is not partitioned, run with --convert"
+            )
+
+        created = service.create_partitions(months=months_ahead)
+        self.stdout.write(f"Created {len(created)} partitions")
+
+        if detach_before is not None:
+            detached = service.detach_partitions(
+                before=datetime.combine(
+                    detach_before, datetime.min.time(), tzinfo=timezone.utc
+                )
+            )
+            self.stdout.write(
+                f"Detached {len(detached)} partitions: {', '.join(detached)}"
+            )
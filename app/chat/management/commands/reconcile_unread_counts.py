@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from chat.models import Thread
+from chat.v1.services import ChatV1ThreadService
+
+
+class Command(BaseCommand):
+    help = "Recompute unread message counters of thread participants"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, batch_size: int, **options):
+        service = ChatV1ThreadService()
+        thread_ids = Thread.objects.order_by("id").values_list("id", flat=True)
+
+        total = 0
+        batch = []
+        for thread_id in thread_ids.iterator(chunk_size=batch_size):
+            batch.append(thread_id)
+            if len(batch) >= batch_size:
+                total += service.reconcile_unread_counts(thread_ids=batch)
+                batch = []
+
+        if batch:
+            total += service.reconcile_unread_counts(thread_ids=batch)
+
+        self.stdout.write(f"Reconciled unread counts of {total} participants")
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0004_thread_last_message_thread_last_message_sent_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="threaduser",
+            name="unread_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
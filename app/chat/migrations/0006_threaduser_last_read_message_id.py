@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0005_threaduser_unread_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="threaduser",
+            name="last_read_message_id",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
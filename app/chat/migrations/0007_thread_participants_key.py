@@ -0,0 +1,25 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0006_threaduser_last_read_message_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="thread",
+            name="participants_key",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                null=True,
+                unique=True,
+                verbose_name="Participants key",
+            ),
+        ),
+    ]
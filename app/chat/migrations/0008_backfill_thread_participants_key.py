@@ -0,0 +1,50 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:14
+
+from hashlib import sha256
+
+from django.db import migrations
+
+
+def get_participants_key(participant_ids) -> str:
+    ids = sorted(set(participant_ids))
+    return sha256(",".join(map(str, ids)).encode()).hexdigest()
+
+
+def backfill_participants_key(apps, schema_editor):
+    Thread = apps.get_model("chat", "Thread")
+    ThreadUser = apps.get_model("chat", "ThreadUser")
+
+    participant_ids = {}
+    for thread_id, user_id in (
+        ThreadUser.objects.order_by("thread_id")
+        .values_list("thread_id", "user_id")
+        .iterator(chunk_size=10000)
+    ):
+        participant_ids.setdefault(thread_id, []).append(user_id)
+
+    # Duplicated threads of the same participants keep an empty key,
+    # the oldest one is used for upsert
+    keys = set()
+    threads = []
+    for thread_id, user_ids in sorted(participant_ids.items()):
+        key = get_participants_key(user_ids)
+        if key in keys:
+            continue
+
+        keys.add(key)
+        threads.append(Thread(id=thread_id, participants_key=key))
+
+    Thread.objects.bulk_update(threads, ["participants_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0007_thread_participants_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_participants_key, migrations.RunPython.noop
+        ),
+    ]
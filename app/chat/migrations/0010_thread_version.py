@@ -0,0 +1,20 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0009_message_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="thread",
+            name="version",
+            field=models.PositiveBigIntegerField(
+                default=0, editable=False, verbose_name="Version"
+            ),
+        ),
+    ]
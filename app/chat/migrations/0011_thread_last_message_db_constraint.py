@@ -0,0 +1,32 @@
+# Generated by Django 5.1.5 on 2026-10-18 13:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0010_thread_version"),
+    ]
+
+    # The constraint is kept until the message table is partitioned,
+    # ChatV1MessagePartitionService.convert drops it
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="thread",
+                    name="last_message",
+                    field=models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="chat.message",
+                    ),
+                ),
+            ],
+        ),
+    ]
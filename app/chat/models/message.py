@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db.models import (
     Model,
     BooleanField,
@@ -7,9 +8,20 @@ from django.db.models import (
     ForeignKey,
     CASCADE,
     DateTimeField,
+    Index,
+    GeneratedField,
+    Manager,
 )
 from django.utils.timezone import now
 
+SEARCH_CONFIG = "english"
+
+
+class MessageManager(Manager):
+    def get_queryset(self):
+        # Search vectors are only used in WHERE and ORDER BY clauses
+        return super().get_queryset().defer("search_vector")
+
 
 class Message(Model):
     class Meta:
@@ -19,10 +31,23 @@ class Message(Model):
                 name="text_trgm_idx",
                 opclasses=["gin_trgm_ops"],
             ),
+            Index(
+                fields=["thread", "created_at", "id"],
+                name="thread_created_at_id_idx",
+            ),
+            GinIndex(
+                fields=["search_vector"],
+                name="message_search_vector_idx",
+            ),
         ]
 
     is_read = BooleanField(default=False)
     text = TextField()
+    search_vector = GeneratedField(
+        expression=SearchVector("text", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     sender = ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=CASCADE,
@@ -33,3 +58,5 @@ class Message(Model):
     created_at = DateTimeField(
         default=now, verbose_name="Created at", db_index=True
     )
+
+    objects = MessageManager()
@@ -1,3 +1,5 @@
+from hashlib import sha256
+
 from django.conf import settings
 from django.db.models import (
     Model,
@@ -6,6 +8,11 @@ from django.db.models import (
     CASCADE,
     ManyToManyField,
     UniqueConstraint,
+    SET_NULL,
+    PositiveIntegerField,
+    PositiveBigIntegerField,
+    BigIntegerField,
+    CharField,
 )
 from django.utils.timezone import now
 
@@ -23,6 +30,9 @@ class ThreadUser(Model):
     )
     thread = ForeignKey("chat.Thread", on_delete=CASCADE, db_index=True)
 
+    unread_count = PositiveIntegerField(default=0)
+    last_read_message_id = BigIntegerField(null=True, blank=True)
+
 
 class Thread(Model):
     participants = ManyToManyField(
@@ -30,6 +40,37 @@ class Thread(Model):
         through="chat.ThreadUser",
         related_name="user_threads",
     )
+    # Digest of sorted participant IDs, identifies a thread by participants
+    participants_key = CharField(
+        max_length=64,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Participants key",
+    )
+
+    # No database constraint, a partitioned message table
+    # can't have a unique index on `id` alone
+    last_message = ForeignKey(
+        "chat.Message",
+        on_delete=SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_constraint=False,
+    )
+    last_message_sent_at = DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Last message sent at",
+        db_index=True,
+    )
+
+    # Incremented on every change of messages, validates cached lists
+    version = PositiveBigIntegerField(
+        default=0, editable=False, verbose_name="Version"
+    )
 
     updated_at = DateTimeField(
         default=now, verbose_name="Updated at", db_index=True
@@ -37,3 +78,10 @@ class Thread(Model):
     created_at = DateTimeField(
         default=now, verbose_name="Created at", db_index=True
     )
+
+    @staticmethod
+    def get_participants_key(participant_ids) -> str:
+        ids = sorted(
+            {int(participant_id) for participant_id in participant_ids}
+        )
+        return sha256(",".join(map(str, ids)).encode()).hexdigest()
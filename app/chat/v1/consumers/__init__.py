@@ -0,0 +1,3 @@
+from .events import ChatV1EventsConsumer
+
+__all__ = ["ChatV1EventsConsumer"]
@@ -0,0 +1,51 @@
+import asyncio
+
+from common.base.consumers import BaseWebSocketConsumer
+from common.events import (
+    event_hub,
+    get_event_broker,
+    EventSubscriptionOverflow,
+)
+
+
+class ChatV1EventsConsumer(BaseWebSocketConsumer):
+    """
+    Push chat events of the user's threads
+
+    Events: `message.created`, `message.read`
+    The connection is closed with 1013 if the client falls behind,
+    the client is expected to reconnect and refetch its threads
+
+    Authentication is required
+    """
+
+    name = "chat-v1-events"
+
+    overflow_close_code = 1013
+
+    async def handle(self) -> None:
+        get_event_broker().listen()
+        subscription = event_hub.subscribe(self.user.id)
+        disconnect_task = asyncio.create_task(self.receive_until_disconnect())
+        try:
+            while True:
+                event_task = asyncio.create_task(subscription.get())
+                await asyncio.wait(
+                    {disconnect_task, event_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if disconnect_task.done():
+                    event_task.cancel()
+                    return
+
+                try:
+                    event = event_task.result()
+                except EventSubscriptionOverflow:
+                    self._logger.warn(f"Events overflowed for {self.user}")
+                    await self.close(self.overflow_close_code)
+                    return
+
+                await self.send_json(event)
+        finally:
+            event_hub.unsubscribe(subscription)
+            disconnect_task.cancel()
@@ -6,28 +6,70 @@ from .message_list import (
     ChatV1MessageListRequestSerializer,
     ChatV1MessageListResponseSerializer,
     ChatV1MessageListPaginatedResponseSerializer,
+    ChatV1MessageListValuesSerializer,
 )
 from .message_read import (
     ChatV1MessageSenderReadResponseSerializer,
     ChatV1MessageReadResponseSerializer,
 )
+from .message_read_many import (
+    ChatV1MessageReadManyRequestSerializer,
+    ChatV1MessageReadManyResponseSerializer,
+)
+from .message_search import (
+    ChatV1MessageSearchRequestSerializer,
+    ChatV1MessageSearchResponseSerializer,
+    ChatV1MessageSearchPaginatedResponseSerializer,
+    ChatV1MessageThreadSearchRequestSerializer,
+    ChatV1MessageThreadSearchResponseSerializer,
+    ChatV1MessageThreadSearchListResponseSerializer,
+)
+from .message_wait import (
+    ChatV1MessageWaitRequestSerializer,
+    ChatV1MessageWaitResponseSerializer,
+)
+from .thread_bulk_upsert import (
+    ChatV1ThreadBulkUpsertRequestSerializer,
+    ChatV1ThreadBulkUpsertResponseSerializer,
+)
 from .thread_list import (
     ChatV1ThreadListRequestSerializer,
     ChatV1ThreadListResponseSerializer,
     ChatV1ThreadListPaginatedResponseSerializer,
+    ChatV1ThreadListValuesSerializer,
+)
+from .thread_read import (
+    ChatV1ThreadReadRequestSerializer,
+    ChatV1ThreadReadResponseSerializer,
 )
 from .thread_upsert import ChatV1ThreadUpsertResponseSerializer
 
 __all__ = [
     "ChatV1ThreadUpsertResponseSerializer",
+    "ChatV1ThreadBulkUpsertRequestSerializer",
+    "ChatV1ThreadBulkUpsertResponseSerializer",
     "ChatV1ThreadListRequestSerializer",
     "ChatV1ThreadListResponseSerializer",
     "ChatV1ThreadListPaginatedResponseSerializer",
+    "ChatV1ThreadListValuesSerializer",
+    "ChatV1ThreadReadRequestSerializer",
+    "ChatV1ThreadReadResponseSerializer",
     "ChatV1MessageSenderCreateResponseSerializer",
     "ChatV1MessageCreateResponseSerializer",
     "ChatV1MessageSenderReadResponseSerializer",
     "ChatV1MessageReadResponseSerializer",
+    "ChatV1MessageReadManyRequestSerializer",
+    "ChatV1MessageReadManyResponseSerializer",
     "ChatV1MessageListRequestSerializer",
     "ChatV1MessageListResponseSerializer",
     "ChatV1MessageListPaginatedResponseSerializer",
+    "ChatV1MessageListValuesSerializer",
+    "ChatV1MessageSearchRequestSerializer",
+    "ChatV1MessageSearchResponseSerializer",
+    "ChatV1MessageSearchPaginatedResponseSerializer",
+    "ChatV1MessageThreadSearchRequestSerializer",
+    "ChatV1MessageThreadSearchResponseSerializer",
+    "ChatV1MessageThreadSearchListResponseSerializer",
+    "ChatV1MessageWaitRequestSerializer",
+    "ChatV1MessageWaitResponseSerializer",
 ]
@@ -4,24 +4,41 @@ from rest_framework.serializers import (
     IntegerField,
     ModelSerializer,
     CharField,
+    DateTimeField,
 )
 
 from chat.models import Message
 from chat.v1.services import ChatV1MessageListService
 from common.base.serializers import (
-    BasePaginatedRequestSerializer,
-    BasePaginatedResponseSerializer,
+    BaseCursorPaginatedRequestSerializer,
+    BaseCursorPaginatedResponseSerializer,
+    BaseValuesSerializer,
+    CommaSeparatedListField,
 )
 
+RESPONSE_FIELDS = ["id", "text", "sender", "is_read", "created_at"]
 
-class ChatV1MessageListRequestSerializer(BasePaginatedRequestSerializer):
+
+class ChatV1MessageListRequestSerializer(BaseCursorPaginatedRequestSerializer):
     text = CharField(max_length=512, required=False)
     sender_id = IntegerField(min_value=1, required=False)
+    created_after = DateTimeField(required=False)
+    created_before = DateTimeField(required=False)
 
     ordering = ChoiceField(
         choices=ChatV1MessageListService.Orderings, required=False
     )
 
+    # Sparse fieldsets, unused fields are not queried
+    fields = CommaSeparatedListField(
+        child=ChoiceField(choices=RESPONSE_FIELDS),
+        allow_empty=False,
+        required=False,
+    )
+    exclude = CommaSeparatedListField(
+        child=ChoiceField(choices=RESPONSE_FIELDS), required=False
+    )
+
 
 class ChatV1MessageListSenderResponseSerializer(ModelSerializer):
     class Meta:
@@ -34,10 +51,35 @@ class ChatV1MessageListResponseSerializer(ModelSerializer):
 
     class Meta:
         model = Message
-        fields = ["id", "text", "sender", "is_read", "created_at"]
+        fields = RESPONSE_FIELDS
+
+
+class ChatV1MessageListValuesSerializer(BaseValuesSerializer):
+    fields = {
+        "id": ["id"],
+        "text": ["text"],
+        "sender": ["sender_id", "sender__username"],
+        "is_read": ["is_read"],
+        "created_at": ["created_at"],
+    }
+
+    def get_id(self, row: dict) -> int:
+        return row["id"]
+
+    def get_text(self, row: dict) -> str:
+        return row["text"]
+
+    def get_sender(self, row: dict) -> dict:
+        return {"id": row["sender_id"], "username": row["sender__username"]}
+
+    def get_is_read(self, row: dict) -> bool:
+        return row["is_read"]
+
+    def get_created_at(self, row: dict) -> str | None:
+        return self.to_datetime(row["created_at"])
 
 
 class ChatV1MessageListPaginatedResponseSerializer(
-    BasePaginatedResponseSerializer
+    BaseCursorPaginatedResponseSerializer
 ):
     results = ChatV1MessageListResponseSerializer(many=True)
@@ -0,0 +1,11 @@
+from rest_framework.serializers import IntegerField, ListField, Serializer
+
+
+class ChatV1MessageReadManyRequestSerializer(Serializer):
+    message_ids = ListField(
+        child=IntegerField(min_value=1), min_length=1, max_length=500
+    )
+
+
+class ChatV1MessageReadManyResponseSerializer(Serializer):
+    message_ids = ListField(child=IntegerField(min_value=1))
@@ -0,0 +1,89 @@
+from django.contrib.auth import get_user_model
+from rest_framework.serializers import (
+    CharField,
+    FloatField,
+    IntegerField,
+    ModelSerializer,
+    Serializer,
+)
+
+from chat.models import Message, Thread
+from common.base.serializers import BaseCursorPaginatedResponseSerializer
+
+
+class ChatV1MessageThreadSearchRequestSerializer(Serializer):
+    query = CharField(min_length=3, max_length=512)
+    page_size = IntegerField(
+        default=10, min_value=1, max_value=50, required=False
+    )
+    hits_per_thread = IntegerField(
+        default=3, min_value=1, max_value=10, required=False
+    )
+
+
+class ChatV1MessageSearchRequestSerializer(Serializer):
+    query = CharField(max_length=512)
+    page_size = IntegerField(
+        default=10, min_value=1, max_value=100, required=False
+    )
+    cursor = CharField(max_length=512, required=False)
+
+
+class ChatV1MessageSearchSenderResponseSerializer(ModelSerializer):
+    class Meta:
+        model = get_user_model()
+        fields = ["id", "username"]
+
+
+class ChatV1MessageSearchResponseSerializer(ModelSerializer):
+    sender = ChatV1MessageSearchSenderResponseSerializer()
+    headline = CharField()
+    rank = FloatField()
+
+    class Meta:
+        model = Message
+        fields = [
+            "id",
+            "text",
+            "headline",
+            "rank",
+            "sender",
+            "is_read",
+            "created_at",
+        ]
+
+
+class ChatV1MessageSearchPaginatedResponseSerializer(
+    BaseCursorPaginatedResponseSerializer
+):
+    results = ChatV1MessageSearchResponseSerializer(many=True)
+
+
+class ChatV1MessageThreadSearchHitResponseSerializer(ModelSerializer):
+    sender = ChatV1MessageSearchSenderResponseSerializer()
+    similarity = FloatField()
+
+    class Meta:
+        model = Message
+        fields = [
+            "id",
+            "text",
+            "similarity",
+            "sender",
+            "is_read",
+            "created_at",
+        ]
+
+
+class ChatV1MessageThreadSearchResponseSerializer(ModelSerializer):
+    participants = ChatV1MessageSearchSenderResponseSerializer(many=True)
+    similarity = FloatField()
+    hits = ChatV1MessageThreadSearchHitResponseSerializer(many=True)
+
+    class Meta:
+        model = Thread
+        fields = ["id", "participants", "similarity", "hits"]
+
+
+class ChatV1MessageThreadSearchListResponseSerializer(Serializer):
+    results = ChatV1MessageThreadSearchResponseSerializer(many=True)
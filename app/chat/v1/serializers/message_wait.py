@@ -0,0 +1,20 @@
+from rest_framework.serializers import CharField, IntegerField, Serializer
+
+from chat.v1.serializers.message_list import (
+    ChatV1MessageListResponseSerializer,
+)
+
+
+class ChatV1MessageWaitRequestSerializer(Serializer):
+    after = CharField(max_length=512, required=False)
+    timeout = IntegerField(
+        default=25, min_value=0, max_value=60, required=False
+    )
+    page_size = IntegerField(
+        default=100, min_value=1, max_value=100, required=False
+    )
+
+
+class ChatV1MessageWaitResponseSerializer(Serializer):
+    results = ChatV1MessageListResponseSerializer(many=True)
+    cursor = CharField(allow_null=True)
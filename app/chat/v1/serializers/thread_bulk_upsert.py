@@ -0,0 +1,15 @@
+from rest_framework.serializers import IntegerField, ListField, Serializer
+
+from chat.v1.serializers.thread_upsert import (
+    ChatV1ThreadUpsertResponseSerializer,
+)
+
+
+class ChatV1ThreadBulkUpsertRequestSerializer(Serializer):
+    participant_ids = ListField(
+        child=IntegerField(min_value=1), min_length=1, max_length=200
+    )
+
+
+class ChatV1ThreadBulkUpsertResponseSerializer(Serializer):
+    results = ChatV1ThreadUpsertResponseSerializer(many=True)
@@ -8,13 +8,16 @@ from rest_framework.serializers import (
 from chat.models import Thread
 from chat.v1.services import ChatV1ThreadListService
 from common.base.serializers import (
-    BasePaginatedRequestSerializer,
-    BasePaginatedResponseSerializer,
+    BaseCursorPaginatedRequestSerializer,
+    BaseCursorPaginatedResponseSerializer,
+    BaseValuesSerializer,
     CommaSeparatedListField,
 )
 
+RESPONSE_FIELDS = ["id", "participants", "unread_count"]
 
-class ChatV1ThreadListRequestSerializer(BasePaginatedRequestSerializer):
+
+class ChatV1ThreadListRequestSerializer(BaseCursorPaginatedRequestSerializer):
     participant_ids = CommaSeparatedListField(
         child=IntegerField(min_value=1), max_length=100, required=False
     )
@@ -23,6 +26,16 @@ class ChatV1ThreadListRequestSerializer(BasePaginatedRequestSerializer):
         choices=ChatV1ThreadListService.Orderings, required=False
     )
 
+    # Sparse fieldsets, unused fields are not queried
+    fields = CommaSeparatedListField(
+        child=ChoiceField(choices=RESPONSE_FIELDS),
+        allow_empty=False,
+        required=False,
+    )
+    exclude = CommaSeparatedListField(
+        child=ChoiceField(choices=RESPONSE_FIELDS), required=False
+    )
+
 
 class ChatV1ThreadListParticipantResponseSerializer(ModelSerializer):
     class Meta:
@@ -32,14 +45,36 @@ class ChatV1ThreadListParticipantResponseSerializer(ModelSerializer):
 
 class ChatV1ThreadListResponseSerializer(ModelSerializer):
     participants = ChatV1ThreadListParticipantResponseSerializer(many=True)
+    unread_count = IntegerField(min_value=0)
 
     class Meta:
         model = Thread
-        fields = ["id", "participants"]
+        fields = RESPONSE_FIELDS
+
+
+class ChatV1ThreadListValuesSerializer(BaseValuesSerializer):
+    # Participants are fetched by the service with a separate query
+    fields = {
+        "id": ["id"],
+        "participants": ["participants"],
+        "unread_count": ["unread_count"],
+    }
+
+    def get_id(self, row: dict) -> int:
+        return row["id"]
+
+    def get_participants(self, row: dict) -> list[dict]:
+        return [
+            {"id": participant["id"], "username": participant["username"]}
+            for participant in row["participants"]
+        ]
+
+    def get_unread_count(self, row: dict) -> int:
+        return row["unread_count"]
 
 
 class ChatV1ThreadListPaginatedResponseSerializer(
-    BasePaginatedResponseSerializer
+    BaseCursorPaginatedResponseSerializer
 ):
     results = ChatV1ThreadListResponseSerializer(many=True)
     total_unread = IntegerField()
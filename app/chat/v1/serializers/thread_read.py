@@ -0,0 +1,17 @@
+from rest_framework.serializers import (
+    IntegerField,
+    ModelSerializer,
+    Serializer,
+)
+
+from chat.models import ThreadUser
+
+
+class ChatV1ThreadReadRequestSerializer(Serializer):
+    message_id = IntegerField(min_value=1, required=False)
+
+
+class ChatV1ThreadReadResponseSerializer(ModelSerializer):
+    class Meta:
+        model = ThreadUser
+        fields = ["thread", "last_read_message_id", "unread_count"]
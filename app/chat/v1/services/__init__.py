@@ -2,10 +2,16 @@ from .thread import ChatV1ThreadService
 from .thread_list import ChatV1ThreadListService
 from .message import ChatV1MessageService
 from .message_list import ChatV1MessageListService
+from .message_search import ChatV1MessageSearchService
+from .message_wait import ChatV1MessageWaitService
+from .message_partition import ChatV1MessagePartitionService
 
 __all__ = [
     "ChatV1ThreadService",
     "ChatV1ThreadListService",
     "ChatV1MessageService",
     "ChatV1MessageListService",
+    "ChatV1MessageSearchService",
+    "ChatV1MessageWaitService",
+    "ChatV1MessagePartitionService",
 ]
@@ -0,0 +1,84 @@
+from functools import partial
+
+from django.db.models import TextChoices
+from django.db.transaction import on_commit
+from rest_framework.fields import DateTimeField
+
+from chat.models import Message, ThreadUser
+from common.base.services import BaseService
+from common.events import get_event_broker
+
+
+class ChatV1EventService(BaseService):
+    class Types(TextChoices):
+        MESSAGE_CREATED = "message.created"
+        MESSAGE_READ = "message.read"
+
+    def _get_name(self):
+        return "chat-v1-event-service"
+
+    def _get_participant_ids(self, thread_ids: set[int]) -> dict:
+        participant_ids = {}
+        for thread_id, user_id in ThreadUser.objects.filter(
+            thread_id__in=thread_ids
+        ).values_list("thread_id", "user_id"):
+            participant_ids.setdefault(thread_id, set()).add(user_id)
+
+        return participant_ids
+
+    def _dispatch(self, events: list[dict]) -> None:
+        # Runs after the commit, the change itself has succeeded
+        try:
+            participant_ids = self._get_participant_ids(
+                {event["thread_id"] for event in events}
+            )
+            get_event_broker().publish(
+                [
+                    (participant_ids.get(event["thread_id"], set()), event)
+                    for event in events
+                ]
+            )
+        except Exception as e:
+            self._logger.warn(f"Failed to publish {len(events)} events: {e}")
+
+    def publish(self, events: list[dict]) -> None:
+        # Participants only learn about committed changes
+        if events:
+            on_commit(partial(self._dispatch, events))
+
+    def publish_message_created(self, message: Message) -> None:
+        self.publish(
+            [
+                {
+                    "type": self.Types.MESSAGE_CREATED,
+                    "thread_id": message.thread_id,
+                    "message": {
+                        "id": message.id,
+                        "text": message.text,
+                        "sender": {
+                            "id": message.sender.id,
+                            "username": message.sender.username,
+                        },
+                        "is_read": message.is_read,
+                        "created_at": DateTimeField().to_representation(
+                            message.created_at
+                        ),
+                    },
+                }
+            ]
+        )
+
+    def publish_messages_read(
+        self, user, message_ids_by_thread: dict[int, list[int]]
+    ) -> None:
+        self.publish(
+            [
+                {
+                    "type": self.Types.MESSAGE_READ,
+                    "thread_id": thread_id,
+                    "message_ids": message_ids,
+                    "reader_id": user.id,
+                }
+                for thread_id, message_ids in message_ids_by_thread.items()
+            ]
+        )
@@ -1,12 +1,58 @@
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.db.models import BigIntegerField, Case, F, Q, Value, When
 from django.db.transaction import atomic
-from django.utils.timezone import now
 from rest_framework.exceptions import NotFound
 
-from chat.models import Message, Thread
+from chat.models import Message, Thread, ThreadUser
+from chat.v1.services.event import ChatV1EventService
+from chat.v1.services.thread_list_cache import ChatV1ThreadListCacheService
 from common.base.services import BaseService
 
+READ_MANY_SQL = f"""
+WITH read_messages AS (
+    UPDATE {Message._meta.db_table} AS message
+    SET is_read = TRUE
+    WHERE message.id = ANY(%(message_ids)s)
+        AND message.is_read = FALSE
+        AND message.sender_id <> %(user_id)s
+        AND EXISTS (
+            SELECT 1 FROM {ThreadUser._meta.db_table} AS participant
+            WHERE participant.thread_id = message.thread_id
+                AND participant.user_id = %(user_id)s
+        )
+    RETURNING message.id, message.thread_id, message.sender_id
+), read_counts AS (
+    SELECT thread_user.id, COUNT(*) AS count
+    FROM read_messages
+    JOIN {ThreadUser._meta.db_table} AS thread_user
+        ON thread_user.thread_id = read_messages.thread_id
+        AND thread_user.user_id <> read_messages.sender_id
+        AND read_messages.id > COALESCE(thread_user.last_read_message_id, 0)
+    GROUP BY thread_user.id
+), updated_counts AS (
+    UPDATE {ThreadUser._meta.db_table} AS thread_user
+    SET unread_count = GREATEST(
+        thread_user.unread_count - read_counts.count, 0
+    )
+    FROM read_counts
+    WHERE thread_user.id = read_counts.id
+), updated_threads AS (
+    UPDATE {Thread._meta.db_table} AS thread
+    SET version = thread.version + 1
+    WHERE thread.id IN (SELECT thread_id FROM read_messages)
+)
+SELECT id, thread_id FROM read_messages ORDER BY id
+"""
+
 
 class ChatV1MessageService(BaseService):
+    def __init__(self):
+        super().__init__()
+
+        self._event_service = ChatV1EventService()
+        self._thread_list_cache_service = ChatV1ThreadListCacheService()
+
     def _get_name(self):
         return "chat-v1-message-service"
 
@@ -20,11 +66,42 @@ class ChatV1MessageService(BaseService):
             raise NotFound()
 
         message = Message.objects.create(thread=thread, sender=user, text=text)
-        thread.updated_at = now()
+        is_last = Q(last_message_sent_at__isnull=True) | Q(
+            last_message_sent_at__lte=message.created_at
+        )
+        Thread.objects.filter(id=thread.id).update(
+            last_message=Case(
+                When(is_last, then=Value(message.id)),
+                default=F("last_message"),
+                output_field=BigIntegerField(),
+            ),
+            last_message_sent_at=Case(
+                When(is_last, then=Value(message.created_at)),
+                default=F("last_message_sent_at"),
+            ),
+            updated_at=Case(
+                When(is_last, then=Value(message.created_at)),
+                default=F("updated_at"),
+            ),
+            version=F("version") + 1,
+        )
+        ThreadUser.objects.filter(
+            Q(last_read_message_id__isnull=True)
+            | Q(last_read_message_id__lt=message.id),
+            thread_id=thread.id,
+        ).exclude(user_id=user.id).update(unread_count=F("unread_count") + 1)
+        self._event_service.publish_message_created(message)
+        self._thread_list_cache_service.invalidate_threads([thread.id])
 
         self._logger.info(f"Created message {message} for {user}")
         return message
 
+    async def acreate(self, user, thread_id: int, text: str) -> Message:
+        # Async ORM queries can't share a transaction,
+        # the atomic block is run in a single worker thread call
+        return await sync_to_async(self.create)(user, thread_id, text)
+
+    @atomic
     def read(self, user, message_id: int) -> Message:
         message = (
             Message.objects.filter(
@@ -41,7 +118,52 @@ class ChatV1MessageService(BaseService):
             )
             raise NotFound()
 
+        updated = Message.objects.filter(id=message.id, is_read=False).update(
+            is_read=True
+        )
+        if not updated:
+            self._logger.warn(
+                f"Failed to read a message {message} for {user}: already read"
+            )
+            raise NotFound()
+
         message.is_read = True
-        message.save()
+        Thread.objects.filter(id=message.thread_id).update(
+            version=F("version") + 1
+        )
+        ThreadUser.objects.filter(
+            Q(last_read_message_id__isnull=True)
+            | Q(last_read_message_id__lt=message.id),
+            thread_id=message.thread_id,
+            unread_count__gt=0,
+        ).exclude(user_id=message.sender_id).update(
+            unread_count=F("unread_count") - 1
+        )
+        self._event_service.publish_messages_read(
+            user, {message.thread_id: [message.id]}
+        )
+        self._thread_list_cache_service.invalidate_threads([message.thread_id])
 
         return message
+
+    def read_many(self, user, message_ids: list[int]) -> list[int]:
+        # Single statement: messages and unread counters are updated together
+        with connection.cursor() as cursor:
+            cursor.execute(
+                READ_MANY_SQL,
+                {"message_ids": list(message_ids), "user_id": user.id},
+            )
+            rows = cursor.fetchall()
+
+        message_ids_by_thread = {}
+        for message_id, thread_id in rows:
+            message_ids_by_thread.setdefault(thread_id, []).append(message_id)
+        self._event_service.publish_messages_read(user, message_ids_by_thread)
+        if message_ids_by_thread:
+            self._thread_list_cache_service.invalidate_threads(
+                list(message_ids_by_thread)
+            )
+
+        read_ids = [message_id for message_id, _ in rows]
+        self._logger.info(f"Read {len(read_ids)} messages for {user}")
+        return read_ids
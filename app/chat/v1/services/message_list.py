@@ -1,7 +1,12 @@
+from datetime import datetime
+
 from django.db.models import TextChoices, QuerySet
 
-from chat.models import Message
+from chat.models import Message, Thread
 from common.base.services import BaseService
+from common.pagination import PaginationModes, CountModes
+from common.pagination.count import PaginationCountService
+from common.pagination.cursor_pagination import CursorPaginationService
 from common.pagination.offset_pagination import OffsetPaginationService
 
 
@@ -10,6 +15,8 @@ class ChatV1MessageListService(BaseService):
         super().__init__()
 
         self._offset_pagination_service = OffsetPaginationService()
+        self._cursor_pagination_service = CursorPaginationService()
+        self._count_service = PaginationCountService()
 
     class Orderings(TextChoices):
         CREATED_AT_ASC = "created_at"
@@ -22,7 +29,12 @@ class ChatV1MessageListService(BaseService):
         return qs.prefetch_related("sender")
 
     def _get_filtered_qs(
-        self, qs: QuerySet[Message], text: str = None, sender_id: int = None
+        self,
+        qs: QuerySet[Message],
+        text: str = None,
+        sender_id: int = None,
+        created_after: datetime = None,
+        created_before: datetime = None,
     ) -> QuerySet[Message]:
         if text is not None:
             qs = qs.filter(text__icontains=text)
@@ -30,6 +42,13 @@ class ChatV1MessageListService(BaseService):
         if sender_id is not None:
             qs = qs.filter(sender_id=sender_id)
 
+        # Time ranges prune partitions of a partitioned message table
+        if created_after is not None:
+            qs = qs.filter(created_at__gte=created_after)
+
+        if created_before is not None:
+            qs = qs.filter(created_at__lt=created_before)
+
         return qs
 
     def _get_ordered_qs(
@@ -39,37 +58,156 @@ class ChatV1MessageListService(BaseService):
     ) -> QuerySet[Message]:
         return qs.order_by(ordering)
 
-    def list(
+    def get_version(self, thread_id: int) -> int | None:
+        return (
+            Thread.objects.filter(id=thread_id)
+            .values_list("version", flat=True)
+            .first()
+        )
+
+    async def aget_version(self, thread_id: int) -> int | None:
+        return (
+            await Thread.objects.filter(id=thread_id)
+            .values_list("version", flat=True)
+            .afirst()
+        )
+
+    def _get_values_qs(
+        self, qs: QuerySet[Message], values: list[str], ordering: Orderings
+    ) -> QuerySet:
+        # Ordering keys are kept for cursors
+        names = [*values, ordering.lstrip("-"), "id"]
+
+        return qs.prefetch_related(None).values(*dict.fromkeys(names))
+
+    def _get_list_params(
         self,
-        user,
-        thread_id: int,
         text: str = None,
         sender_id: int = None,
+        created_after: datetime = None,
+        created_before: datetime = None,
         page: int = 1,
         page_size: int = 10,
         ordering: Orderings = Orderings.CREATED_AT_DESC,
+        pagination: PaginationModes = PaginationModes.OFFSET,
+        cursor: str = None,
+        count: CountModes = CountModes.EXACT,
+        count_cap: int = 1000,
+        values: list[str] = None,
     ) -> dict:
+        return {
+            "text": text,
+            "sender_id": sender_id,
+            "created_after": created_after,
+            "created_before": created_before,
+            "page": page,
+            "page_size": page_size,
+            "ordering": ordering,
+            "pagination": pagination,
+            "cursor": cursor,
+            "count": count,
+            "count_cap": count_cap,
+            "values": values,
+        }
+
+    def _get_list_qs(self, thread_id: int, params: dict) -> QuerySet[Message]:
         qs = Message.objects.filter(thread_id=thread_id)
         prefetched_qs = self._get_prefetch_qs(qs)
         filtered_qs = self._get_filtered_qs(
             prefetched_qs,
-            text=text,
-            sender_id=sender_id,
+            text=params["text"],
+            sender_id=params["sender_id"],
+            created_after=params["created_after"],
+            created_before=params["created_before"],
         )
-        ordered_qs = self._get_ordered_qs(filtered_qs, ordering=ordering)
 
-        results = list(
-            self._offset_pagination_service.paginate(
-                iterable=ordered_qs, page=page, page_size=page_size
+        if params["values"] is not None:
+            filtered_qs = self._get_values_qs(
+                filtered_qs, params["values"], params["ordering"]
             )
-        )
-        total = ordered_qs.count()
 
-        result = {
+        if params["pagination"] == PaginationModes.CURSOR:
+            return filtered_qs
+
+        return self._get_ordered_qs(filtered_qs, ordering=params["ordering"])
+
+    def _get_cursor_page_kwargs(self, qs: QuerySet, params: dict) -> dict:
+        return {
+            "qs": qs,
+            "ordering": self._cursor_pagination_service.get_ordering(
+                params["ordering"]
+            ),
+            "cursor": params["cursor"],
+            "page_size": params["page_size"],
+        }
+
+    def _get_offset_page_kwargs(self, qs: QuerySet, params: dict) -> dict:
+        return {
+            "iterable": qs,
+            "page": params["page"],
+            "page_size": params["page_size"],
+        }
+
+    def _get_offset_result(
+        self, results: list, has_next: bool, total: int | None, params: dict
+    ) -> dict:
+        return {
             "results": results,
             "count": total,
+            "count_mode": params["count"],
+            "has_next": has_next,
         }
 
+    def list(self, user, thread_id: int, **params) -> dict:
+        """
+        Accepts the parameters of `_get_list_params`
+        """
+
+        params = self._get_list_params(**params)
+        qs = self._get_list_qs(thread_id, params)
+
+        if params["pagination"] == PaginationModes.CURSOR:
+            result = self._cursor_pagination_service.paginate(
+                **self._get_cursor_page_kwargs(qs, params)
+            )
+        else:
+            results, has_next = (
+                self._offset_pagination_service.paginate_lookahead(
+                    **self._get_offset_page_kwargs(qs, params)
+                )
+            )
+            total = self._count_service.count(
+                qs, mode=params["count"], cap=params["count_cap"]
+            )
+            result = self._get_offset_result(results, has_next, total, params)
+
+        self._logger.info(f"Retrieved list of messages for {user}")
+
+        return result
+
+    async def alist(self, user, thread_id: int, **params) -> dict:
+        """
+        Accepts the parameters of `_get_list_params`
+        """
+
+        params = self._get_list_params(**params)
+        qs = self._get_list_qs(thread_id, params)
+
+        if params["pagination"] == PaginationModes.CURSOR:
+            result = await self._cursor_pagination_service.apaginate(
+                **self._get_cursor_page_kwargs(qs, params)
+            )
+        else:
+            results, has_next = (
+                await self._offset_pagination_service.apaginate_lookahead(
+                    **self._get_offset_page_kwargs(qs, params)
+                )
+            )
+            total = await self._count_service.acount(
+                qs, mode=params["count"], cap=params["count_cap"]
+            )
+            result = self._get_offset_result(results, has_next, total, params)
+
         self._logger.info(f"Retrieved list of messages for {user}")
 
         return result
@@ -0,0 +1,385 @@
+import re
+from datetime import datetime, timezone
+
+from django.db import connection
+from django.db.models import Exists, F, OuterRef
+from django.db.transaction import atomic
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import now
+
+from chat.models import Message, Thread
+from chat.v1.services.thread import ChatV1ThreadService
+from common.base.services import BaseService
+
+PARTITION_BOUND_RE = re.compile(r"FROM \((.+)\) TO \((.+)\)")
+INDEX_TABLE_RE = re.compile(r" ON (ONLY )?\S+ ")
+
+
+class ChatV1MessagePartitionService(BaseService):
+    """
+    Monthly range partitioning of messages by `created_at`
+
+    `convert` turns the message table into a partitioned one in place,
+    existing rows stay in a legacy partition, new rows go to
+    monthly partitions, rows outside of them to a default partition
+    """
+
+    table = Message._meta.db_table
+    legacy_table = f"{table}_legacy"
+    default_table = f"{table}_default"
+
+    def __init__(self):
+        super().__init__()
+
+        self._thread_service = ChatV1ThreadService()
+
+    def _get_name(self):
+        return "chat-v1-message-partition-service"
+
+    def _get_month(self, value: datetime, months: int = 0) -> datetime:
+        index = value.year * 12 + value.month - 1 + months
+        return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+    def _get_partition_name(self, start: datetime) -> str:
+        return f"{self.table}_p{start:%Y_%m}"
+
+    def _parse_bound(self, bound: str) -> datetime | None:
+        if bound in ("MINVALUE", "MAXVALUE"):
+            return None
+
+        return parse_datetime(bound.strip("'"))
+
+    def is_partitioned(self) -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table"
+                " WHERE partrelid = to_regclass(%s)",
+                [self.table],
+            )
+            return cursor.fetchone() is not None
+
+    def get_partitions(self) -> list[dict]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    child.relname,
+                    pg_get_expr(child.relpartbound, child.oid)
+                FROM pg_inherits
+                JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = to_regclass(%s)
+                ORDER BY child.relname
+                """,
+                [self.table],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            match = PARTITION_BOUND_RE.search(bound)
+            partitions.append(
+                {
+                    "name": name,
+                    "default": match is None,
+                    "start": match and self._parse_bound(match.group(1)),
+                    "end": match and self._parse_bound(match.group(2)),
+                }
+            )
+
+        return partitions
+
+    def _get_next_id(self, cursor) -> int:
+        # Message IDs keep growing, unread counters compare them
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [self.table])
+        (sequence,) = cursor.fetchone()
+        cursor.execute(f"SELECT last_value, is_called FROM {sequence}")
+        last_value, is_called = cursor.fetchone()
+
+        return last_value + 1 if is_called else last_value
+
+    def _get_indexes(self, cursor) -> list[tuple[str, str]]:
+        cursor.execute(
+            """
+            SELECT index_class.relname, pg_get_indexdef(pg_index.indexrelid)
+            FROM pg_index
+            JOIN pg_class AS index_class
+                ON index_class.oid = pg_index.indexrelid
+            WHERE pg_index.indrelid = to_regclass(%s)
+                AND NOT pg_index.indisprimary
+            """,
+            [self.legacy_table],
+        )
+        return cursor.fetchall()
+
+    def _get_foreign_keys(self, cursor) -> list[tuple[str, str]]:
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint"
+            " WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [self.legacy_table],
+        )
+        return cursor.fetchall()
+
+    def _get_columns(self, cursor) -> list[str]:
+        # Generated columns are computed on insert
+        cursor.execute(
+            "SELECT attname FROM pg_attribute"
+            " WHERE attrelid = to_regclass(%s) AND attnum > 0"
+            " AND NOT attisdropped AND attgenerated = ''"
+            " ORDER BY attnum",
+            [self.table],
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+    def _get_referencing_foreign_keys(self, cursor) -> list[tuple[str, str]]:
+        cursor.execute(
+            """
+            SELECT referencing.relname, pg_constraint.conname
+            FROM pg_constraint
+            JOIN pg_class AS referencing
+                ON referencing.oid = pg_constraint.conrelid
+            WHERE pg_constraint.confrelid = to_regclass(%s)
+                AND pg_constraint.contype = 'f'
+            """,
+            [self.table],
+        )
+        return cursor.fetchall()
+
+    @atomic
+    def convert(self, months_ahead: int = 3) -> list[str]:
+        """
+        Holds an exclusive lock on the message table while the primary
+        key index of the legacy partition is built
+        """
+
+        if self.is_partitioned():
+            self._logger.info(f"{self.table} is already partitioned")
+            return []
+
+        qn = connection.ops.quote_name
+        table, legacy_table = qn(self.table), qn(self.legacy_table)
+        with connection.cursor() as cursor:
+            # Deferred foreign key checks block ALTER TABLE
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(f"SELECT MAX(created_at) FROM {table}")
+            (last_created_at,) = cursor.fetchone()
+            boundary = self._get_month(
+                max(filter(None, [last_created_at, now()])), months=1
+            )
+            next_id = self._get_next_id(cursor)
+
+            # IDs alone are not unique in a partitioned table,
+            # foreign keys to messages (Thread.last_message) are dropped
+            for table_name, name in self._get_referencing_foreign_keys(cursor):
+                cursor.execute(
+                    f"ALTER TABLE {qn(table_name)} DROP CONSTRAINT {qn(name)}"
+                )
+
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy_table}")
+            # The partition key has to be part of the primary key
+            cursor.execute(
+                f"ALTER TABLE {legacy_table}"
+                f" DROP CONSTRAINT {qn(f'{self.table}_pkey')},"
+                f" ADD CONSTRAINT {qn(f'{self.legacy_table}_pkey')}"
+                " PRIMARY KEY (id, created_at)"
+            )
+            # Names are moved to the parent table, equal partition
+            # indexes are attached to the parent ones instead of rebuilt
+            indexes = self._get_indexes(cursor)
+            for i, (name, _) in enumerate(indexes):
+                cursor.execute(
+                    f"ALTER INDEX {qn(name)}"
+                    f" RENAME TO {qn(f'{self.legacy_table}_{i}_idx')}"
+                )
+
+            cursor.execute(
+                f"ALTER TABLE {legacy_table} ALTER COLUMN id DROP IDENTITY"
+            )
+            cursor.execute(
+                f"CREATE SEQUENCE {qn(f'{self.table}_id_seq')}"
+                f" START WITH {next_id}"
+            )
+            cursor.execute(
+                f"CREATE TABLE {table} (LIKE {legacy_table}"
+                " INCLUDING DEFAULTS INCLUDING GENERATED"
+                " INCLUDING CONSTRAINTS INCLUDING STORAGE)"
+                " PARTITION BY RANGE (created_at)"
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT"
+                f" nextval('{self.table}_id_seq')"
+            )
+            cursor.execute(
+                f"ALTER SEQUENCE {qn(f'{self.table}_id_seq')}"
+                f" OWNED BY {table}.id"
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)"
+            )
+            for name, definition in self._get_foreign_keys(cursor):
+                cursor.execute(
+                    f"ALTER TABLE {table} ADD CONSTRAINT {qn(name)}"
+                    f" {definition}"
+                )
+            for _, definition in indexes:
+                cursor.execute(
+                    INDEX_TABLE_RE.sub(f" ON {table} ", definition, count=1)
+                )
+
+            cursor.execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {legacy_table}"
+                " FOR VALUES FROM (MINVALUE) TO (%s)",
+                [boundary],
+            )
+            cursor.execute(
+                f"CREATE TABLE {qn(self.default_table)}"
+                f" PARTITION OF {table} DEFAULT"
+            )
+
+        created = self.create_partitions(start=boundary, months=months_ahead)
+
+        self._logger.info(
+            f"Converted {self.table} to a partitioned table,"
+            f" rows before {boundary:%Y-%m-%d} are in {self.legacy_table}"
+        )
+        return [self.legacy_table, self.default_table, *created]
+
+    def _has_default_rows(
+        self, cursor, month_start: datetime, month_end: datetime
+    ) -> bool:
+        qn = connection.ops.quote_name
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {qn(self.default_table)}"
+            " WHERE created_at >= %s AND created_at < %s)",
+            [month_start, month_end],
+        )
+        return cursor.fetchone()[0]
+
+    def _create_from_default(
+        self, cursor, name: str, month_start: datetime, month_end: datetime
+    ) -> int:
+        # A new partition must not overlap rows of the default one,
+        # they are moved while the default partition is detached
+        qn = connection.ops.quote_name
+        table, default_table = qn(self.table), qn(self.default_table)
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default_table}")
+        cursor.execute(
+            f"CREATE TABLE {qn(name)} PARTITION OF {table}"
+            " FOR VALUES FROM (%s) TO (%s)",
+            [month_start, month_end],
+        )
+        columns = ", ".join(map(qn, self._get_columns(cursor)))
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {default_table}"
+            " WHERE created_at >= %s AND created_at < %s"
+            f" RETURNING {columns})"
+            f" INSERT INTO {qn(name)} ({columns}) SELECT {columns} FROM moved",
+            [month_start, month_end],
+        )
+        moved = cursor.rowcount
+        cursor.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {default_table} DEFAULT"
+        )
+
+        return moved
+
+    @atomic
+    def create_partitions(
+        self, start: datetime = None, months: int = 3
+    ) -> list[str]:
+        """
+        Create monthly partitions from the month of `start` (now)
+        Months covered by existing partitions are skipped,
+        rows of a month in the default partition are moved to the new one
+        """
+
+        qn = connection.ops.quote_name
+        partitions = self.get_partitions()
+        has_default = any(p["default"] for p in partitions)
+        partitions = [p for p in partitions if not p["default"]]
+        start = self._get_month(start or now())
+
+        created = []
+        with connection.cursor() as cursor:
+            for i in range(months + 1):
+                month_start = self._get_month(start, months=i)
+                month_end = self._get_month(start, months=i + 1)
+                if any(
+                    (p["start"] is None or p["start"] < month_end)
+                    and (p["end"] is None or p["end"] > month_start)
+                    for p in partitions
+                ):
+                    continue
+
+                name = self._get_partition_name(month_start)
+                if has_default and self._has_default_rows(
+                    cursor, month_start, month_end
+                ):
+                    moved = self._create_from_default(
+                        cursor, name, month_start, month_end
+                    )
+                    self._logger.info(
+                        f"Moved {moved} messages from {self.default_table}"
+                        f" to {name}"
+                    )
+                else:
+                    cursor.execute(
+                        f"CREATE TABLE {qn(name)}"
+                        f" PARTITION OF {qn(self.table)}"
+                        " FOR VALUES FROM (%s) TO (%s)",
+                        [month_start, month_end],
+                    )
+                created.append(name)
+
+        self._logger.info(f"Created message partitions {created}")
+        return created
+
+    def _get_affected_thread_ids(self, cursor, name: str) -> list[int]:
+        qn = connection.ops.quote_name
+        cursor.execute(f"SELECT DISTINCT thread_id FROM {qn(name)}")
+        return [thread_id for (thread_id,) in cursor.fetchall()]
+
+    @atomic
+    def detach_partitions(self, before: datetime) -> list[str]:
+        """
+        Detach monthly partitions ending on or before `before`
+
+        Detached tables are kept for archiving, messages in them
+        are no longer listed, threads and unread counters are updated
+        """
+
+        qn = connection.ops.quote_name
+        partitions = [
+            p
+            for p in self.get_partitions()
+            if not p["default"] and p["end"] is not None and p["end"] <= before
+        ]
+
+        thread_ids = set()
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            for partition in partitions:
+                thread_ids.update(
+                    self._get_affected_thread_ids(cursor, partition["name"])
+                )
+                cursor.execute(
+                    f"ALTER TABLE {qn(self.table)}"
+                    f" DETACH PARTITION {qn(partition['name'])}"
+                )
+
+        thread_ids = sorted(thread_ids)
+        if thread_ids:
+            threads_qs = Thread.objects.filter(id__in=thread_ids)
+            threads_qs.filter(last_message__isnull=False).exclude(
+                Exists(Message.objects.filter(id=OuterRef("last_message")))
+            ).update(last_message=None)
+            threads_qs.update(version=F("version") + 1)
+            self._thread_service.reconcile_unread_counts(thread_ids=thread_ids)
+
+        detached = [partition["name"] for partition in partitions]
+        self._logger.info(
+            f"Detached message partitions {detached},"
+            f" updated {len(thread_ids)} threads"
+        )
+        return detached
@@ -0,0 +1,134 @@
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, QuerySet, Window, Max, Prefetch
+from django.db.models.functions import Cast, RowNumber
+
+from chat.models import Message, Thread, ThreadUser
+from chat.models.message import SEARCH_CONFIG
+from common.base.services import BaseService
+from common.pagination.cursor_pagination import CursorPaginationService
+
+
+class ChatV1MessageSearchService(BaseService):
+    def __init__(self):
+        super().__init__()
+
+        self._cursor_pagination_service = CursorPaginationService()
+
+    def _get_name(self):
+        return "chat-v1-message-search-service"
+
+    def _get_search_query(self, query: str) -> SearchQuery:
+        return SearchQuery(
+            query, config=SEARCH_CONFIG, search_type="websearch"
+        )
+
+    def _get_ranked_qs(
+        self, qs: QuerySet[Message], search_query: SearchQuery
+    ) -> QuerySet[Message]:
+        # Ranks are real, double precision ones survive a cursor round trip
+        return qs.filter(search_vector=search_query).annotate(
+            rank=Cast(
+                SearchRank(F("search_vector"), search_query), FloatField()
+            )
+        )
+
+    def _get_highlighted_qs(
+        self, qs: QuerySet[Message], search_query: SearchQuery
+    ) -> QuerySet[Message]:
+        return qs.annotate(
+            headline=SearchHeadline("text", search_query, config=SEARCH_CONFIG)
+        )
+
+    def search(
+        self,
+        user,
+        thread_id: int,
+        query: str,
+        page_size: int = 10,
+        cursor: str = None,
+    ) -> dict:
+        qs = Message.objects.filter(
+            thread_id=thread_id, thread__participants=user
+        ).prefetch_related("sender")
+        search_query = self._get_search_query(query)
+        ranked_qs = self._get_ranked_qs(qs, search_query)
+        highlighted_qs = self._get_highlighted_qs(ranked_qs, search_query)
+
+        result = self._cursor_pagination_service.paginate(
+            qs=highlighted_qs,
+            ordering=self._cursor_pagination_service.get_ordering("-rank"),
+            cursor=cursor,
+            page_size=page_size,
+        )
+
+        self._logger.info(
+            f"Searched messages of thread {thread_id} for {user}"
+        )
+        return result
+
+    def _get_thread_hits_qs(
+        self, user, query: str, hits_per_thread: int
+    ) -> QuerySet[Message]:
+        # Restricted through the caller's participations, so the trigram
+        # index is only probed together with their threads
+        thread_ids_qs = ThreadUser.objects.filter(user=user).values(
+            "thread_id"
+        )
+        qs = Message.objects.filter(
+            thread_id__in=thread_ids_qs, text__trigram_word_similar=query
+        ).annotate(similarity=TrigramWordSimilarity(query, "text"))
+
+        return qs.annotate(
+            thread_similarity=Window(
+                Max("similarity"), partition_by=F("thread_id")
+            ),
+            hit_number=Window(
+                RowNumber(),
+                partition_by=F("thread_id"),
+                order_by=[F("similarity").desc(), F("id").desc()],
+            ),
+        ).filter(hit_number__lte=hits_per_thread)
+
+    def search_threads(
+        self,
+        user,
+        query: str,
+        page_size: int = 10,
+        hits_per_thread: int = 3,
+    ) -> list[Thread]:
+        hits_qs = self._get_thread_hits_qs(user, query, hits_per_thread)
+        # Every thread has at most hits_per_thread hits,
+        # so the limit covers the best page_size threads
+        hits = list(
+            hits_qs.order_by(
+                "-thread_similarity", "thread_id", "hit_number"
+            ).prefetch_related("sender")[: page_size * hits_per_thread]
+        )
+
+        thread_hits = {}
+        for hit in hits:
+            thread_hits.setdefault(hit.thread_id, []).append(hit)
+        thread_ids = list(thread_hits)[:page_size]
+
+        threads = Thread.objects.prefetch_related(
+            Prefetch(
+                "participants",
+                queryset=get_user_model().objects.order_by("username"),
+            )
+        ).in_bulk(thread_ids)
+
+        results = []
+        for thread_id in thread_ids:
+            thread = threads[thread_id]
+            thread.hits = thread_hits[thread_id]
+            thread.similarity = thread.hits[0].thread_similarity
+            results.append(thread)
+
+        self._logger.info(f"Searched messages of all threads for {user}")
+        return results
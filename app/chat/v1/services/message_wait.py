@@ -0,0 +1,125 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import NotFound
+
+from chat.models import Message, Thread
+from chat.v1.services.event import ChatV1EventService
+from common.base.services import BaseService
+from common.events import (
+    EventSubscriptionOverflow,
+    event_hub,
+    get_event_broker,
+)
+from common.pagination.cursor_pagination import CursorPaginationService
+
+
+class ChatV1MessageWaitService(BaseService):
+    ordering = ["created_at", "id"]
+
+    def __init__(self):
+        super().__init__()
+
+        self._cursor_pagination_service = CursorPaginationService()
+
+    def _get_name(self):
+        return "chat-v1-message-wait-service"
+
+    def _get_cursor(self, message: Message) -> str:
+        return self._cursor_pagination_service.encode_cursor(
+            [message.created_at, message.id]
+        )
+
+    def _get_latest_cursor(self, thread_id: int) -> str | None:
+        message = (
+            Message.objects.filter(thread_id=thread_id)
+            .order_by("-created_at", "-id")
+            .first()
+        )
+        return self._get_cursor(message) if message else None
+
+    def _get_newer(
+        self,
+        user,
+        thread_id: int,
+        after: str | None,
+        page_size: int,
+        latest: bool = False,
+    ) -> dict:
+        try:
+            if not Thread.objects.filter(
+                id=thread_id, participants=user
+            ).exists():
+                self._logger.warn(
+                    f"Failed to wait for messages for {user}: not found"
+                )
+                raise NotFound()
+
+            if latest:
+                cursor = self._get_latest_cursor(thread_id)
+                return {"results": [], "cursor": cursor}
+
+            qs = Message.objects.filter(thread_id=thread_id).prefetch_related(
+                "sender"
+            )
+            results = self._cursor_pagination_service.paginate(
+                qs=qs,
+                ordering=self.ordering,
+                cursor=after,
+                page_size=page_size,
+            )["results"]
+            cursor = self._get_cursor(results[-1]) if results else after
+
+            return {"results": results, "cursor": cursor}
+        finally:
+            self._release_connection()
+
+    def _is_new_message(self, event: dict, thread_id: int) -> bool:
+        return (
+            event["type"] == ChatV1EventService.Types.MESSAGE_CREATED
+            and event["thread_id"] == thread_id
+        )
+
+    async def wait(
+        self,
+        user,
+        thread_id: int,
+        after: str = None,
+        timeout: int = 25,
+        page_size: int = 100,
+    ) -> dict:
+        get_newer = sync_to_async(self._get_newer)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        get_event_broker().listen()
+        # Subscribed before the first check, so no message is missed
+        subscription = event_hub.subscribe(user.id)
+        try:
+            result = await get_newer(
+                user, thread_id, after, page_size, latest=after is None
+            )
+            while not result["results"]:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    break
+                except EventSubscriptionOverflow:
+                    # Events were dropped, resubscribe and check again
+                    event_hub.unsubscribe(subscription)
+                    subscription = event_hub.subscribe(user.id)
+                    event = None
+
+                if event is None or self._is_new_message(event, thread_id):
+                    result = await get_newer(
+                        user, thread_id, result["cursor"], page_size
+                    )
+        finally:
+            event_hub.unsubscribe(subscription)
+
+        self._logger.info(
+            f"Waited for {len(result['results'])} messages for {user}"
+        )
+        return result
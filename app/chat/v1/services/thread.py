@@ -1,28 +1,40 @@
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Q, Prefetch
+from django.db.models import (
+    Count,
+    Prefetch,
+    OuterRef,
+    Subquery,
+    IntegerField,
+    BigIntegerField,
+    F,
+    Value,
+)
+from django.db import IntegrityError
+from django.db.models.functions import Coalesce, Greatest
 from django.db.transaction import atomic
 from rest_framework.exceptions import NotFound
 
-from chat.models import Thread
+from chat.models import Thread, ThreadUser, Message
+from chat.v1.services.thread_list_cache import ChatV1ThreadListCacheService
 from common.base.services import BaseService
 
 
 class ChatV1ThreadService(BaseService):
+    def __init__(self):
+        super().__init__()
+
+        self._thread_list_cache_service = ChatV1ThreadListCacheService()
+
     def _get_name(self):
         return "chat-v1-thread-service"
 
     def _get_thread_by_participant_ids(
         self, participant_ids: list[int]
     ) -> Thread | None:
-        count = len(participant_ids)
-        participant_count_qs = Count(
-            "participants",
-            filter=Q(participants__id__in=participant_ids),
-            distinct=True,
-        )
         return (
-            Thread.objects.annotate(participant_count=participant_count_qs)
-            .filter(participant_count=count)
+            Thread.objects.filter(
+                participants_key=Thread.get_participants_key(participant_ids)
+            )
             .prefetch_related(self._get_thread_prefetch())
             .first()
         )
@@ -33,8 +45,22 @@ class ChatV1ThreadService(BaseService):
             queryset=get_user_model().objects.order_by("username"),
         )
 
-    def _create_thread_by_participants(self, participants: list) -> Thread:
-        thread = Thread.objects.create()
+    def _create_thread_by_participants(
+        self, participants: list
+    ) -> Thread | None:
+        participants_key = Thread.get_participants_key(
+            [participant.id for participant in participants]
+        )
+        try:
+            # Unique participants key serializes concurrent inserts,
+            # the loser waits for the winner to commit and fails
+            with atomic():
+                thread = Thread.objects.create(
+                    participants_key=participants_key
+                )
+        except IntegrityError:
+            return None
+
         thread.participants.add(*participants, through_defaults={})
         return Thread.objects.prefetch_related(
             self._get_thread_prefetch()
@@ -62,9 +88,18 @@ class ChatV1ThreadService(BaseService):
             thread = self._create_thread_by_participants(
                 participants=[user, another_user]
             )
-            self._logger.info(
-                f"Created a new thread between {user} and {another_user}"
-                f" for {user}"
+            if thread:
+                self._thread_list_cache_service.invalidate(
+                    [user.id, another_user.id]
+                )
+                self._logger.info(
+                    f"Created a new thread between {user} and {another_user}"
+                    f" for {user}"
+                )
+        if not thread:
+            # Created by a concurrent request
+            thread = self._get_thread_by_participant_ids(
+                participant_ids=[user.id, participant_id]
             )
 
         self._logger.info(
@@ -73,6 +108,64 @@ class ChatV1ThreadService(BaseService):
         )
         return thread
 
+    @atomic
+    def bulk_upsert(self, user, participant_ids: list[int]) -> list[Thread]:
+        participant_ids = list(dict.fromkeys(participant_ids))
+        another_users = get_user_model().objects.in_bulk(participant_ids)
+        another_users.pop(user.id, None)
+        if len(another_users) != len(participant_ids):
+            self._logger.warn(
+                f"Failed to bulk upsert threads for {user}:"
+                f" some of participants {participant_ids} not exist"
+            )
+            raise NotFound("User does not exist")
+
+        keys = {
+            Thread.get_participants_key([user.id, participant_id]): (
+                another_users[participant_id]
+            )
+            for participant_id in participant_ids
+        }
+        thread_ids = dict(
+            Thread.objects.filter(participants_key__in=keys).values_list(
+                "participants_key", "id"
+            )
+        )
+
+        missing_keys = [key for key in keys if key not in thread_ids]
+        if missing_keys:
+            # Threads created concurrently are returned instead of failing
+            threads = Thread.objects.bulk_create(
+                [Thread(participants_key=key) for key in missing_keys],
+                update_conflicts=True,
+                unique_fields=["participants_key"],
+                update_fields=["participants_key"],
+            )
+            ThreadUser.objects.bulk_create(
+                [
+                    ThreadUser(thread=thread, user=participant)
+                    for thread in threads
+                    for participant in [user, keys[thread.participants_key]]
+                ],
+                ignore_conflicts=True,
+            )
+            thread_ids.update(
+                {thread.participants_key: thread.id for thread in threads}
+            )
+            self._thread_list_cache_service.invalidate(
+                [user.id]
+                + [keys[thread.participants_key].id for thread in threads]
+            )
+            self._logger.info(f"Created {len(threads)} new threads for {user}")
+
+        threads = Thread.objects.prefetch_related(
+            self._get_thread_prefetch()
+        ).in_bulk(thread_ids.values())
+
+        self._logger.info(f"Retrieved {len(threads)} threads for {user}")
+        return [threads[thread_ids[key]] for key in keys]
+
+    @atomic
     def delete(self, user, thread_id: int) -> None:
         thread = Thread.objects.filter(
             id=thread_id, participants__in=[user.id]
@@ -81,5 +174,98 @@ class ChatV1ThreadService(BaseService):
             self._logger.warn(f"Failed to delete thread for {user}: not found")
             raise NotFound()
 
+        participant_ids = list(
+            ThreadUser.objects.filter(thread=thread).values_list(
+                "user_id", flat=True
+            )
+        )
         thread.delete()
+        self._thread_list_cache_service.invalidate(participant_ids)
         self._logger.info(f"Deleted thread {thread} for {user}")
+
+    def backfill_last_messages(self, thread_ids: list[int] = None) -> int:
+        qs = Thread.objects.all()
+        if thread_ids is not None:
+            qs = qs.filter(id__in=thread_ids)
+
+        last_message_qs = Message.objects.filter(
+            thread=OuterRef("pk")
+        ).order_by("-created_at", "-id")
+        count = qs.update(
+            last_message=Subquery(last_message_qs.values("id")[:1]),
+            last_message_sent_at=Subquery(
+                last_message_qs.values("created_at")[:1]
+            ),
+            version=F("version") + 1,
+        )
+
+        self._thread_list_cache_service.invalidate_threads(thread_ids)
+
+        self._logger.info(f"Backfilled last messages of {count} threads")
+        return count
+
+    def _get_unread_count(self, last_read_message_id) -> Coalesce:
+        unread_count_qs = (
+            Message.objects.filter(
+                thread=OuterRef("thread"),
+                is_read=False,
+                id__gt=last_read_message_id,
+            )
+            .exclude(sender=OuterRef("user"))
+            .order_by()
+            .values("thread")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+
+        return Coalesce(
+            Subquery(unread_count_qs, output_field=IntegerField()), 0
+        )
+
+    @atomic
+    def read(self, user, thread_id: int, message_id: int = None) -> ThreadUser:
+        thread = Thread.objects.filter(id=thread_id, participants=user).first()
+        if not thread:
+            self._logger.warn(f"Failed to read thread for {user}: not found")
+            raise NotFound()
+
+        last_message_id = thread.last_message_id or 0
+        if message_id is not None:
+            last_message_id = min(message_id, last_message_id)
+        last_message_id = Value(
+            last_message_id, output_field=BigIntegerField()
+        )
+
+        # Both expressions are evaluated against the row before the update
+        ThreadUser.objects.filter(thread_id=thread_id, user=user).update(
+            last_read_message_id=Greatest(
+                Coalesce("last_read_message_id", 0), last_message_id
+            ),
+            unread_count=self._get_unread_count(
+                Greatest(
+                    Coalesce(OuterRef("last_read_message_id"), 0),
+                    last_message_id,
+                )
+            ),
+        )
+
+        self._thread_list_cache_service.invalidate([user.id])
+
+        self._logger.info(f"Read thread {thread} for {user}")
+        return ThreadUser.objects.get(thread_id=thread_id, user=user)
+
+    def reconcile_unread_counts(self, thread_ids: list[int] = None) -> int:
+        qs = ThreadUser.objects.all()
+        if thread_ids is not None:
+            qs = qs.filter(thread_id__in=thread_ids)
+
+        count = qs.update(
+            unread_count=self._get_unread_count(
+                Coalesce(OuterRef("last_read_message_id"), 0)
+            )
+        )
+
+        self._thread_list_cache_service.invalidate_threads(thread_ids)
+
+        self._logger.info(f"Reconciled unread counts of {count} participants")
+        return count
@@ -1,8 +1,21 @@
 from django.contrib.auth import get_user_model
-from django.db.models import TextChoices, QuerySet, Prefetch, Max
+from django.db.models import (
+    Count,
+    TextChoices,
+    QuerySet,
+    Prefetch,
+    Sum,
+    OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
 
-from chat.models import Thread, Message
+from chat.models import Thread, ThreadUser
+from chat.v1.services.thread_list_cache import ChatV1ThreadListCacheService
 from common.base.services import BaseService
+from common.pagination import PaginationModes, CountModes
+from common.pagination.count import PaginationCountService
+from common.pagination.cursor_pagination import CursorPaginationService
 from common.pagination.offset_pagination import OffsetPaginationService
 
 
@@ -11,6 +24,9 @@ class ChatV1ThreadListService(BaseService):
         super().__init__()
 
         self._offset_pagination_service = OffsetPaginationService()
+        self._cursor_pagination_service = CursorPaginationService()
+        self._count_service = PaginationCountService()
+        self._cache_service = ChatV1ThreadListCacheService()
 
     class Orderings(TextChoices):
         CREATED_AT_ASC = "created_at"
@@ -31,13 +47,26 @@ class ChatV1ThreadListService(BaseService):
                 "participants",
                 queryset=get_user_model().objects.order_by("username"),
             )
-        ).annotate(last_message_sent_at=Max("message__created_at"))
+        )
+
+    def _get_annotated_qs(
+        self, qs: QuerySet[Thread], user
+    ) -> QuerySet[Thread]:
+        unread_count_qs = ThreadUser.objects.filter(
+            thread=OuterRef("pk"), user=user
+        ).values("unread_count")[:1]
+
+        return qs.annotate(unread_count=Coalesce(Subquery(unread_count_qs), 0))
 
     def _get_filtered_qs(
         self, qs: QuerySet[Thread], participant_ids: list[int] = None
     ) -> QuerySet[Thread]:
         if participant_ids is not None:
-            qs = qs.filter(participants__id__in=participant_ids)
+            qs = qs.filter(
+                id__in=ThreadUser.objects.filter(
+                    user_id__in=participant_ids
+                ).values("thread_id")
+            )
 
         return qs
 
@@ -48,43 +77,253 @@ class ChatV1ThreadListService(BaseService):
     ) -> QuerySet[Thread]:
         return qs.order_by(ordering)
 
+    def _get_total_unread_messages_qs(self, user) -> QuerySet[ThreadUser]:
+        return ThreadUser.objects.filter(user=user)
+
     def _get_total_unread_messages(self, user) -> int:
+        return self._get_total_unread_messages_qs(user).aggregate(
+            total=Coalesce(Sum("unread_count"), 0)
+        )["total"]
+
+    async def _aget_total_unread_messages(self, user) -> int:
+        result = await self._get_total_unread_messages_qs(user).aaggregate(
+            total=Coalesce(Sum("unread_count"), 0)
+        )
+        return result["total"]
+
+    def _get_version_aggregates(self) -> dict:
+        # Changes whenever a thread of the user or its messages change
+        return {
+            "count": Count("id"),
+            "thread_ids": Sum("thread_id"),
+            "versions": Sum("thread__version"),
+            "unread_count": Sum("unread_count"),
+            "last_read_message_ids": Sum("last_read_message_id"),
+        }
+
+    def get_version(self, user) -> dict:
+        return ThreadUser.objects.filter(user=user).aggregate(
+            **self._get_version_aggregates()
+        )
+
+    async def aget_version(self, user) -> dict:
+        return await ThreadUser.objects.filter(user=user).aaggregate(
+            **self._get_version_aggregates()
+        )
+
+    def _get_values_qs(
+        self, qs: QuerySet[Thread], values: list[str], ordering: Orderings
+    ) -> QuerySet:
+        # Participants are set after pagination, ordering keys for cursors
+        names = [name for name in values if name != "participants"]
+        names += [ordering.lstrip("-"), "id"]
+
+        return qs.prefetch_related(None).values(*dict.fromkeys(names))
+
+    def _get_participants_qs(self, rows: list[dict]) -> QuerySet[ThreadUser]:
         return (
-            Message.objects.filter(thread__participants=user, is_read=False)
-            .exclude(sender=user)
-            .distinct()
-            .count()
+            ThreadUser.objects.filter(
+                thread_id__in=[row["id"] for row in rows]
+            )
+            .order_by("user__username")
+            .values_list("thread_id", "user_id", "user__username")
         )
 
-    def list(
+    def _set_participants(
+        self, rows: list[dict], participants: list[tuple]
+    ) -> None:
+        participants_by_thread = {}
+        for thread_id, user_id, username in participants:
+            participants_by_thread.setdefault(thread_id, []).append(
+                {"id": user_id, "username": username}
+            )
+
+        for row in rows:
+            row["participants"] = participants_by_thread.get(row["id"], [])
+
+    def _prefetch_participants(
+        self, rows: list[dict], values: list[str]
+    ) -> None:
+        if values is None or "participants" not in values or not rows:
+            return
+
+        self._set_participants(rows, list(self._get_participants_qs(rows)))
+
+    async def _aprefetch_participants(
+        self, rows: list[dict], values: list[str]
+    ) -> None:
+        if values is None or "participants" not in values or not rows:
+            return
+
+        participants = [
+            participant
+            async for participant in self._get_participants_qs(rows)
+        ]
+        self._set_participants(rows, participants)
+
+    def _get_list_params(
         self,
-        user,
         participant_ids: list[int] = None,
         page: int = 1,
         page_size: int = 10,
         ordering: Orderings = Orderings.CREATED_AT_DESC,
+        pagination: PaginationModes = PaginationModes.OFFSET,
+        cursor: str = None,
+        count: CountModes = CountModes.EXACT,
+        count_cap: int = 1000,
+        values: list[str] = None,
     ) -> dict:
-        qs = Thread.objects.all()
+        return {
+            "participant_ids": participant_ids,
+            "page": page,
+            "page_size": page_size,
+            "ordering": ordering,
+            "pagination": pagination,
+            "cursor": cursor,
+            "count": count,
+            "count_cap": count_cap,
+            "values": values,
+        }
+
+    def _get_list_qs(self, user, params: dict) -> QuerySet[Thread]:
+        qs = Thread.objects.filter(
+            id__in=ThreadUser.objects.filter(user=user).values("thread_id")
+        )
         prefetched_qs = self._get_prefetch_qs(qs)
+        annotated_qs = self._get_annotated_qs(prefetched_qs, user=user)
         filtered_qs = self._get_filtered_qs(
-            prefetched_qs, participant_ids=participant_ids
+            annotated_qs, participant_ids=params["participant_ids"]
         )
-        ordered_qs = self._get_ordered_qs(filtered_qs, ordering=ordering)
 
-        results = list(
-            self._offset_pagination_service.paginate(
-                iterable=ordered_qs, page=page, page_size=page_size
+        if params["values"] is not None:
+            filtered_qs = self._get_values_qs(
+                filtered_qs, params["values"], params["ordering"]
             )
-        )
-        total = ordered_qs.count()
-        total_unread = self._get_total_unread_messages(user=user)
 
-        result = {
+        if params["pagination"] == PaginationModes.CURSOR:
+            return filtered_qs
+
+        return self._get_ordered_qs(filtered_qs, ordering=params["ordering"])
+
+    def _get_cursor_page_kwargs(self, qs: QuerySet, params: dict) -> dict:
+        return {
+            "qs": qs,
+            "ordering": self._cursor_pagination_service.get_ordering(
+                params["ordering"]
+            ),
+            "cursor": params["cursor"],
+            "page_size": params["page_size"],
+        }
+
+    def _get_offset_page_kwargs(self, qs: QuerySet, params: dict) -> dict:
+        return {
+            "iterable": qs,
+            "page": params["page"],
+            "page_size": params["page_size"],
+        }
+
+    def _get_offset_result(
+        self, results: list, has_next: bool, total: int | None, params: dict
+    ) -> dict:
+        return {
             "results": results,
             "count": total,
-            "count_unread": total_unread,
+            "count_mode": params["count"],
+            "has_next": has_next,
         }
 
+    def _get_list(self, user, params: dict) -> dict:
+        qs = self._get_list_qs(user, params)
+
+        if params["pagination"] == PaginationModes.CURSOR:
+            result = self._cursor_pagination_service.paginate(
+                **self._get_cursor_page_kwargs(qs, params)
+            )
+        else:
+            results, has_next = (
+                self._offset_pagination_service.paginate_lookahead(
+                    **self._get_offset_page_kwargs(qs, params)
+                )
+            )
+            total = self._count_service.count(
+                qs, mode=params["count"], cap=params["count_cap"]
+            )
+            result = self._get_offset_result(results, has_next, total, params)
+
+        self._prefetch_participants(result["results"], params["values"])
+        result["count_unread"] = self._get_total_unread_messages(user=user)
+
+        return result
+
+    async def _aget_list(self, user, params: dict) -> dict:
+        qs = self._get_list_qs(user, params)
+
+        if params["pagination"] == PaginationModes.CURSOR:
+            result = await self._cursor_pagination_service.apaginate(
+                **self._get_cursor_page_kwargs(qs, params)
+            )
+        else:
+            results, has_next = (
+                await self._offset_pagination_service.apaginate_lookahead(
+                    **self._get_offset_page_kwargs(qs, params)
+                )
+            )
+            total = await self._count_service.acount(
+                qs, mode=params["count"], cap=params["count_cap"]
+            )
+            result = self._get_offset_result(results, has_next, total, params)
+
+        await self._aprefetch_participants(result["results"], params["values"])
+        result["count_unread"] = await self._aget_total_unread_messages(
+            user=user
+        )
+
+        return result
+
+    def list(self, user, **params) -> dict:
+        """
+        Accepts the parameters of `_get_list_params`
+        """
+
+        params = self._get_list_params(**params)
+
+        if not self._cache_service.is_enabled():
+            self._logger.info(f"Retrieved list of threads for {user}")
+            return self._get_list(user, params)
+
+        key = self._cache_service.get_key(user.id, params)
+        result = self._cache_service.get_list(key)
+        if result is not None:
+            self._logger.info(f"Retrieved cached list of threads for {user}")
+            return result
+
+        result = self._get_list(user, params)
+        self._cache_service.set_list(key, result)
+
+        self._logger.info(f"Retrieved list of threads for {user}")
+
+        return result
+
+    async def alist(self, user, **params) -> dict:
+        """
+        Accepts the parameters of `_get_list_params`
+        """
+
+        params = self._get_list_params(**params)
+
+        if not self._cache_service.is_enabled():
+            self._logger.info(f"Retrieved list of threads for {user}")
+            return await self._aget_list(user, params)
+
+        key = await self._cache_service.aget_key(user.id, params)
+        result = await self._cache_service.aget_list(key)
+        if result is not None:
+            self._logger.info(f"Retrieved cached list of threads for {user}")
+            return result
+
+        result = await self._aget_list(user, params)
+        await self._cache_service.aset_list(key, result)
+
         self._logger.info(f"Retrieved list of threads for {user}")
 
         return result
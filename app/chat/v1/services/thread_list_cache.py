@@ -0,0 +1,100 @@
+import json
+from functools import partial
+from hashlib import sha256
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.transaction import on_commit
+
+from chat.models import ThreadUser
+from common.base.services import BaseService
+
+
+class ChatV1ThreadListCacheService(BaseService):
+    """
+    Cache of thread lists by user and query parameters
+
+    Every user has a cache version which is part of the keys,
+    changing the version invalidates all lists of the user at once
+    Disabled unless THREAD_LIST_CACHE_ENABLED (a shared cache backend)
+    """
+
+    prefix = "chat-v1-thread-list"
+
+    def _get_name(self):
+        return "chat-v1-thread-list-cache-service"
+
+    def is_enabled(self) -> bool:
+        return settings.THREAD_LIST_CACHE_ENABLED
+
+    def _get_version_key(self, user_id: int) -> str:
+        return f"{self.prefix}:version:{user_id}"
+
+    def _get_key(self, user_id: int, version: str, params: dict) -> str:
+        data = json.dumps(params, sort_keys=True, default=str).encode()
+        return f"{self.prefix}:{user_id}:{version}:{sha256(data).hexdigest()}"
+
+    def get_key(self, user_id: int, params: dict) -> str:
+        # The version has to be read before the list is queried,
+        # a list queried before a change is stored under a stale key
+        version_key = self._get_version_key(user_id)
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, uuid4().hex, timeout=None)
+            version = cache.get(version_key)
+
+        return self._get_key(user_id, version, params)
+
+    async def aget_key(self, user_id: int, params: dict) -> str:
+        version_key = self._get_version_key(user_id)
+        version = await cache.aget(version_key)
+        if version is None:
+            await cache.aadd(version_key, uuid4().hex, timeout=None)
+            version = await cache.aget(version_key)
+
+        return self._get_key(user_id, version, params)
+
+    def get_list(self, key: str) -> dict | None:
+        return cache.get(key)
+
+    async def aget_list(self, key: str) -> dict | None:
+        return await cache.aget(key)
+
+    def set_list(self, key: str, result: dict) -> None:
+        cache.set(key, result, timeout=settings.THREAD_LIST_CACHE_TIMEOUT)
+
+    async def aset_list(self, key: str, result: dict) -> None:
+        await cache.aset(
+            key, result, timeout=settings.THREAD_LIST_CACHE_TIMEOUT
+        )
+
+    def _invalidate(self, user_ids: set[int]) -> None:
+        cache.set_many(
+            {
+                self._get_version_key(user_id): uuid4().hex
+                for user_id in user_ids
+            },
+            timeout=None,
+        )
+        self._logger.info(f"Invalidated thread lists of {len(user_ids)} users")
+
+    def _invalidate_threads(self, thread_ids: list[int] | None) -> None:
+        qs = ThreadUser.objects.all()
+        if thread_ids is not None:
+            qs = qs.filter(thread_id__in=thread_ids)
+
+        self._invalidate(set(qs.values_list("user_id", flat=True)))
+
+    def invalidate(self, user_ids: list[int]) -> None:
+        if not self.is_enabled():
+            return
+
+        # Lists are invalidated once changes are visible to other requests
+        on_commit(partial(self._invalidate, set(user_ids)))
+
+    def invalidate_threads(self, thread_ids: list[int] = None) -> None:
+        if not self.is_enabled():
+            return
+
+        on_commit(partial(self._invalidate_threads, thread_ids))
@@ -1,17 +1,47 @@
+import asyncio
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+import msgpack
+import orjson
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-
-from chat.models import Thread, Message
-from chat.v1.services import ChatV1ThreadListService, ChatV1MessageListService
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from chat.models import Thread, ThreadUser, Message
+from chat.v1.services import (
+    ChatV1ThreadService,
+    ChatV1ThreadListService,
+    ChatV1MessageListService,
+    ChatV1MessageService,
+)
 from chat.v1.views import (
     ChatV1ThreadUpsertView,
+    ChatV1ThreadBulkUpsertView,
     ChatV1ThreadDeleteView,
     ChatV1ThreadListView,
+    ChatV1ThreadReadView,
 )
 from chat.v1.views.message_create import ChatV1MessageCreateView
 from chat.v1.views.message_list import ChatV1MessageListView
 from chat.v1.views.message_read import ChatV1MessageReadView
+from chat.v1.views.message_read_many import ChatV1MessageReadManyView
+from chat.v1.views.message_search import ChatV1MessageSearchView
+from chat.v1.views.message_thread_search import ChatV1MessageThreadSearchView
+from chat.v1.views.message_wait import ChatV1MessageWaitView
 from common.base.tests import BaseAPITestCase
+from common.base.views.base import ResponseSerializationMismatch
+from common.base.views.response_validation import response_validation_counter
+from common.parsers import FastJSONParser
+from common.renderers import FastJSONRenderer
+from common.pagination import PaginationModes, CountModes
 
 
 class ChatV1ThreadUpsertTestCase(BaseAPITestCase):
@@ -22,7 +52,11 @@ class ChatV1ThreadUpsertTestCase(BaseAPITestCase):
             ChatV1ThreadUpsertView.name,
             kwargs={"participant_id": self.another_user.id},
         )
-        self.thread = Thread.objects.create()
+        self.thread = Thread.objects.create(
+            participants_key=Thread.get_participants_key(
+                [self.user.id, self.another_user.id]
+            )
+        )
         self.thread.participants.add(
             self.user, self.another_user, through_defaults={}
         )
@@ -62,6 +96,73 @@ class ChatV1ThreadUpsertTestCase(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class ChatV1ThreadBulkUpsertTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.url = reverse(ChatV1ThreadBulkUpsertView.name)
+
+    def test_success(self):
+        response = self.client.post(
+            self.url,
+            {"participant_ids": [self.another_user.id]},
+            headers=self.get_auth_headers(),
+            format="json",
+        )
+        response_json = response.json()
+        thread = Thread.objects.get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response_json,
+            {
+                "results": [
+                    {
+                        "id": thread.id,
+                        "participants": [
+                            {
+                                "id": self.another_user.id,
+                                "username": self.another_user.username,
+                            },
+                            {
+                                "id": self.user.id,
+                                "username": self.username,
+                            },
+                        ],
+                    }
+                ]
+            },
+        )
+
+    def test_too_many_participant_ids(self):
+        response = self.client.post(
+            self.url,
+            {"participant_ids": list(range(1, 202))},
+            headers=self.get_auth_headers(),
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_not_exist(self):
+        participant_id = self.another_user.id
+        self.another_user.delete()
+
+        response = self.client.post(
+            self.url,
+            {"participant_ids": [participant_id]},
+            headers=self.get_auth_headers(),
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_not_authenticated(self):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class ChatV1ThreadDeleteTestCase(BaseAPITestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -102,6 +203,59 @@ class ChatV1ThreadDeleteTestCase(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class ChatV1ThreadReadTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.message = ChatV1MessageService().create(
+            user=self.another_user, thread_id=self.thread.id, text="text"
+        )
+        self.url = reverse(
+            ChatV1ThreadReadView.name, kwargs={"pk": self.thread.id}
+        )
+
+    def test_success(self):
+        response = self.client.post(
+            self.url,
+            {"message_id": self.message.id},
+            headers=self.get_auth_headers(),
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response_json,
+            {
+                "thread": self.thread.id,
+                "last_read_message_id": self.message.id,
+                "unread_count": 0,
+            },
+        )
+
+    def test_invalid_message_id(self):
+        response = self.client.post(
+            self.url, {"message_id": 0}, headers=self.get_auth_headers()
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_not_exist(self):
+        self.thread.delete()
+
+        response = self.client.post(self.url, headers=self.get_auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_not_authenticated(self):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class ChatV1ThreadListTestCase(BaseAPITestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -119,10 +273,66 @@ class ChatV1ThreadListTestCase(BaseAPITestCase):
         self.thread.participants.add(
             self.user, self.another_user, through_defaults={}
         )
-        self.message = Message.objects.create(
-            sender=self.another_user, text="text", thread=self.thread
+        self.message = ChatV1MessageService().create(
+            user=self.another_user, thread_id=self.thread.id, text="text"
+        )
+
+    def test_sparse_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.url,
+                headers=self.get_auth_headers(),
+                query_params={**self.params, "fields": "id"},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [{"id": self.thread.id}])
+        # Neither participants nor unread counts of the page are queried
+        self.assertFalse(
+            any(
+                query["sql"].startswith('SELECT "chat_threaduser"."thread_id"')
+                for query in queries
+            )
+        )
+        page_sql = next(
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "chat_thread"."id"')
+        )
+        self.assertNotIn('"unread_count"', page_sql)
+
+    def test_sparse_exclude(self):
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params={**self.params, "exclude": "participants"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": self.thread.id, "unread_count": 1}],
+        )
+
+    def test_sparse_invalid_field(self):
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params={**self.params, "fields": "id,unknown"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sparse_empty_fields(self):
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params={**self.params, "fields": "id", "exclude": "id"},
         )
 
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("exclude", response.json()["fields"])
+
     def test_success(self):
         response = self.client.get(
             self.url,
@@ -135,6 +345,7 @@ class ChatV1ThreadListTestCase(BaseAPITestCase):
             response_json,
             {
                 "count": 1,
+                "count_mode": CountModes.EXACT,
                 "next": None,
                 "previous": None,
                 "count_unread": 1,
@@ -151,11 +362,133 @@ class ChatV1ThreadListTestCase(BaseAPITestCase):
                                 "username": self.user.username,
                             },
                         ],
+                        "unread_count": 1,
                     }
                 ],
             },
         )
 
+    def _get(self, etag: str = None):
+        headers = self.get_auth_headers()
+        if etag is not None:
+            headers["If-None-Match"] = etag
+
+        return self.client.get(
+            self.url, headers=headers, query_params=self.params
+        )
+
+    def test_etag(self):
+        response = self._get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"])
+        self.assertIn("Accept", response["Vary"])
+
+    def test_not_modified(self):
+        etag = self._get()["ETag"]
+
+        # Authentication and a single validator query
+        with self.assertNumQueries(2):
+            response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_modified_by_params(self):
+        etag = self._get()["ETag"]
+        self.params["page_size"] = 5
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def _add_participant_in_admin(self, user) -> None:
+        self.user.is_staff = self.user.is_superuser = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+        thread_users = list(ThreadUser.objects.filter(thread=self.thread))
+        updated_at = timezone.localtime(self.thread.updated_at)
+        created_at = timezone.localtime(self.thread.created_at)
+        data = {
+            "updated_at_0": f"{updated_at:%Y-%m-%d}",
+            "updated_at_1": f"{updated_at:%H:%M:%S}",
+            "created_at_0": f"{created_at:%Y-%m-%d}",
+            "created_at_1": f"{created_at:%H:%M:%S}",
+            "threaduser_set-TOTAL_FORMS": len(thread_users) + 1,
+            "threaduser_set-INITIAL_FORMS": len(thread_users),
+            f"threaduser_set-{len(thread_users)}-thread": self.thread.id,
+            f"threaduser_set-{len(thread_users)}-user": user.id,
+        }
+        for i, thread_user in enumerate(thread_users):
+            data[f"threaduser_set-{i}-id"] = thread_user.id
+            data[f"threaduser_set-{i}-thread"] = self.thread.id
+            data[f"threaduser_set-{i}-user"] = thread_user.user_id
+
+        response = self.client.post(
+            reverse("admin:chat_thread_change", args=[self.thread.id]), data
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+
+    def test_modified_by_admin_participants(self):
+        etag = self._get()["ETag"]
+        user = get_user_model().objects.create(username="new_participant")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._add_participant_in_admin(user)
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        # The cached list of the previous request is invalidated
+        self.assertIn(
+            user.id,
+            [
+                participant["id"]
+                for participant in response.json()["results"][0][
+                    "participants"
+                ]
+            ],
+        )
+
+    def test_modified_by_message_create(self):
+        etag = self._get()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1MessageService().create(
+                user=self.another_user, thread_id=self.thread.id, text="text"
+            )
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["results"][0]["unread_count"], 2)
+
+    def test_modified_by_thread_read(self):
+        etag = self._get()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1ThreadService().read(
+                user=self.user, thread_id=self.thread.id
+            )
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"][0]["unread_count"], 0)
+
+    def test_modified_by_new_thread(self):
+        etag = self._get()["ETag"]
+        thread = Thread.objects.create()
+        thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_invalid_participant_ids(self):
         params = self.params.copy()
         params["participant_ids"] = "invalid"
@@ -192,6 +525,57 @@ class ChatV1ThreadListTestCase(BaseAPITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_success_cursor(self):
+        params = self.params.copy()
+        params["pagination"] = PaginationModes.CURSOR
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response_json,
+            {
+                "next": None,
+                "previous": None,
+                "next_cursor": None,
+                "prev_cursor": None,
+                "count_unread": 1,
+                "results": [
+                    {
+                        "id": self.thread.id,
+                        "participants": [
+                            {
+                                "id": self.another_user.id,
+                                "username": self.another_user.username,
+                            },
+                            {
+                                "id": self.user.id,
+                                "username": self.user.username,
+                            },
+                        ],
+                        "unread_count": 1,
+                    }
+                ],
+            },
+        )
+
+    def test_invalid_cursor(self):
+        params = self.params.copy()
+        params["cursor"] = "invalid"
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class ChatV1MessageCreateTestCase(BaseAPITestCase):
     def setUp(self) -> None:
@@ -319,7 +703,7 @@ class ChatV1MessageReadTestCase(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class ChatV1MessageListTestCase(BaseAPITestCase):
+class ChatV1MessageReadManyTestCase(BaseAPITestCase):
     def setUp(self) -> None:
         super().setUp()
 
@@ -327,56 +711,510 @@ class ChatV1MessageListTestCase(BaseAPITestCase):
         self.thread.participants.add(
             self.user, self.another_user, through_defaults={}
         )
-        self.text = "text"
-        self.message = Message.objects.create(
-            sender=self.user, text=self.text, thread=self.thread
-        )
-
-        self.params = {
-            "page": 1,
-            "page_size": 10,
-            "text": self.text,
-            "sender_id": self.user.id,
-            "ordering": ChatV1MessageListService.Orderings.CREATED_AT_DESC,
-        }
-        self.url = reverse(
-            ChatV1MessageListView.name, kwargs={"pk": self.thread.id}
-        )
+        self.messages = [
+            Message.objects.create(
+                sender=self.another_user, text="text", thread=self.thread
+            )
+            for _ in range(2)
+        ]
+        self.url = reverse(ChatV1MessageReadManyView.name)
 
     def test_success(self):
-        response = self.client.get(
+        message_ids = [message.id for message in self.messages]
+
+        response = self.client.post(
             self.url,
+            {"message_ids": message_ids},
             headers=self.get_auth_headers(),
-            query_params=self.params,
+            format="json",
         )
         response_json = response.json()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            response_json,
-            {
-                "count": 1,
-                "next": None,
-                "previous": None,
-                "results": [
-                    {
-                        "id": self.message.id,
-                        "text": self.text,
-                        "sender": {
-                            "id": self.user.id,
-                            "username": self.username,
-                        },
-                        "is_read": self.message.is_read,
-                        "created_at": self.message.created_at.strftime(
-                            "%Y-%m-%dT%H:%M:%S.%fZ"
-                        ),
-                    }
-                ],
-            },
-        )
+        self.assertEqual(response_json, {"message_ids": message_ids})
 
-    def test_sender_id_invalid(self):
-        params = self.params.copy()
+    def test_no_message_ids(self):
+        response = self.client.post(
+            self.url,
+            {"message_ids": []},
+            headers=self.get_auth_headers(),
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_too_many_message_ids(self):
+        response = self.client.post(
+            self.url,
+            {"message_ids": list(range(1, 502))},
+            headers=self.get_auth_headers(),
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_not_authenticated(self):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ChatV1ResponseValidationTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.url = reverse(ChatV1MessageReadManyView.name)
+        # Message IDs are positive in the response contract
+        self.read_many = patch.object(
+            ChatV1MessageService, "read_many", return_value=[0]
+        )
+        self.read_many.start()
+        self.addCleanup(self.read_many.stop)
+
+    def _post(self):
+        return self.client.post(
+            self.url,
+            {"message_ids": [1]},
+            headers=self.get_auth_headers(),
+            format="json",
+        )
+
+    def test_strict(self):
+        with self.assertRaises(ResponseSerializationMismatch):
+            self._post()
+
+    def test_mismatch_counted(self):
+        counts = response_validation_counter.get_counts()
+
+        with self.settings(RESPONSE_VALIDATION_STRICT=False):
+            response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"message_ids": [0]})
+        self.assertEqual(
+            response_validation_counter.get_counts(),
+            {
+                "validated": counts["validated"] + 1,
+                "mismatched": counts["mismatched"] + 1,
+            },
+        )
+
+    def test_not_sampled(self):
+        counts = response_validation_counter.get_counts()
+
+        with self.settings(RESPONSE_VALIDATION_SAMPLE_RATE=0.0):
+            response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"message_ids": [0]})
+        self.assertEqual(response_validation_counter.get_counts(), counts)
+
+
+class ChatV1FastJSONTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.text = "line\u2028separator \u00e9"
+        Message.objects.create(
+            sender=self.user, text=self.text, thread=self.thread
+        )
+
+    def _assert_same_render(self, data):
+        # orjson is a development requirement, the fast path has to run
+        with patch.object(orjson, "dumps", wraps=orjson.dumps) as dumps:
+            self.assertEqual(
+                FastJSONRenderer().render(data), JSONRenderer().render(data)
+            )
+
+        self.assertTrue(dumps.called)
+
+    def test_render_list_responses(self):
+        for url in [
+            reverse(ChatV1ThreadListView.name),
+            reverse(ChatV1MessageListView.name, kwargs={"pk": self.thread.id}),
+        ]:
+            with self.subTest(url=url):
+                with patch.object(
+                    orjson, "dumps", wraps=orjson.dumps
+                ) as dumps:
+                    response = self.client.get(
+                        url, headers=self.get_auth_headers()
+                    )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertTrue(dumps.called)
+                self._assert_same_render(response.data)
+
+        self.assertIn(b"\\u2028", response.content)
+
+    def test_render_values(self):
+        self._assert_same_render(
+            {
+                "created_at": timezone.now(),
+                "date": timezone.now().date(),
+                "text": self.text,
+                "ids": (1, 2),
+                "nested": [{1: None, "float": 0.5}],
+            }
+        )
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_render_overflow(self):
+        data = {"big": 2**70}
+
+        with patch.object(orjson, "dumps", wraps=orjson.dumps) as dumps:
+            rendered = FastJSONRenderer().render(data)
+
+        # Integers wider than 64 bits are rendered by the stock renderer
+        self.assertTrue(dumps.called)
+        self.assertEqual(rendered, JSONRenderer().render(data))
+
+    def test_render_fallback(self):
+        data = {"created_at": timezone.now(), "text": self.text}
+
+        with patch("common.renderers.fast_json.orjson", None):
+            rendered = FastJSONRenderer().render(data)
+
+        self.assertEqual(rendered, JSONRenderer().render(data))
+
+    def test_parse(self):
+        data = {"text": self.text, "message_ids": [1, 2]}
+
+        with patch.object(orjson, "loads", wraps=orjson.loads) as loads:
+            parsed = FastJSONParser().parse(
+                io.BytesIO(JSONRenderer().render(data))
+            )
+
+        self.assertTrue(loads.called)
+        self.assertEqual(parsed, data)
+
+    def test_parse_error(self):
+        with patch.object(orjson, "loads", wraps=orjson.loads) as loads:
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(b'{"text": '))
+
+        self.assertTrue(loads.called)
+
+    def test_parse_fallback(self):
+        with patch("common.parsers.fast_json.orjson", None):
+            parsed = FastJSONParser().parse(io.BytesIO(b'{"text": "a"}'))
+
+        self.assertEqual(parsed, {"text": "a"})
+
+    def test_request_body(self):
+        response = self.client.post(
+            reverse(
+                ChatV1MessageCreateView.name, kwargs={"pk": self.thread.id}
+            ),
+            data=b'{"text": "parsed"}',
+            content_type="application/json",
+            headers=self.get_auth_headers(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["text"], "parsed")
+
+
+class ChatV1MessagePackTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        Message.objects.create(
+            sender=self.user, text="see you at the station", thread=self.thread
+        )
+        self.headers = {
+            **self.get_auth_headers(),
+            "Accept": "application/msgpack",
+        }
+
+    def test_list(self):
+        urls = [
+            reverse(ChatV1ThreadListView.name),
+            reverse(ChatV1MessageListView.name, kwargs={"pk": self.thread.id}),
+            reverse(
+                ChatV1MessageSearchView.name, kwargs={"pk": self.thread.id}
+            )
+            + "?query=station",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                json_response = self.client.get(
+                    url, headers=self.get_auth_headers()
+                )
+                response = self.client.get(url, headers=self.headers)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    response["Content-Type"], "application/msgpack"
+                )
+                self.assertEqual(
+                    msgpack.unpackb(response.content), json_response.json()
+                )
+                self.assertLess(
+                    len(response.content), len(json_response.content)
+                )
+
+    def test_etag_per_format(self):
+        url = reverse(
+            ChatV1MessageListView.name, kwargs={"pk": self.thread.id}
+        )
+        etag = self.client.get(url, headers=self.get_auth_headers())["ETag"]
+
+        response = self.client.get(
+            url, headers={**self.headers, "If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_format_query(self):
+        response = self.client.get(
+            reverse(ChatV1ThreadListView.name),
+            {"format": "msgpack"},
+            headers=self.get_auth_headers(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+
+    def test_create(self):
+        response = self.client.post(
+            reverse(
+                ChatV1MessageCreateView.name, kwargs={"pk": self.thread.id}
+            ),
+            data=msgpack.packb({"text": "parsed"}),
+            content_type="application/msgpack",
+            headers=self.headers,
+        )
+        response_data = msgpack.unpackb(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response_data["text"], "parsed")
+        self.assertEqual(
+            response_data["created_at"],
+            self.client.get(
+                reverse(
+                    ChatV1MessageListView.name, kwargs={"pk": self.thread.id}
+                ),
+                headers=self.get_auth_headers(),
+            ).json()["results"][0]["created_at"],
+        )
+
+    def test_parse_error(self):
+        response = self.client.post(
+            reverse(
+                ChatV1MessageCreateView.name, kwargs={"pk": self.thread.id}
+            ),
+            data=b"\xc1",
+            content_type="application/msgpack",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("detail", msgpack.unpackb(response.content))
+
+
+class ChatV1MessageListTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.text = "text"
+        self.message = Message.objects.create(
+            sender=self.user, text=self.text, thread=self.thread
+        )
+
+        self.params = {
+            "page": 1,
+            "page_size": 10,
+            "text": self.text,
+            "sender_id": self.user.id,
+            "ordering": ChatV1MessageListService.Orderings.CREATED_AT_DESC,
+        }
+        self.url = reverse(
+            ChatV1MessageListView.name, kwargs={"pk": self.thread.id}
+        )
+
+    def _get(self, etag: str = None):
+        headers = self.get_auth_headers()
+        if etag is not None:
+            headers["If-None-Match"] = etag
+
+        return self.client.get(
+            self.url, headers=headers, query_params=self.params
+        )
+
+    def test_time_range(self):
+        created_at = self.message.created_at
+        base_params = self.params
+        for params, count in [
+            ({"created_after": created_at}, 1),
+            ({"created_before": created_at}, 0),
+            (
+                {
+                    "created_after": created_at - timedelta(days=1),
+                    "created_before": created_at + timedelta(days=1),
+                },
+                1,
+            ),
+        ]:
+            with self.subTest(**params):
+                self.params = {**base_params, **params}
+
+                response = self._get()
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.json()["results"]), count)
+
+    def test_sparse_fields(self):
+        self.params["fields"] = "id,created_at"
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(response.json()["results"][0]), ["id", "created_at"]
+        )
+        # The sender is not joined, the text is not selected
+        page_sql = next(
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "chat_message"."id"')
+        )
+        self.assertNotIn('"auth_user"', page_sql)
+        self.assertNotIn('"chat_message"."text"', page_sql.split("FROM")[0])
+
+    def test_sparse_exclude(self):
+        self.params["exclude"] = "sender,text"
+
+        response = self._get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "id": self.message.id,
+                    "is_read": False,
+                    "created_at": self.message.created_at.isoformat().replace(
+                        "+00:00", "Z"
+                    ),
+                }
+            ],
+        )
+
+    def test_sparse_exclude_all(self):
+        self.params["exclude"] = "id,sender,text,is_read,created_at"
+
+        response = self._get()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sparse_etag(self):
+        etag = self._get()["ETag"]
+        self.params["fields"] = "id"
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [{"id": self.message.id}])
+
+    def test_not_modified(self):
+        etag = self._get()["ETag"]
+
+        with self.assertNumQueries(2):
+            response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_not_modified_weak(self):
+        etag = self._get()["ETag"]
+
+        response = self._get(f"W/{etag}")
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_modified_by_message_create(self):
+        etag = self._get()["ETag"]
+        ChatV1MessageService().create(
+            user=self.user, thread_id=self.thread.id, text=self.text
+        )
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_modified_by_message_read(self):
+        etag = self._get()["ETag"]
+        ChatV1MessageService().read(
+            user=self.another_user, message_id=self.message.id
+        )
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["results"][0]["is_read"])
+
+    def test_modified_by_message_read_many(self):
+        etag = self._get()["ETag"]
+        ChatV1MessageService().read_many(
+            user=self.another_user, message_ids=[self.message.id]
+        )
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["results"][0]["is_read"])
+
+    def test_success(self):
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=self.params,
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response_json,
+            {
+                "count": 1,
+                "count_mode": CountModes.EXACT,
+                "next": None,
+                "previous": None,
+                "results": [
+                    {
+                        "id": self.message.id,
+                        "text": self.text,
+                        "sender": {
+                            "id": self.user.id,
+                            "username": self.username,
+                        },
+                        "is_read": self.message.is_read,
+                        "created_at": self.message.created_at.strftime(
+                            "%Y-%m-%dT%H:%M:%S.%fZ"
+                        ),
+                    }
+                ],
+            },
+        )
+
+    def test_sender_id_invalid(self):
+        params = self.params.copy()
         params["sender_id"] = "invalid"
 
         response = self.client.get(
@@ -410,3 +1248,336 @@ class ChatV1MessageListTestCase(BaseAPITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_success_cursor(self):
+        params = self.params.copy()
+        params["pagination"] = PaginationModes.CURSOR
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response_json,
+            {
+                "next": None,
+                "previous": None,
+                "next_cursor": None,
+                "prev_cursor": None,
+                "results": [
+                    {
+                        "id": self.message.id,
+                        "text": self.text,
+                        "sender": {
+                            "id": self.user.id,
+                            "username": self.username,
+                        },
+                        "is_read": self.message.is_read,
+                        "created_at": self.message.created_at.strftime(
+                            "%Y-%m-%dT%H:%M:%S.%fZ"
+                        ),
+                    }
+                ],
+            },
+        )
+
+    def test_next_cursor(self):
+        Message.objects.create(
+            sender=self.user, text=self.text, thread=self.thread
+        )
+        params = self.params.copy()
+        params["pagination"] = PaginationModes.CURSOR
+        params["page_size"] = 1
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+        response_json = response.json()
+        next_response = self.client.get(
+            response_json["next"], headers=self.get_auth_headers()
+        )
+        next_response_json = next_response.json()
+
+        self.assertEqual(next_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in next_response_json["results"]],
+            [self.message.id],
+        )
+        self.assertIsNone(next_response_json["next_cursor"])
+        self.assertIsNotNone(next_response_json["prev_cursor"])
+
+    def test_invalid_cursor(self):
+        params = self.params.copy()
+        params["cursor"] = "invalid"
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_count_none(self):
+        Message.objects.create(
+            sender=self.user, text=self.text, thread=self.thread
+        )
+        params = self.params.copy()
+        params["count"] = CountModes.NONE
+        params["page_size"] = 1
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response_json["count"])
+        self.assertEqual(response_json["count_mode"], CountModes.NONE)
+        self.assertIsNotNone(response_json["next"])
+        self.assertIsNone(response_json["previous"])
+
+    def test_invalid_count(self):
+        params = self.params.copy()
+        params["count"] = "invalid"
+
+        response = self.client.get(
+            self.url,
+            headers=self.get_auth_headers(),
+            query_params=params,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ChatV1MessageSearchTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(self.user, through_defaults={})
+        self.message = Message.objects.create(
+            sender=self.user, text="see you at the station", thread=self.thread
+        )
+        self.url = reverse(
+            ChatV1MessageSearchView.name, kwargs={"pk": self.thread.id}
+        )
+
+    def test_success(self):
+        response = self.client.get(
+            self.url, {"query": "stations"}, headers=self.get_auth_headers()
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response_json["next"], None)
+        self.assertEqual(response_json["previous"], None)
+        self.assertEqual(len(response_json["results"]), 1)
+        result = response_json["results"][0]
+        self.assertEqual(result["id"], self.message.id)
+        self.assertEqual(result["headline"], "see you at the <b>station</b>")
+        self.assertGreater(result["rank"], 0)
+
+    def test_no_query(self):
+        response = self.client.get(self.url, headers=self.get_auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            self.url,
+            {"query": "station", "cursor": "invalid"},
+            headers=self.get_auth_headers(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_not_authenticated(self):
+        response = self.client.get(self.url, {"query": "station"})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ChatV1MessageThreadSearchTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.message = Message.objects.create(
+            sender=self.another_user, text="deployment", thread=self.thread
+        )
+        self.url = reverse(ChatV1MessageThreadSearchView.name)
+
+    def test_success(self):
+        response = self.client.get(
+            self.url, {"query": "deployment"}, headers=self.get_auth_headers()
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response_json,
+            {
+                "results": [
+                    {
+                        "id": self.thread.id,
+                        "participants": [
+                            {
+                                "id": self.another_user.id,
+                                "username": self.another_user.username,
+                            },
+                            {
+                                "id": self.user.id,
+                                "username": self.username,
+                            },
+                        ],
+                        "similarity": 1.0,
+                        "hits": [
+                            {
+                                "id": self.message.id,
+                                "text": self.message.text,
+                                "similarity": 1.0,
+                                "sender": {
+                                    "id": self.another_user.id,
+                                    "username": self.another_user.username,
+                                },
+                                "is_read": False,
+                                "created_at": self.message.created_at.strftime(
+                                    "%Y-%m-%dT%H:%M:%S.%fZ"
+                                ),
+                            }
+                        ],
+                    }
+                ]
+            },
+        )
+
+    def test_query_too_short(self):
+        response = self.client.get(
+            self.url, {"query": "de"}, headers=self.get_auth_headers()
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_not_authenticated(self):
+        response = self.client.get(self.url, {"query": "deployment"})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ChatV1MessageWaitTestCase(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.message = Message.objects.create(
+            sender=self.another_user, text="first", thread=self.thread
+        )
+        self.url = reverse(
+            ChatV1MessageWaitView.name, kwargs={"pk": self.thread.id}
+        )
+        self.headers = self.get_auth_headers()
+
+    def _create_message(self, text: str) -> Message:
+        with self.captureOnCommitCallbacks(execute=True):
+            return ChatV1MessageService().create(
+                user=self.another_user, thread_id=self.thread.id, text=text
+            )
+
+    async def _create_message_later(self, text: str) -> Message:
+        await asyncio.sleep(0.2)
+        return await sync_to_async(self._create_message)(text)
+
+    async def test_timeout(self):
+        response = await self.async_client.get(
+            self.url, {"timeout": 0}, headers=self.headers
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response_json["results"], [])
+        self.assertIsNotNone(response_json["cursor"])
+
+    async def test_newer_messages(self):
+        response = await self.async_client.get(
+            self.url, {"timeout": 0}, headers=self.headers
+        )
+        cursor = response.json()["cursor"]
+        message = await sync_to_async(self._create_message)("second")
+
+        response = await self.async_client.get(
+            self.url, {"after": cursor, "timeout": 10}, headers=self.headers
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in response_json["results"]],
+            [message.id],
+        )
+        self.assertNotEqual(response_json["cursor"], cursor)
+
+    async def test_wake_up(self):
+        response = await self.async_client.get(
+            self.url, {"timeout": 0}, headers=self.headers
+        )
+        cursor = response.json()["cursor"]
+
+        response, message = await asyncio.gather(
+            self.async_client.get(
+                self.url,
+                {"after": cursor, "timeout": 10},
+                headers=self.headers,
+            ),
+            self._create_message_later("second"),
+        )
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in response_json["results"]],
+            [message.id],
+        )
+        self.assertEqual(
+            response_json["results"][0]["sender"],
+            {
+                "id": self.another_user.id,
+                "username": self.another_user.username,
+            },
+        )
+
+    async def test_not_participant(self):
+        thread = await Thread.objects.acreate()
+        url = reverse(ChatV1MessageWaitView.name, kwargs={"pk": thread.id})
+
+        response = await self.async_client.get(
+            url, {"timeout": 0}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_invalid_cursor(self):
+        response = await self.async_client.get(
+            self.url, {"after": "invalid"}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_not_authenticated(self):
+        response = await self.async_client.get(self.url, {"timeout": 0})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
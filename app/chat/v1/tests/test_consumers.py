@@ -0,0 +1,297 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from chat.models import Thread, Message
+from chat.v1.services import ChatV1MessageService
+from common.base.tests import (
+    BaseTestCase,
+    BaseTransactionTestCase,
+    WebSocketCommunicator,
+)
+from common.events import (
+    event_hub,
+    get_event_broker,
+    PostgresEventBroker,
+    PostgresEventListener,
+)
+from core.asgi import application
+
+
+# Consumers manage their own database connections like Django does
+# around requests, so tests can not be wrapped into a transaction
+class ChatV1EventsConsumerTestCase(BaseTransactionTestCase):
+    path = "/chat/v1/events/"
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(username="john_doe")
+        self.another_user = user_model.objects.create_user(
+            username="another_john_doe"
+        )
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.message = Message.objects.create(
+            sender=self.another_user, text="text", thread=self.thread
+        )
+        self.service = ChatV1MessageService()
+
+    def get_access_token(self) -> str:
+        return str(RefreshToken.for_user(self.user).access_token)
+
+    def get_communicator(self) -> WebSocketCommunicator:
+        return WebSocketCommunicator(
+            application,
+            self.path,
+            query_string=f"token={self.get_access_token()}",
+        )
+
+    def _create_message(self):
+        return self.service.create(
+            user=self.another_user, thread_id=self.thread.id, text="hi"
+        )
+
+    def _read_message(self):
+        return self.service.read(user=self.user, message_id=self.message.id)
+
+    async def test_message_created(self):
+        communicator = self.get_communicator()
+        response = await communicator.connect()
+
+        message = await sync_to_async(self._create_message)()
+        event = await communicator.receive_json()
+        await communicator.disconnect()
+
+        self.assertEqual(response, {"type": "websocket.accept"})
+        self.assertEqual(
+            event,
+            {
+                "type": "message.created",
+                "thread_id": self.thread.id,
+                "message": {
+                    "id": message.id,
+                    "text": "hi",
+                    "sender": {
+                        "id": self.another_user.id,
+                        "username": self.another_user.username,
+                    },
+                    "is_read": False,
+                    "created_at": message.created_at.strftime(
+                        "%Y-%m-%dT%H:%M:%S.%fZ"
+                    ),
+                },
+            },
+        )
+        self.assertEqual(event_hub.get_subscription_count(), 0)
+
+    async def test_message_read(self):
+        communicator = self.get_communicator()
+        await communicator.connect()
+
+        await sync_to_async(self._read_message)()
+        event = await communicator.receive_json()
+        await communicator.disconnect()
+
+        self.assertEqual(
+            event,
+            {
+                "type": "message.read",
+                "thread_id": self.thread.id,
+                "message_ids": [self.message.id],
+                "reader_id": self.user.id,
+            },
+        )
+
+    async def test_not_participant(self):
+        self.user = await get_user_model().objects.acreate(username="third")
+        communicator = self.get_communicator()
+        await communicator.connect()
+
+        await sync_to_async(self._create_message)()
+        await communicator.disconnect()
+
+        self.assertFalse(communicator.has_output())
+
+    async def test_overflow(self):
+        communicator = self.get_communicator()
+        with self.settings(EVENTS_SUBSCRIPTION_MAX_SIZE=1):
+            await communicator.connect()
+
+        for i in range(3):
+            event_hub.publish({self.user.id}, {"type": "test", "id": i})
+        event = await communicator.receive_json()
+        response = await communicator.receive()
+        await communicator.disconnect()
+
+        self.assertEqual(event, {"type": "test", "id": 0})
+        self.assertEqual(response, {"type": "websocket.close", "code": 1013})
+
+    async def test_not_authenticated(self):
+        communicator = WebSocketCommunicator(application, self.path)
+
+        response = await communicator.connect()
+
+        self.assertEqual(response, {"type": "websocket.close", "code": 4401})
+
+    async def test_invalid_token(self):
+        communicator = WebSocketCommunicator(
+            application, self.path, query_string="token=invalid"
+        )
+
+        response = await communicator.connect()
+
+        self.assertEqual(response, {"type": "websocket.close", "code": 4401})
+
+    async def test_not_found(self):
+        communicator = WebSocketCommunicator(application, "/unknown/")
+
+        response = await communicator.connect()
+
+        self.assertEqual(response, {"type": "websocket.close", "code": 4404})
+
+
+class ChatV1EventsConsumerPostgresTestCase(BaseTransactionTestCase):
+    path = "/chat/v1/events/"
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.broker_override = self.settings(EVENTS_BROKER="postgres")
+        self.broker_override.enable()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(username="john_doe")
+        self.another_user = user_model.objects.create_user(
+            username="another_john_doe"
+        )
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.service = ChatV1MessageService()
+        self.broker = get_event_broker()
+
+    def tearDown(self) -> None:
+        self.broker.listener.stop()
+        self.broker_override.disable()
+
+        super().tearDown()
+
+    async def test_message_created(self):
+        communicator = WebSocketCommunicator(
+            application,
+            self.path,
+            query_string=(
+                f"token={RefreshToken.for_user(self.user).access_token}"
+            ),
+        )
+        await communicator.connect()
+        await sync_to_async(self.broker.listener.ready.wait)(5)
+
+        message = await sync_to_async(self.service.create)(
+            user=self.another_user, thread_id=self.thread.id, text="hi"
+        )
+        event = await communicator.receive_json()
+        await communicator.disconnect()
+
+        self.assertEqual(event["type"], "message.created")
+        self.assertEqual(event["message"]["id"], message.id)
+
+
+class PostgresEventBrokerTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.broker = PostgresEventBroker()
+
+    def test_batched(self):
+        envelopes = [({1, 2}, {"type": "test", "id": i}) for i in range(3)]
+
+        with self.settings(EVENTS_NOTIFY_PAYLOAD_MAX_SIZE=100):
+            payloads = self.broker.get_payloads(envelopes)
+
+        self.assertEqual(
+            [json.loads(payload) for payload in payloads],
+            [
+                [
+                    {"u": [1, 2], "e": {"type": "test", "id": 0}},
+                    {"u": [1, 2], "e": {"type": "test", "id": 1}},
+                ],
+                [{"u": [1, 2], "e": {"type": "test", "id": 2}}],
+            ],
+        )
+        self.assertTrue(all(len(payload) <= 100 for payload in payloads))
+
+    def test_user_ids_split(self):
+        envelopes = [(set(range(1, 41)), {"type": "test"})]
+
+        with self.settings(EVENTS_NOTIFY_PAYLOAD_MAX_SIZE=100):
+            payloads = self.broker.get_payloads(envelopes)
+
+        user_ids = [
+            user_id
+            for payload in payloads
+            for envelope in json.loads(payload)
+            for user_id in envelope["u"]
+        ]
+        self.assertEqual(user_ids, list(range(1, 41)))
+        self.assertTrue(all(len(payload) <= 100 for payload in payloads))
+
+    def test_truncated(self):
+        event = {
+            "type": "test",
+            "thread_id": 1,
+            "message": {"text": "a" * 200},
+        }
+
+        with self.settings(EVENTS_NOTIFY_PAYLOAD_MAX_SIZE=100):
+            payloads = self.broker.get_payloads([({1}, event)])
+
+        self.assertEqual(
+            [json.loads(payload) for payload in payloads],
+            [
+                [
+                    {
+                        "u": [1],
+                        "e": {
+                            "type": "test",
+                            "thread_id": 1,
+                            "truncated": True,
+                        },
+                    }
+                ]
+            ],
+        )
+
+    def test_no_recipients(self):
+        payloads = self.broker.get_payloads([(set(), {"type": "test"})])
+
+        self.assertEqual(payloads, [])
+
+
+class PostgresEventListenerTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.listener = PostgresEventListener()
+
+    async def test_dispatch_invalid(self):
+        subscription = event_hub.subscribe(1)
+        self.addCleanup(event_hub.unsubscribe, subscription)
+
+        for payload in ["invalid", "[1]", '[{"u": [1]}]']:
+            self.listener._dispatch(payload)
+        self.listener._dispatch(
+            json.dumps([{"u": [1], "e": {"type": "test"}}])
+        )
+        event = await asyncio.wait_for(subscription.get(), 1)
+
+        self.assertEqual(event, {"type": "test"})
@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils.timezone import now
+
+from chat.models import Message, Thread
+from chat.v1.serializers import (
+    ChatV1MessageListResponseSerializer,
+    ChatV1MessageListValuesSerializer,
+    ChatV1ThreadListResponseSerializer,
+    ChatV1ThreadListValuesSerializer,
+)
+from chat.v1.services import (
+    ChatV1MessageListService,
+    ChatV1MessageService,
+    ChatV1ThreadListService,
+)
+from common.base.tests import BaseTestCase
+from common.pagination import PaginationModes
+
+
+class ChatV1ValuesSerializerTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create(username="john_doe")
+        self.users = [
+            user_model.objects.create(username=username)
+            for username in ["zed", "alice", "bob"]
+        ]
+
+        self.threads = []
+        for i, another_user in enumerate(self.users):
+            thread = Thread.objects.create(
+                created_at=now() - timedelta(days=i)
+            )
+            thread.participants.add(
+                self.user, another_user, through_defaults={}
+            )
+            self.threads.append(thread)
+
+        self.thread = self.threads[0]
+        created_at = now().replace(microsecond=0)
+        for i in range(5):
+            Message.objects.create(
+                thread=self.thread,
+                sender=self.users[0] if i % 2 else self.user,
+                text=f"message {i}",
+                is_read=i < 2,
+                created_at=created_at + timedelta(seconds=i),
+            )
+        Message.objects.create(
+            thread=self.thread,
+            sender=self.user,
+            text="",
+            created_at=created_at + timedelta(microseconds=1),
+        )
+        ChatV1MessageService().create(
+            user=self.users[1], thread_id=self.threads[1].id, text="hi"
+        )
+
+    def _assert_equivalent(
+        self, list_, kwargs, serializer_class, values_serializer_class
+    ):
+        expected = list_(**kwargs)
+        result = list_(values=values_serializer_class.get_values(), **kwargs)
+
+        values_serializer = values_serializer_class()
+        self.assertEqual(
+            [
+                values_serializer.to_representation(r)
+                for r in result["results"]
+            ],
+            [serializer_class(instance=r).data for r in expected["results"]],
+        )
+        self.assertEqual(
+            {k: v for k, v in result.items() if k != "results"},
+            {k: v for k, v in expected.items() if k != "results"},
+        )
+
+    def test_message_list(self):
+        service = ChatV1MessageListService()
+
+        for kwargs in [
+            {},
+            {"page": 2, "page_size": 2},
+            {"ordering": service.Orderings.CREATED_AT_ASC},
+            {"sender_id": self.user.id},
+            {"pagination": PaginationModes.CURSOR, "page_size": 2},
+        ]:
+            with self.subTest(**kwargs):
+                self._assert_equivalent(
+                    service.list,
+                    {"user": self.user, "thread_id": self.thread.id, **kwargs},
+                    ChatV1MessageListResponseSerializer,
+                    ChatV1MessageListValuesSerializer,
+                )
+
+    def test_thread_list(self):
+        service = ChatV1ThreadListService()
+
+        for kwargs in [
+            {},
+            {"page": 2, "page_size": 2},
+            {"ordering": service.Orderings.LAST_MESSAGE_SENT_AT_DESC},
+            {"participant_ids": [self.users[1].id]},
+            {"pagination": PaginationModes.CURSOR, "page_size": 2},
+        ]:
+            with self.subTest(**kwargs):
+                self._assert_equivalent(
+                    service.list,
+                    {"user": self.user, **kwargs},
+                    ChatV1ThreadListResponseSerializer,
+                    ChatV1ThreadListValuesSerializer,
+                )
+
+    def test_thread_list_queries(self):
+        service = ChatV1ThreadListService()
+
+        # Page, participants, count and unread count
+        with self.assertNumQueries(4):
+            service.list(
+                user=self.user,
+                values=ChatV1ThreadListValuesSerializer.get_values(),
+            )
@@ -1,16 +1,33 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from threading import Barrier
+from unittest.mock import patch
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
 from rest_framework.exceptions import NotFound
 
-from chat.models import Thread, Message
+from chat.models import Thread, ThreadUser, Message
 from chat.v1.services import (
     ChatV1ThreadService,
     ChatV1ThreadListService,
     ChatV1MessageService,
     ChatV1MessageListService,
+    ChatV1MessageSearchService,
+    ChatV1MessageWaitService,
+    ChatV1MessagePartitionService,
 )
-from common.base.tests import BaseTestCase
+from chat.v1.services.event import ChatV1EventService
+from common.base.tests import BaseTestCase, BaseTransactionTestCase
+from common.events import event_hub
+from common.pagination import PaginationModes, CountModes
+from common.pagination.count import PaginationCountService
+from common.pagination.cursor_pagination import CursorPaginationService
+from common.pagination.exceptions import InvalidCursorException
 
 
 class ChatV1ThreadServiceUpsertTestCase(BaseTestCase):
@@ -27,7 +44,11 @@ class ChatV1ThreadServiceUpsertTestCase(BaseTestCase):
         self.service = ChatV1ThreadService()
 
     def test_success_retrieved(self):
-        thread = Thread.objects.create()
+        thread = Thread.objects.create(
+            participants_key=Thread.get_participants_key(
+                [self.user.id, self.another_user.id]
+            )
+        )
         thread.participants.add(
             self.user, self.another_user, through_defaults={}
         )
@@ -49,6 +70,38 @@ class ChatV1ThreadServiceUpsertTestCase(BaseTestCase):
         self.assertEqual(result_db, result)
         self.assertIn(self.user, result_db.participants.all())
         self.assertIn(self.another_user, result_db.participants.all())
+        self.assertEqual(
+            result_db.participants_key,
+            Thread.get_participants_key([self.another_user.id, self.user.id]),
+        )
+
+    def test_not_matched_by_participant_subset(self):
+        third_user = get_user_model().objects.create(username="third")
+        participants = [self.user, self.another_user, third_user]
+        thread = Thread.objects.create(
+            participants_key=Thread.get_participants_key(
+                [participant.id for participant in participants]
+            )
+        )
+        thread.participants.add(*participants, through_defaults={})
+
+        result = self.service.upsert(
+            user=self.user, participant_id=self.another_user.id
+        )
+
+        self.assertEqual(Thread.objects.count(), 2)
+        self.assertNotEqual(result, thread)
+
+    def test_query_count(self):
+        self.service.upsert(
+            user=self.user, participant_id=self.another_user.id
+        )
+
+        # Savepoint, user, thread, prefetched participants and release
+        with self.assertNumQueries(5):
+            self.service.upsert(
+                user=self.user, participant_id=self.another_user.id
+            )
 
     def test_no_another_user(self):
         self.another_user.delete()
@@ -63,6 +116,130 @@ class ChatV1ThreadServiceUpsertTestCase(BaseTestCase):
             self.service.upsert(user=self.user, participant_id=self.user.id)
 
 
+class ChatV1ThreadServiceUpsertConcurrencyTestCase(BaseTransactionTestCase):
+    callers = 64
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.users = [
+            user_model.objects.create(username=f"john_doe_{i}")
+            for i in range(4)
+        ]
+        self.service = ChatV1ThreadService()
+
+    def _upsert(self, barrier: Barrier, user, participant) -> int:
+        barrier.wait()
+        try:
+            return self.service.upsert(
+                user=user, participant_id=participant.id
+            ).id
+        finally:
+            connection.close()
+
+    def test_one_thread_per_pair(self):
+        pairs = [
+            (self.users[0], self.users[1]),
+            (self.users[1], self.users[0]),
+            (self.users[2], self.users[3]),
+            (self.users[3], self.users[2]),
+        ]
+        barrier = Barrier(self.callers)
+
+        with ThreadPoolExecutor(max_workers=self.callers) as executor:
+            futures = [
+                executor.submit(self._upsert, barrier, *pairs[i % len(pairs)])
+                for i in range(self.callers)
+            ]
+            thread_ids = [future.result() for future in futures]
+
+        self.assertEqual(Thread.objects.count(), 2)
+        self.assertEqual(ThreadUser.objects.count(), 4)
+        first_pair_ids = {
+            thread_id
+            for i, thread_id in enumerate(thread_ids)
+            if i % len(pairs) < 2
+        }
+        second_pair_ids = set(thread_ids) - first_pair_ids
+        self.assertEqual(len(first_pair_ids), 1)
+        self.assertEqual(len(second_pair_ids), 1)
+
+
+class ChatV1ThreadServiceBulkUpsertTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="john_doe",
+        )
+        self.another_users = [
+            user_model.objects.create(username=f"another_john_doe_{i}")
+            for i in range(3)
+        ]
+        self.service = ChatV1ThreadService()
+
+        self.thread = self.service.upsert(
+            user=self.user, participant_id=self.another_users[1].id
+        )
+
+    def test_success(self):
+        participant_ids = [user.id for user in self.another_users]
+
+        result = self.service.bulk_upsert(
+            user=self.user, participant_ids=participant_ids
+        )
+
+        self.assertEqual(Thread.objects.count(), 3)
+        self.assertEqual(ThreadUser.objects.count(), 6)
+        self.assertEqual(result[1], self.thread)
+        for thread, another_user in zip(result, self.another_users):
+            self.assertEqual(
+                list(thread.participants.all()), [another_user, self.user]
+            )
+            self.assertEqual(
+                thread,
+                self.service.upsert(
+                    user=another_user, participant_id=self.user.id
+                ),
+            )
+
+    def test_duplicated_participant_ids(self):
+        result = self.service.bulk_upsert(
+            user=self.user,
+            participant_ids=[self.another_users[0].id] * 2,
+        )
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(Thread.objects.count(), 2)
+
+    def test_no_another_user(self):
+        with self.assertRaises(NotFound):
+            self.service.bulk_upsert(
+                user=self.user,
+                participant_ids=[self.another_users[0].id, 0],
+            )
+
+        self.assertEqual(Thread.objects.count(), 1)
+
+    def test_thread_with_self(self):
+        with self.assertRaises(NotFound):
+            self.service.bulk_upsert(
+                user=self.user, participant_ids=[self.user.id]
+            )
+
+    def test_query_count(self):
+        participant_ids = [user.id for user in self.another_users]
+
+        # Savepoint, users, threads, thread insert, participants insert,
+        # threads, prefetched participants and release
+        with self.assertNumQueries(8):
+            self.service.bulk_upsert(
+                user=self.user, participant_ids=participant_ids
+            )
+
+
 class ChatV1ThreadServiceRemoveTestCase(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -94,6 +271,212 @@ class ChatV1ThreadServiceRemoveTestCase(BaseTestCase):
             self.service.delete(user=self.user, thread_id=self.thread.id)
 
 
+class ChatV1ThreadServiceBackfillLastMessagesTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="john_doe",
+        )
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(self.user, through_defaults={})
+        self.empty_thread = Thread.objects.create()
+        self.empty_thread.participants.add(self.user, through_defaults={})
+
+        self.message = Message.objects.create(
+            text="text",
+            sender=self.user,
+            thread=self.thread,
+            created_at=now() + timedelta(minutes=5),
+        )
+        Message.objects.create(
+            text="text", sender=self.user, thread=self.thread
+        )
+        self.service = ChatV1ThreadService()
+
+    def test_success(self):
+        result = self.service.backfill_last_messages()
+        self.thread.refresh_from_db()
+        self.empty_thread.refresh_from_db()
+
+        self.assertEqual(result, 2)
+        self.assertEqual(self.thread.last_message, self.message)
+        self.assertEqual(
+            self.thread.last_message_sent_at, self.message.created_at
+        )
+        self.assertIsNone(self.empty_thread.last_message)
+        self.assertIsNone(self.empty_thread.last_message_sent_at)
+
+    def test_thread_ids(self):
+        result = self.service.backfill_last_messages(
+            thread_ids=[self.empty_thread.id]
+        )
+        self.thread.refresh_from_db()
+
+        self.assertEqual(result, 1)
+        self.assertIsNone(self.thread.last_message)
+
+
+class ChatV1ThreadServiceReconcileUnreadCountsTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="john_doe",
+        )
+        self.another_user = user_model.objects.create(
+            username="another_john_doe",
+        )
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+
+        Message.objects.create(
+            text="text", sender=self.another_user, thread=self.thread
+        )
+        Message.objects.create(
+            text="text", sender=self.another_user, thread=self.thread
+        )
+        Message.objects.create(
+            text="text",
+            sender=self.another_user,
+            thread=self.thread,
+            is_read=True,
+        )
+        Message.objects.create(
+            text="text", sender=self.user, thread=self.thread
+        )
+        ThreadUser.objects.update(unread_count=10)
+        self.service = ChatV1ThreadService()
+
+    def test_success(self):
+        result = self.service.reconcile_unread_counts()
+
+        self.assertEqual(result, 2)
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            2,
+        )
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.another_user
+            ).unread_count,
+            1,
+        )
+
+    def test_thread_ids(self):
+        result = self.service.reconcile_unread_counts(thread_ids=[])
+
+        self.assertEqual(result, 0)
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            10,
+        )
+
+
+class ChatV1ThreadServiceReadTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="john_doe",
+        )
+        self.another_user = user_model.objects.create(
+            username="another_john_doe",
+        )
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+
+        self.message_service = ChatV1MessageService()
+        self.messages = [
+            self.message_service.create(
+                user=self.another_user, thread_id=self.thread.id, text="text"
+            )
+            for _ in range(3)
+        ]
+        self.service = ChatV1ThreadService()
+
+    def test_success(self):
+        result = self.service.read(user=self.user, thread_id=self.thread.id)
+
+        self.assertEqual(result.last_read_message_id, self.messages[-1].id)
+        self.assertEqual(result.unread_count, 0)
+
+    def test_up_to_message(self):
+        result = self.service.read(
+            user=self.user,
+            thread_id=self.thread.id,
+            message_id=self.messages[0].id,
+        )
+
+        self.assertEqual(result.last_read_message_id, self.messages[0].id)
+        self.assertEqual(result.unread_count, 2)
+
+    def test_clamped_to_last_message(self):
+        result = self.service.read(
+            user=self.user,
+            thread_id=self.thread.id,
+            message_id=self.messages[-1].id + 100,
+        )
+
+        self.assertEqual(result.last_read_message_id, self.messages[-1].id)
+
+    def test_not_moved_backwards(self):
+        self.service.read(user=self.user, thread_id=self.thread.id)
+
+        result = self.service.read(
+            user=self.user,
+            thread_id=self.thread.id,
+            message_id=self.messages[0].id,
+        )
+
+        self.assertEqual(result.last_read_message_id, self.messages[-1].id)
+        self.assertEqual(result.unread_count, 0)
+
+    def test_counters_after_read(self):
+        self.service.read(
+            user=self.user,
+            thread_id=self.thread.id,
+            message_id=self.messages[1].id,
+        )
+        # Already below the watermark, the counter is kept
+        self.message_service.read(
+            user=self.user, message_id=self.messages[0].id
+        )
+        self.message_service.create(
+            user=self.another_user, thread_id=self.thread.id, text="text"
+        )
+
+        thread_user = ThreadUser.objects.get(
+            thread=self.thread, user=self.user
+        )
+        self.assertEqual(thread_user.unread_count, 2)
+
+        self.service.reconcile_unread_counts()
+        thread_user.refresh_from_db()
+        self.assertEqual(thread_user.unread_count, 2)
+
+    def test_not_participant(self):
+        self.thread.participants.remove(self.user)
+
+        with self.assertRaises(NotFound):
+            self.service.read(user=self.user, thread_id=self.thread.id)
+
+    def test_not_exist(self):
+        with self.assertRaises(NotFound):
+            self.service.read(user=self.user, thread_id=self.thread.id + 1)
+
+
 class ChatV1ThreadListServiceTestCase(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -130,6 +513,8 @@ class ChatV1ThreadListServiceTestCase(BaseTestCase):
             sender=self.user,
             thread=self.another_thread,
         )
+        ChatV1ThreadService().backfill_last_messages()
+        ChatV1ThreadService().reconcile_unread_counts()
 
     def test_defaults(self):
         result = self.service.list(
@@ -146,6 +531,28 @@ class ChatV1ThreadListServiceTestCase(BaseTestCase):
         self.assertEqual(result["count"], 2)
         self.assertEqual(result["count_unread"], 1)
 
+    async def test_alist(self):
+        for kwargs in [
+            {},
+            {"participant_ids": [self.another_user.id]},
+            {"page_size": 1, "count": CountModes.CAPPED},
+            {"count": CountModes.ESTIMATED},
+            {"count": CountModes.NONE},
+            {"pagination": PaginationModes.CURSOR, "page_size": 1},
+        ]:
+            with self.subTest(**kwargs):
+                expected = await sync_to_async(self.service.list)(
+                    user=self.user, **kwargs
+                )
+                result = await self.service.alist(user=self.user, **kwargs)
+
+                self.assertEqual(result, expected)
+                # Participants are prefetched, no lazy queries in async code
+                self.assertEqual(
+                    [list(t.participants.all()) for t in result["results"]],
+                    [list(t.participants.all()) for t in expected["results"]],
+                )
+
     def test_filter_by_participant(self):
         result = self.service.list(
             user=self.user, participant_ids=[self.another_user.id]
@@ -160,6 +567,24 @@ class ChatV1ThreadListServiceTestCase(BaseTestCase):
         self.assertEqual(result["count"], 1)
         self.assertEqual(result["count_unread"], 1)
 
+    def test_unread_count(self):
+        result = self.service.list(user=self.user)
+
+        self.assertEqual(
+            [thread.unread_count for thread in result["results"]], [0, 1]
+        )
+
+    def test_unread_count_query_count(self):
+        for _ in range(5):
+            thread = Thread.objects.create()
+            thread.participants.add(self.user, through_defaults={})
+
+        with self.assertNumQueries(4):
+            self.service.list(user=self.user, page_size=1)
+
+        with self.assertNumQueries(4):
+            self.service.list(user=self.user, page_size=7)
+
     def test_order_by_created_at_asc(self):
         result = self.service.list(
             user=self.user, ordering=self.service.Orderings.CREATED_AT_ASC
@@ -256,6 +681,7 @@ class ChatV1ThreadListServiceTestCase(BaseTestCase):
             minutes=5
         )
         self.message.save()
+        ChatV1ThreadService().backfill_last_messages()
 
         result = self.service.list(
             user=self.user,
@@ -273,88 +699,493 @@ class ChatV1ThreadListServiceTestCase(BaseTestCase):
         self.assertEqual(result["count_unread"], 1)
 
 
-class ChatV1MessageServiceCreateTestCase(BaseTestCase):
+class ChatV1ThreadListServiceCacheTestCase(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
 
         user_model = get_user_model()
 
-        self.service = ChatV1MessageService()
-        self.user = user_model.objects.create(
-            username="john_doe",
-        )
+        self.service = ChatV1ThreadListService()
+        self.user = user_model.objects.create(username="john_doe")
         self.another_user = user_model.objects.create(
-            username="another_john_doe",
+            username="another_john_doe"
         )
+        self.different_user = user_model.objects.create(username="dave")
 
         self.thread = Thread.objects.create()
         self.thread.participants.add(
             self.user, self.another_user, through_defaults={}
         )
-        self.text = "text"
-
-    def test_success(self):
-        result = self.service.create(
-            user=self.user, thread_id=self.thread.id, text=self.text
+        self.another_thread = Thread.objects.create()
+        self.another_thread.participants.add(
+            self.another_user, self.different_user, through_defaults={}
+        )
+        self.message = Message.objects.create(
+            text="text", sender=self.another_user, thread=self.thread
         )
-        result_db = Message.objects.get()
-
-        self.assertEqual(result, result_db)
-        self.assertEqual(result_db.sender, self.user)
-        self.assertEqual(result_db.thread, self.thread)
-        self.assertEqual(result_db.text, self.text)
 
-    def test_thread_not_exist(self):
-        thread_id = self.thread.id
-        self.thread.delete()
+    def _assert_cached(self, user):
+        expected = self.service.list(user=user)
 
-        with self.assertRaises(NotFound):
-            self.service.create(
-                user=self.user, thread_id=thread_id, text=self.text
-            )
+        with self.assertNumQueries(0):
+            result = self.service.list(user=user)
 
-    def test_not_participant(self):
-        self.thread.participants.remove(self.user)
+        self.assertEqual(result, expected)
 
-        with self.assertRaises(NotFound):
-            self.service.create(
-                user=self.user, thread_id=self.thread.id, text=self.text
-            )
+    def _assert_not_cached(self, user):
+        with CaptureQueriesContext(connection) as queries:
+            self.service.list(user=user)
 
+        self.assertTrue(queries.captured_queries)
 
-class ChatV1MessageServiceReadTestCase(BaseTestCase):
-    def setUp(self) -> None:
-        super().setUp()
+    def test_cached(self):
+        self.service.list(user=self.user)
 
-        user_model = get_user_model()
+        with self.assertNumQueries(0):
+            result = self.service.list(user=self.user)
 
-        self.service = ChatV1MessageService()
-        self.user = user_model.objects.create(
-            username="john_doe",
-        )
-        self.another_user = user_model.objects.create(
-            username="another_john_doe",
+        self.assertEqual(result["results"], [self.thread])
+        self.assertEqual(
+            list(result["results"][0].participants.all()),
+            [self.another_user, self.user],
         )
 
-        self.thread = Thread.objects.create()
-        self.thread.participants.add(
-            self.user, self.another_user, through_defaults={}
-        )
-        self.message = Message.objects.create(
-            thread=self.thread,
-            sender=self.another_user,
-            text="text",
-            is_read=False,
+    def test_disabled(self):
+        with self.settings(THREAD_LIST_CACHE_ENABLED=False):
+            self.service.list(user=self.user)
+            self._assert_not_cached(self.user)
+
+            with self.captureOnCommitCallbacks() as callbacks:
+                ChatV1MessageService().create(
+                    user=self.user, thread_id=self.thread.id, text="text"
+                )
+
+        # No invalidation is scheduled
+        self.assertFalse(
+            [
+                callback
+                for callback in callbacks
+                if getattr(callback, "func", callback).__name__.startswith(
+                    "_invalidate"
+                )
+            ]
         )
 
-    def test_success(self):
-        result = self.service.read(user=self.user, message_id=self.message.id)
-        result_db = Message.objects.get()
+    def test_cached_by_params(self):
+        self.service.list(user=self.user)
 
-        self.assertEqual(result, result_db)
-        self.assertEqual(result_db.is_read, True)
+        self._assert_not_cached(self.another_user)
+        with self.assertNumQueries(4):
+            self.service.list(user=self.user, page_size=1)
 
-    def test_not_exist(self):
+    async def test_acached(self):
+        expected = await self.service.alist(user=self.user)
+        result = await self.service.alist(user=self.user)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            await sync_to_async(self.service.list)(user=self.user), expected
+        )
+
+    def test_only_own_threads(self):
+        result = self.service.list(user=self.user)
+
+        self.assertEqual(result["results"], [self.thread])
+        self.assertEqual(result["count"], 1)
+
+    def test_invalidated_on_message_create(self):
+        for user in [self.user, self.another_user, self.different_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1MessageService().create(
+                user=self.user, thread_id=self.thread.id, text="text"
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_not_cached(self.another_user)
+        self._assert_cached(self.different_user)
+
+    def test_invalidated_on_message_read(self):
+        for user in [self.user, self.another_user, self.different_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1MessageService().read(
+                user=self.user, message_id=self.message.id
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_not_cached(self.another_user)
+        self._assert_cached(self.different_user)
+
+    def test_invalidated_on_message_read_many(self):
+        for user in [self.user, self.another_user, self.different_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1MessageService().read_many(
+                user=self.user, message_ids=[self.message.id]
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_not_cached(self.another_user)
+        self._assert_cached(self.different_user)
+
+    def test_invalidated_on_thread_read(self):
+        for user in [self.user, self.another_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1ThreadService().read(
+                user=self.user, thread_id=self.thread.id
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_cached(self.another_user)
+
+    def test_invalidated_on_thread_upsert(self):
+        for user in [self.user, self.another_user, self.different_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1ThreadService().upsert(
+                user=self.user, participant_id=self.different_user.id
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_not_cached(self.different_user)
+        self._assert_cached(self.another_user)
+
+    def test_not_invalidated_on_existing_thread_upsert(self):
+        Thread.objects.filter(id=self.thread.id).update(
+            participants_key=Thread.get_participants_key(
+                [self.user.id, self.another_user.id]
+            )
+        )
+        self.service.list(user=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1ThreadService().upsert(
+                user=self.user, participant_id=self.another_user.id
+            )
+
+        self._assert_cached(self.user)
+
+    def test_invalidated_on_thread_bulk_upsert(self):
+        for user in [self.user, self.another_user, self.different_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1ThreadService().bulk_upsert(
+                user=self.user, participant_ids=[self.different_user.id]
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_not_cached(self.different_user)
+        self._assert_cached(self.another_user)
+
+    def test_invalidated_on_thread_delete(self):
+        for user in [self.user, self.another_user, self.different_user]:
+            self.service.list(user=user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ChatV1ThreadService().delete(
+                user=self.user, thread_id=self.thread.id
+            )
+
+        self._assert_not_cached(self.user)
+        self._assert_not_cached(self.another_user)
+        self._assert_cached(self.different_user)
+
+    def test_not_invalidated_on_rollback(self):
+        self.service.list(user=self.user)
+
+        with self.captureOnCommitCallbacks(execute=False):
+            ChatV1MessageService().create(
+                user=self.user, thread_id=self.thread.id, text="text"
+            )
+
+        self._assert_cached(self.user)
+
+
+class ChatV1ThreadListServiceCursorTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1ThreadListService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+
+        created_at = now()
+        self.threads = []
+        for i, message_delay in enumerate([10, None, 5, 20]):
+            thread = Thread.objects.create(
+                created_at=created_at + timedelta(minutes=i),
+                updated_at=created_at - timedelta(minutes=i),
+            )
+            thread.participants.add(self.user, through_defaults={})
+            if message_delay is not None:
+                Message.objects.create(
+                    text="text",
+                    sender=self.user,
+                    thread=thread,
+                    created_at=created_at + timedelta(minutes=message_delay),
+                )
+            self.threads.append(thread)
+
+        ChatV1ThreadService().backfill_last_messages()
+
+    def _list_all(self, ordering: str) -> list[Thread]:
+        results = []
+        cursor = None
+        while True:
+            result = self.service.list(
+                user=self.user,
+                page_size=1,
+                ordering=ordering,
+                pagination=PaginationModes.CURSOR,
+                cursor=cursor,
+            )
+            results.extend(result["results"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                return results
+
+    def test_orderings(self):
+        for ordering in self.service.Orderings:
+            with self.subTest(ordering=ordering):
+                expected = self.service.list(
+                    user=self.user, page_size=10, ordering=ordering
+                )["results"]
+
+                self.assertEqual(self._list_all(ordering), expected)
+
+    def test_order_by_last_message_sent_at_desc(self):
+        result = self._list_all(
+            self.service.Orderings.LAST_MESSAGE_SENT_AT_DESC
+        )
+
+        self.assertEqual(
+            result,
+            [
+                self.threads[1],
+                self.threads[3],
+                self.threads[0],
+                self.threads[2],
+            ],
+        )
+
+    def test_previous_page(self):
+        ordering = self.service.Orderings.LAST_MESSAGE_SENT_AT_ASC
+        first_page = self.service.list(
+            user=self.user,
+            page_size=3,
+            ordering=ordering,
+            pagination=PaginationModes.CURSOR,
+        )
+        second_page = self.service.list(
+            user=self.user,
+            page_size=3,
+            ordering=ordering,
+            pagination=PaginationModes.CURSOR,
+            cursor=first_page["next_cursor"],
+        )
+
+        result = self.service.list(
+            user=self.user,
+            page_size=3,
+            ordering=ordering,
+            pagination=PaginationModes.CURSOR,
+            cursor=second_page["prev_cursor"],
+        )
+
+        self.assertEqual(second_page["results"], [self.threads[1]])
+        self.assertEqual(result["results"], first_page["results"])
+        self.assertEqual(result["count_unread"], 0)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursorException):
+            self.service.list(
+                user=self.user,
+                pagination=PaginationModes.CURSOR,
+                cursor="invalid",
+            )
+
+
+class ChatV1MessageServiceCreateTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+        self.another_user = user_model.objects.create(
+            username="another_john_doe",
+        )
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.text = "text"
+
+    def test_success(self):
+        result = self.service.create(
+            user=self.user, thread_id=self.thread.id, text=self.text
+        )
+        result_db = Message.objects.get()
+
+        self.assertEqual(result, result_db)
+        self.assertEqual(result_db.sender, self.user)
+        self.assertEqual(result_db.thread, self.thread)
+        self.assertEqual(result_db.text, self.text)
+
+    def test_publish_error(self):
+        with patch(
+            "chat.v1.services.event.get_event_broker",
+            side_effect=RuntimeError("broker is down"),
+        ), self.captureOnCommitCallbacks(execute=True):
+            result = self.service.create(
+                user=self.user, thread_id=self.thread.id, text=self.text
+            )
+
+        self.assertEqual(result, Message.objects.get())
+
+    async def test_acreate(self):
+        result = await self.service.acreate(
+            user=self.user, thread_id=self.thread.id, text=self.text
+        )
+        result_db = await Message.objects.select_related(
+            "sender", "thread"
+        ).aget()
+
+        self.assertEqual(result, result_db)
+        self.assertEqual(result_db.sender, self.user)
+        self.assertEqual(result_db.thread, self.thread)
+        self.assertEqual(result_db.text, self.text)
+
+    async def test_acreate_not_participant(self):
+        thread = await Thread.objects.acreate()
+
+        with self.assertRaises(NotFound):
+            await self.service.acreate(
+                user=self.user, thread_id=thread.id, text=self.text
+            )
+
+    def test_last_message_updated(self):
+        result = self.service.create(
+            user=self.user, thread_id=self.thread.id, text=self.text
+        )
+        self.thread.refresh_from_db()
+
+        self.assertEqual(self.thread.last_message, result)
+        self.assertEqual(self.thread.last_message_sent_at, result.created_at)
+        self.assertEqual(self.thread.updated_at, result.created_at)
+
+    def test_last_message_not_overwritten_by_older(self):
+        newer_message = Message.objects.create(
+            thread=self.thread,
+            sender=self.another_user,
+            text=self.text,
+            created_at=now() + timedelta(minutes=5),
+        )
+        ChatV1ThreadService().backfill_last_messages()
+
+        self.service.create(
+            user=self.user, thread_id=self.thread.id, text=self.text
+        )
+        self.thread.refresh_from_db()
+
+        self.assertEqual(self.thread.last_message, newer_message)
+
+    def test_unread_count_incremented(self):
+        self.service.create(
+            user=self.user, thread_id=self.thread.id, text=self.text
+        )
+
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.another_user
+            ).unread_count,
+            1,
+        )
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            0,
+        )
+
+    def test_thread_not_exist(self):
+        thread_id = self.thread.id
+        self.thread.delete()
+
+        with self.assertRaises(NotFound):
+            self.service.create(
+                user=self.user, thread_id=thread_id, text=self.text
+            )
+
+    def test_not_participant(self):
+        self.thread.participants.remove(self.user)
+
+        with self.assertRaises(NotFound):
+            self.service.create(
+                user=self.user, thread_id=self.thread.id, text=self.text
+            )
+
+
+class ChatV1MessageServiceReadTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+        self.another_user = user_model.objects.create(
+            username="another_john_doe",
+        )
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.message = Message.objects.create(
+            thread=self.thread,
+            sender=self.another_user,
+            text="text",
+            is_read=False,
+        )
+
+    def test_success(self):
+        result = self.service.read(user=self.user, message_id=self.message.id)
+        result_db = Message.objects.get()
+
+        self.assertEqual(result, result_db)
+        self.assertEqual(result_db.is_read, True)
+
+    def test_unread_count_decremented(self):
+        ChatV1ThreadService().reconcile_unread_counts()
+
+        self.service.read(user=self.user, message_id=self.message.id)
+
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            0,
+        )
+
+    def test_not_exist(self):
         message_id = self.message.id
         self.message.delete()
 
@@ -382,6 +1213,121 @@ class ChatV1MessageServiceReadTestCase(BaseTestCase):
             self.service.read(user=self.user, message_id=self.message.id)
 
 
+class ChatV1MessageServiceReadManyTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+        self.another_user = user_model.objects.create(
+            username="another_john_doe",
+        )
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.messages = [
+            self.service.create(
+                user=self.another_user, thread_id=self.thread.id, text="text"
+            )
+            for _ in range(3)
+        ]
+        self.own_message = self.service.create(
+            user=self.user, thread_id=self.thread.id, text="text"
+        )
+
+        self.other_thread = Thread.objects.create()
+        self.other_thread.participants.add(
+            self.another_user, through_defaults={}
+        )
+        self.other_message = Message.objects.create(
+            thread=self.other_thread, sender=self.another_user, text="text"
+        )
+
+    def test_success(self):
+        message_ids = [message.id for message in self.messages]
+
+        result = self.service.read_many(
+            user=self.user, message_ids=message_ids
+        )
+
+        self.assertEqual(result, message_ids)
+        self.assertEqual(
+            Message.objects.filter(is_read=True).count(), len(message_ids)
+        )
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            0,
+        )
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.another_user
+            ).unread_count,
+            1,
+        )
+
+    def test_skipped(self):
+        self.service.read(user=self.user, message_id=self.messages[0].id)
+
+        result = self.service.read_many(
+            user=self.user,
+            message_ids=[
+                self.messages[0].id,
+                self.messages[1].id,
+                self.own_message.id,
+                self.other_message.id,
+                self.other_message.id + 100,
+            ],
+        )
+
+        self.assertEqual(result, [self.messages[1].id])
+        self.assertFalse(
+            Message.objects.filter(
+                id__in=[self.own_message.id, self.other_message.id],
+                is_read=True,
+            ).exists()
+        )
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            1,
+        )
+
+    def test_below_watermark(self):
+        ChatV1ThreadService().read(
+            user=self.user,
+            thread_id=self.thread.id,
+            message_id=self.messages[1].id,
+        )
+
+        self.service.read_many(
+            user=self.user,
+            message_ids=[message.id for message in self.messages],
+        )
+
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.user
+            ).unread_count,
+            0,
+        )
+
+    def test_query_count(self):
+        with self.assertNumQueries(1):
+            self.service.read_many(
+                user=self.user,
+                message_ids=[message.id for message in self.messages],
+            )
+
+
 class ChatV1MessageListServiceTestCase(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -424,6 +1370,27 @@ class ChatV1MessageListServiceTestCase(BaseTestCase):
         )
         self.assertEqual(result["count"], 2)
 
+    async def test_alist(self):
+        for kwargs in [
+            {},
+            {"text": self.another_message.text},
+            {"page": 2, "page_size": 1, "count": CountModes.CAPPED},
+            {"pagination": PaginationModes.CURSOR, "page_size": 1},
+        ]:
+            with self.subTest(**kwargs):
+                expected = await sync_to_async(self.service.list)(
+                    user=self.user, thread_id=self.thread.id, **kwargs
+                )
+                result = await self.service.alist(
+                    user=self.user, thread_id=self.thread.id, **kwargs
+                )
+
+                self.assertEqual(result, expected)
+                self.assertEqual(
+                    [m.sender for m in result["results"]],
+                    [m.sender for m in expected["results"]],
+                )
+
     def test_filter_by_text_full_match(self):
         result = self.service.list(
             user=self.user,
@@ -501,3 +1468,659 @@ class ChatV1MessageListServiceTestCase(BaseTestCase):
             ],
         )
         self.assertEqual(result["count"], 2)
+
+    def test_count_capped(self):
+        result = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            count=CountModes.CAPPED,
+            count_cap=1,
+        )
+
+        self.assertEqual(len(result["results"]), 2)
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["count_mode"], CountModes.CAPPED)
+
+    def test_count_estimated(self):
+        result = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            count=CountModes.ESTIMATED,
+        )
+
+        self.assertEqual(len(result["results"]), 2)
+        self.assertIsInstance(result["count"], int)
+        self.assertEqual(result["count_mode"], CountModes.ESTIMATED)
+
+    def test_count_estimated_plan(self):
+        count_service = PaginationCountService()
+        qs = Message.objects.filter(thread=self.thread)
+
+        count = count_service.count(qs, mode=CountModes.ESTIMATED)
+
+        self.assertIsInstance(count, int)
+        self.assertGreaterEqual(count, 1)
+        for explain in [
+            '[{"Plan": {"Plan Rows": 3}}]',
+            '{"Plan": {"Plan Rows": 3}}',
+        ]:
+            with self.subTest(explain=explain):
+                self.assertEqual(count_service._get_plan_rows(explain), 3)
+
+    async def test_acount_estimated_plan(self):
+        count = await PaginationCountService().acount(
+            Message.objects.filter(thread=self.thread),
+            mode=CountModes.ESTIMATED,
+        )
+
+        self.assertIsInstance(count, int)
+        self.assertGreaterEqual(count, 1)
+
+    def test_count_none(self):
+        result = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            page_size=1,
+            count=CountModes.NONE,
+        )
+        last_page_result = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            page=2,
+            page_size=1,
+            count=CountModes.NONE,
+        )
+
+        self.assertEqual(result["results"], [self.another_message])
+        self.assertIsNone(result["count"])
+        self.assertTrue(result["has_next"])
+        self.assertEqual(last_page_result["results"], [self.message])
+        self.assertFalse(last_page_result["has_next"])
+
+
+class ChatV1MessageListServiceCursorTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageListService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(self.user, through_defaults={})
+
+        created_at = now()
+        self.messages = [
+            Message.objects.create(
+                text=f"text {i}",
+                sender=self.user,
+                thread=self.thread,
+                created_at=created_at + timedelta(minutes=i // 2),
+            )
+            for i in range(5)
+        ]
+
+    def test_first_page(self):
+        result = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            page_size=2,
+            pagination=PaginationModes.CURSOR,
+        )
+
+        self.assertEqual(result["results"], self.messages[:2:-1])
+        self.assertIsNotNone(result["next_cursor"])
+        self.assertIsNone(result["prev_cursor"])
+
+    def test_all_pages_desc(self):
+        results = []
+        cursor = None
+        while True:
+            result = self.service.list(
+                user=self.user,
+                thread_id=self.thread.id,
+                page_size=2,
+                pagination=PaginationModes.CURSOR,
+                cursor=cursor,
+            )
+            results.extend(result["results"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(results, self.messages[::-1])
+
+    def test_all_pages_asc(self):
+        results = []
+        cursor = None
+        while True:
+            result = self.service.list(
+                user=self.user,
+                thread_id=self.thread.id,
+                page_size=2,
+                ordering=self.service.Orderings.CREATED_AT_ASC,
+                pagination=PaginationModes.CURSOR,
+                cursor=cursor,
+            )
+            results.extend(result["results"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(results, self.messages)
+
+    def test_previous_page(self):
+        first_page = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            page_size=2,
+            ordering=self.service.Orderings.CREATED_AT_ASC,
+            pagination=PaginationModes.CURSOR,
+        )
+        second_page = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            page_size=2,
+            ordering=self.service.Orderings.CREATED_AT_ASC,
+            pagination=PaginationModes.CURSOR,
+            cursor=first_page["next_cursor"],
+        )
+
+        result = self.service.list(
+            user=self.user,
+            thread_id=self.thread.id,
+            page_size=2,
+            ordering=self.service.Orderings.CREATED_AT_ASC,
+            pagination=PaginationModes.CURSOR,
+            cursor=second_page["prev_cursor"],
+        )
+
+        self.assertEqual(second_page["results"], self.messages[2:4])
+        self.assertEqual(result["results"], self.messages[:2])
+        self.assertIsNone(result["prev_cursor"])
+        self.assertIsNotNone(result["next_cursor"])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursorException):
+            self.service.list(
+                user=self.user,
+                thread_id=self.thread.id,
+                pagination=PaginationModes.CURSOR,
+                cursor="invalid",
+            )
+
+    def test_invalid_cursor_value(self):
+        cursor = CursorPaginationService().encode_cursor(["invalid", 1])
+
+        with self.assertRaises(InvalidCursorException):
+            self.service.list(
+                user=self.user,
+                thread_id=self.thread.id,
+                pagination=PaginationModes.CURSOR,
+                cursor=cursor,
+            )
+
+
+class ChatV1MessageSearchServiceTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageSearchService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(self.user, through_defaults={})
+
+        texts = [
+            "running late, the train is running slow",
+            "I am running",
+            "see you at the station",
+            "the dog runs fast",
+        ]
+        self.messages = [
+            Message.objects.create(
+                text=text, sender=self.user, thread=self.thread
+            )
+            for text in texts
+        ]
+
+    def test_ranked(self):
+        result = self.service.search(
+            user=self.user, thread_id=self.thread.id, query="run"
+        )
+
+        self.assertEqual(
+            result["results"][:1],
+            [self.messages[0]],
+        )
+        self.assertCountEqual(
+            result["results"],
+            [self.messages[0], self.messages[1], self.messages[3]],
+        )
+        ranks = [message.rank for message in result["results"]]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+
+    def test_headline(self):
+        result = self.service.search(
+            user=self.user, thread_id=self.thread.id, query="station"
+        )
+
+        self.assertEqual(result["results"], [self.messages[2]])
+        self.assertIn("<b>station</b>", result["results"][0].headline)
+
+    def test_websearch_syntax(self):
+        result = self.service.search(
+            user=self.user, thread_id=self.thread.id, query="run -dog"
+        )
+
+        self.assertCountEqual(
+            result["results"], [self.messages[0], self.messages[1]]
+        )
+
+    def test_all_pages(self):
+        results = []
+        cursor = None
+        while True:
+            result = self.service.search(
+                user=self.user,
+                thread_id=self.thread.id,
+                query="run",
+                page_size=1,
+                cursor=cursor,
+            )
+            results.extend(result["results"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len(set(results)), 3)
+
+    def test_not_participant(self):
+        self.thread.participants.remove(self.user)
+
+        result = self.service.search(
+            user=self.user, thread_id=self.thread.id, query="run"
+        )
+
+        self.assertEqual(result["results"], [])
+
+    def test_search_vector_deferred(self):
+        message = Message.objects.get(id=self.messages[0].id)
+
+        self.assertIn("search_vector", message.get_deferred_fields())
+
+
+class ChatV1MessageSearchServiceThreadsTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageSearchService()
+        self.user = user_model.objects.create(
+            username="john_doe",
+        )
+        self.another_user = user_model.objects.create(
+            username="another_john_doe",
+        )
+
+        self.threads = [Thread.objects.create() for _ in range(3)]
+        for thread in self.threads:
+            thread.participants.add(
+                self.user, self.another_user, through_defaults={}
+            )
+        self.foreign_thread = Thread.objects.create()
+        self.foreign_thread.participants.add(
+            self.another_user, through_defaults={}
+        )
+
+        self.exact_hit = Message.objects.create(
+            text="deployment", sender=self.user, thread=self.threads[1]
+        )
+        self.hits = [
+            Message.objects.create(
+                text=f"deployments #{i}",
+                sender=self.another_user,
+                thread=self.threads[0],
+            )
+            for i in range(4)
+        ]
+        Message.objects.create(
+            text="nothing related", sender=self.user, thread=self.threads[2]
+        )
+        Message.objects.create(
+            text="deployment",
+            sender=self.another_user,
+            thread=self.foreign_thread,
+        )
+
+    def test_success(self):
+        result = self.service.search_threads(
+            user=self.user, query="deployment"
+        )
+
+        self.assertEqual(result, [self.threads[1], self.threads[0]])
+        self.assertEqual(result[0].hits, [self.exact_hit])
+        self.assertEqual(result[0].similarity, 1)
+        self.assertEqual(len(result[1].hits), 3)
+        self.assertEqual(result[1].participants.all()[0], self.another_user)
+
+    def test_hits_per_thread(self):
+        result = self.service.search_threads(
+            user=self.user, query="deployment", hits_per_thread=1
+        )
+
+        self.assertEqual(result[1].hits, [self.hits[-1]])
+
+    def test_page_size(self):
+        result = self.service.search_threads(
+            user=self.user, query="deployment", page_size=1
+        )
+
+        self.assertEqual(result, [self.threads[1]])
+
+    def test_no_hits(self):
+        with self.assertNumQueries(1):
+            result = self.service.search_threads(user=self.user, query="zebra")
+
+        self.assertEqual(result, [])
+
+    def test_query_count(self):
+        for _ in range(50):
+            thread = Thread.objects.create()
+            thread.participants.add(self.user, through_defaults={})
+            Message.objects.create(
+                text="deployment", sender=self.user, thread=thread
+            )
+
+        # Hits, senders, threads and participants
+        with self.assertNumQueries(4):
+            result = self.service.search_threads(
+                user=self.user, query="deployment", page_size=50
+            )
+            for thread in result:
+                list(thread.participants.all())
+                for hit in thread.hits:
+                    hit.sender.username
+
+
+class ChatV1MessageWaitServiceTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+
+        self.service = ChatV1MessageWaitService()
+        self.user = user_model.objects.create(username="john_doe")
+        self.another_user = user_model.objects.create(username="jane_doe")
+
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+
+    def _create_message(self, thread_id: int, text: str) -> Message:
+        with self.captureOnCommitCallbacks(execute=True):
+            return ChatV1MessageService().create(
+                user=self.another_user, thread_id=thread_id, text=text
+            )
+
+    async def _create_message_later(self, thread_id: int, text: str):
+        await asyncio.sleep(0.2)
+        return await sync_to_async(self._create_message)(thread_id, text)
+
+    async def test_existing_messages(self):
+        messages = [
+            await sync_to_async(self._create_message)(self.thread.id, text)
+            for text in ["first", "second", "third"]
+        ]
+        cursor = self.service._get_cursor(messages[0])
+
+        result = await self.service.wait(
+            user=self.user, thread_id=self.thread.id, after=cursor, timeout=0
+        )
+
+        self.assertEqual(result["results"], messages[1:])
+        self.assertEqual(
+            result["cursor"], self.service._get_cursor(messages[-1])
+        )
+
+    async def test_empty_thread(self):
+        result, message = await asyncio.gather(
+            self.service.wait(
+                user=self.user, thread_id=self.thread.id, timeout=10
+            ),
+            self._create_message_later(self.thread.id, "first"),
+        )
+
+        self.assertEqual(result["results"], [message])
+
+    async def test_other_thread_ignored(self):
+        thread = await Thread.objects.acreate()
+        await thread.participants.aadd(
+            self.user, self.another_user, through_defaults={}
+        )
+
+        result, _ = await asyncio.gather(
+            self.service.wait(
+                user=self.user, thread_id=self.thread.id, timeout=1
+            ),
+            self._create_message_later(thread.id, "elsewhere"),
+        )
+
+        self.assertEqual(result, {"results": [], "cursor": None})
+
+    async def test_subscription_overflow(self):
+        message = await sync_to_async(self._create_message)(
+            self.thread.id, "first"
+        )
+        event = {
+            "type": ChatV1EventService.Types.MESSAGE_CREATED,
+            "thread_id": self.thread.id,
+        }
+
+        async def overflow():
+            await asyncio.sleep(0.1)
+            for _ in range(3):
+                event_hub.publish({self.user.id}, event)
+
+        with self.settings(EVENTS_SUBSCRIPTION_MAX_SIZE=1):
+            result, _, message = await asyncio.gather(
+                self.service.wait(
+                    user=self.user,
+                    thread_id=self.thread.id,
+                    after=self.service._get_cursor(message),
+                    timeout=10,
+                ),
+                overflow(),
+                self._create_message_later(self.thread.id, "second"),
+            )
+
+        self.assertEqual(result["results"], [message])
+
+    async def test_not_participant(self):
+        thread = await Thread.objects.acreate()
+
+        with self.assertRaises(NotFound):
+            await self.service.wait(
+                user=self.user, thread_id=thread.id, timeout=0
+            )
+
+
+class ChatV1MessagePartitionServiceTestCase(BaseTestCase):
+    # DDL is transactional, every test case is rolled back
+    def setUp(self) -> None:
+        super().setUp()
+
+        user_model = get_user_model()
+        self.user = user_model.objects.create(username="john_doe")
+        self.another_user = user_model.objects.create(username="jane_doe")
+        self.thread = Thread.objects.create()
+        self.thread.participants.add(
+            self.user, self.another_user, through_defaults={}
+        )
+        self.message = ChatV1MessageService().create(
+            user=self.user, thread_id=self.thread.id, text="text"
+        )
+        self.service = ChatV1MessagePartitionService()
+        self.list_service = ChatV1MessageListService()
+
+    def _get_partition(self, message: Message) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT tableoid::regclass::text FROM {self.service.table}"
+                " WHERE id = %s",
+                [message.id],
+            )
+            return cursor.fetchone()[0]
+
+    def _get_months(self) -> list:
+        return sorted(
+            p["start"]
+            for p in self.service.get_partitions()
+            if p["start"] is not None
+        )
+
+    def test_convert(self):
+        self.assertFalse(self.service.is_partitioned())
+        with connection.cursor() as cursor:
+            self.assertEqual(
+                len(self.service._get_referencing_foreign_keys(cursor)), 1
+            )
+
+        created = self.service.convert(months_ahead=2)
+
+        self.assertTrue(self.service.is_partitioned())
+        with connection.cursor() as cursor:
+            self.assertEqual(
+                self.service._get_referencing_foreign_keys(cursor), []
+            )
+        self.assertEqual(len(created), 5)
+        self.assertEqual(
+            self._get_partition(self.message), self.service.legacy_table
+        )
+        self.assertEqual(self.service.convert(), [])
+
+    def test_existing_services(self):
+        self.service.convert(months_ahead=2)
+        month = self._get_months()[0]
+
+        message = ChatV1MessageService().create(
+            user=self.another_user, thread_id=self.thread.id, text="new"
+        )
+        future_message = Message.objects.create(
+            thread=self.thread,
+            sender=self.user,
+            text="future",
+            created_at=month + timedelta(days=1),
+        )
+        ChatV1MessageService().read(user=self.user, message_id=message.id)
+
+        self.assertGreater(message.id, self.message.id)
+        self.assertEqual(
+            self._get_partition(future_message),
+            self.service._get_partition_name(month),
+        )
+        for pagination in PaginationModes:
+            with self.subTest(pagination=pagination):
+                result = self.list_service.list(
+                    user=self.user,
+                    thread_id=self.thread.id,
+                    pagination=pagination,
+                )
+                self.assertEqual(
+                    [m.id for m in result["results"]],
+                    [future_message.id, message.id, self.message.id],
+                )
+
+    def test_pruning(self):
+        self.service.convert(months_ahead=2)
+        month = self._get_months()[1]
+        cursor_service = CursorPaginationService()
+
+        time_range_qs = self.list_service._get_list_qs(
+            self.thread.id,
+            self.list_service._get_list_params(
+                created_after=month,
+                created_before=month + timedelta(days=7),
+                pagination=PaginationModes.CURSOR,
+            ),
+        )
+        cursor_qs, _ = cursor_service._get_page_qs(
+            Message.objects.filter(thread_id=self.thread.id),
+            cursor_service.get_ordering("-created_at"),
+            cursor_service.encode_cursor([self.message.created_at, 1]),
+        )
+
+        time_range_plan = time_range_qs.explain()
+        self.assertIn(self.service._get_partition_name(month), time_range_plan)
+        self.assertNotIn(self.service.legacy_table, time_range_plan)
+        self.assertNotIn(self.service.default_table, time_range_plan)
+
+        cursor_plan = cursor_qs.explain()
+        self.assertIn(self.service.legacy_table, cursor_plan)
+        self.assertNotIn(self.service._get_partition_name(month), cursor_plan)
+
+    def test_create_partitions(self):
+        self.service.convert(months_ahead=1)
+        months = self._get_months()
+
+        created = self.service.create_partitions(start=months[0], months=2)
+
+        self.assertEqual(
+            created,
+            [
+                self.service._get_partition_name(
+                    self.service._get_month(months[0], months=2)
+                )
+            ],
+        )
+        self.assertEqual(
+            self.service.create_partitions(start=months[0], months=2), []
+        )
+
+    def test_create_partitions_default_rows(self):
+        self.service.convert(months_ahead=0)
+        month = self.service._get_month(self._get_months()[-1], months=3)
+        Message.objects.filter(id=self.message.id).update(
+            created_at=month + timedelta(days=1)
+        )
+        self.assertEqual(
+            self._get_partition(self.message), self.service.default_table
+        )
+
+        created = self.service.create_partitions(start=month, months=0)
+
+        self.assertEqual(created, [self.service._get_partition_name(month)])
+        self.assertEqual(self._get_partition(self.message), created[0])
+        self.assertIn(
+            self.service.default_table,
+            [p["name"] for p in self.service.get_partitions() if p["default"]],
+        )
+
+    def test_detach_partitions(self):
+        self.service.convert(months_ahead=1)
+        month = self._get_months()[0]
+        version = Thread.objects.get(id=self.thread.id).version
+
+        detached = self.service.detach_partitions(before=month)
+        self.thread.refresh_from_db()
+
+        self.assertEqual(detached, [self.service.legacy_table])
+        self.assertFalse(Message.objects.filter(thread=self.thread).exists())
+        self.assertIsNone(self.thread.last_message_id)
+        self.assertEqual(self.thread.version, version + 1)
+        self.assertEqual(
+            ThreadUser.objects.get(
+                thread=self.thread, user=self.another_user
+            ).unread_count,
+            0,
+        )
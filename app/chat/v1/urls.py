@@ -2,12 +2,18 @@ from django.urls import path
 
 from chat.v1.views import (
     ChatV1ThreadUpsertView,
+    ChatV1ThreadBulkUpsertView,
     ChatV1ThreadDeleteView,
     ChatV1ThreadListView,
+    ChatV1ThreadReadView,
 )
 from chat.v1.views.message_create import ChatV1MessageCreateView
 from chat.v1.views.message_list import ChatV1MessageListView
 from chat.v1.views.message_read import ChatV1MessageReadView
+from chat.v1.views.message_read_many import ChatV1MessageReadManyView
+from chat.v1.views.message_search import ChatV1MessageSearchView
+from chat.v1.views.message_thread_search import ChatV1MessageThreadSearchView
+from chat.v1.views.message_wait import ChatV1MessageWaitView
 
 urlpatterns = [
     path(
@@ -15,6 +21,11 @@ urlpatterns = [
         ChatV1ThreadListView.as_view(),
         name=ChatV1ThreadListView.name,
     ),
+    path(
+        "threads/bulk/",
+        ChatV1ThreadBulkUpsertView.as_view(),
+        name=ChatV1ThreadBulkUpsertView.name,
+    ),
     path(
         "threads/<int:participant_id>/",
         ChatV1ThreadUpsertView.as_view(),
@@ -25,6 +36,11 @@ urlpatterns = [
         ChatV1ThreadDeleteView.as_view(),
         name=ChatV1ThreadDeleteView.name,
     ),
+    path(
+        "threads/<int:pk>/read/",
+        ChatV1ThreadReadView.as_view(),
+        name=ChatV1ThreadReadView.name,
+    ),
     path(
         "threads/<int:pk>/messages/create/",
         ChatV1MessageCreateView.as_view(),
@@ -35,6 +51,26 @@ urlpatterns = [
         ChatV1MessageListView.as_view(),
         name=ChatV1MessageListView.name,
     ),
+    path(
+        "threads/<int:pk>/messages/search/",
+        ChatV1MessageSearchView.as_view(),
+        name=ChatV1MessageSearchView.name,
+    ),
+    path(
+        "threads/<int:pk>/messages/wait/",
+        ChatV1MessageWaitView.as_view(),
+        name=ChatV1MessageWaitView.name,
+    ),
+    path(
+        "messages/search/",
+        ChatV1MessageThreadSearchView.as_view(),
+        name=ChatV1MessageThreadSearchView.name,
+    ),
+    path(
+        "messages/read/",
+        ChatV1MessageReadManyView.as_view(),
+        name=ChatV1MessageReadManyView.name,
+    ),
     path(
         "messages/<int:pk>/read/",
         ChatV1MessageReadView.as_view(),
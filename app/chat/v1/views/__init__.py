@@ -1,9 +1,13 @@
+from .thread_bulk_upsert import ChatV1ThreadBulkUpsertView
 from .thread_delete import ChatV1ThreadDeleteView
 from .thread_list import ChatV1ThreadListView
+from .thread_read import ChatV1ThreadReadView
 from .thread_upsert import ChatV1ThreadUpsertView
 
 __all__ = [
     "ChatV1ThreadUpsertView",
+    "ChatV1ThreadBulkUpsertView",
     "ChatV1ThreadDeleteView",
     "ChatV1ThreadListView",
+    "ChatV1ThreadReadView",
 ]
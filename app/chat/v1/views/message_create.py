@@ -13,11 +13,11 @@ from chat.v1.serializers.message_create import (
     ChatV1MessageCreateResponseSerializer,
 )
 from chat.v1.services import ChatV1MessageService
-from common.base.views.base import BaseView
+from common.base.views.async_base import AsyncBaseView
 from common.swagger import SwaggerService
 
 
-class ChatV1MessageCreateView(BaseView):
+class ChatV1MessageCreateView(AsyncBaseView):
     """
     Create a message in a thread
 
@@ -49,9 +49,9 @@ class ChatV1MessageCreateView(BaseView):
         request_body=request_body_serializer_class(),
         responses=responses,
     )
-    def post(self, _, pk: int, *args, **kwargs) -> Response:
+    async def post(self, _, pk: int, *args, **kwargs) -> Response:
         data = self._get_request_body()
-        message = self._service.create(
+        message = await self._service.acreate(
             user=self.request.user, thread_id=pk, **data
         )
 
@@ -7,18 +7,25 @@ from rest_framework.response import Response
 from chat.v1.serializers import (
     ChatV1MessageListRequestSerializer,
     ChatV1MessageListResponseSerializer,
+    ChatV1MessageListValuesSerializer,
     ChatV1MessageListPaginatedResponseSerializer,
 )
 from chat.v1.services import ChatV1MessageListService
-from common.base.views.base_paginated_list import BasePaginatedListView
+from common.base.views.async_base_paginated_list import (
+    AsyncBasePaginatedListView,
+)
+from common.pagination.exceptions import InvalidCursorException
 from common.swagger import SwaggerService
 
 
-class ChatV1MessageListView(BasePaginatedListView):
+class ChatV1MessageListView(AsyncBasePaginatedListView):
     """
     List messages for a thread
 
     Retrieve a paginated list of messages in a thread
+    Cursor pagination is used if `pagination=cursor` or `cursor` is provided
+    Returns 304 if the list has not changed since the `If-None-Match` ETag
+    `fields` / `exclude` limit the returned (and queried) result fields
 
     Authentication is required
     """
@@ -30,6 +37,7 @@ class ChatV1MessageListView(BasePaginatedListView):
 
     request_query_serializer_class = ChatV1MessageListRequestSerializer
     response_body_serializer_class = ChatV1MessageListResponseSerializer
+    response_body_values_serializer_class = ChatV1MessageListValuesSerializer
     paginated_response_body_serializer_class = (
         ChatV1MessageListPaginatedResponseSerializer
     )
@@ -37,9 +45,11 @@ class ChatV1MessageListView(BasePaginatedListView):
     success_response_status = status.HTTP_200_OK
     responses = {
         success_response_status: paginated_response_body_serializer_class(),
+        status.HTTP_304_NOT_MODIFIED: "Not modified",
         **SwaggerService.generate_error_responses(
             ValidationError(),
             AuthenticationFailed(),
+            InvalidCursorException(),
         ),
     }
     service_class = ChatV1MessageListService
@@ -50,11 +60,21 @@ class ChatV1MessageListView(BasePaginatedListView):
         query_serializer=request_query_serializer_class(),
         responses=responses,
     )
-    def get(self, _, pk: int, *args, **kwargs) -> Response:
+    async def get(self, _, pk: int, *args, **kwargs) -> Response:
         request_data = self._get_request_query()
+        fields = self._pop_response_fields(request_data)
+
+        version = await self._service.aget_version(thread_id=pk)
+        etag = self._get_etag(version)
+        if self._is_not_modified(etag):
+            return self._get_response_not_modified(etag)
 
-        result = self._service.list(
-            user=self.request.user, thread_id=pk, **request_data
+        result = await self._service.alist(
+            user=self.request.user,
+            thread_id=pk,
+            values=self._get_response_values(fields),
+            **request_data,
         )
+        response = self._get_response_paginated(fields=fields, **result)
 
-        return self._get_response_paginated(**result)
+        return self._set_etag(response, etag)
@@ -0,0 +1,55 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from chat.v1.serializers import (
+    ChatV1MessageReadManyRequestSerializer,
+    ChatV1MessageReadManyResponseSerializer,
+)
+from chat.v1.services import ChatV1MessageService
+from common.base.views.base import BaseView
+from common.swagger import SwaggerService
+
+
+class ChatV1MessageReadManyView(BaseView):
+    """
+    Read multiple messages
+
+    Read up to 500 messages at once
+    Messages sent by the user, already read messages
+    and messages of other threads are skipped
+    Returns IDs of the messages that have been read
+
+    Authentication is required
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    name = "chat-v1-message-read-many"
+    tags = ["Chat"]
+
+    request_body_serializer_class = ChatV1MessageReadManyRequestSerializer
+    response_body_serializer_class = ChatV1MessageReadManyResponseSerializer
+
+    success_response_status = status.HTTP_200_OK
+    responses = {
+        success_response_status: response_body_serializer_class(),
+        **SwaggerService.generate_error_responses(
+            ValidationError(), AuthenticationFailed()
+        ),
+    }
+    service_class = ChatV1MessageService
+
+    @swagger_auto_schema(
+        operation_id=name,
+        tags=tags,
+        request_body=request_body_serializer_class(),
+        responses=responses,
+    )
+    def post(self, *args, **kwargs) -> Response:
+        data = self._get_request_body()
+        message_ids = self._service.read_many(user=self.request.user, **data)
+
+        return self._get_response({"message_ids": message_ids})
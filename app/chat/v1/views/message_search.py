@@ -0,0 +1,70 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError, AuthenticationFailed
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from chat.v1.serializers import (
+    ChatV1MessageSearchRequestSerializer,
+    ChatV1MessageSearchResponseSerializer,
+    ChatV1MessageSearchPaginatedResponseSerializer,
+)
+from chat.v1.services import ChatV1MessageSearchService
+from common.base.views.base_paginated_list import BasePaginatedListView
+from common.pagination.exceptions import InvalidCursorException
+from common.renderers import MessagePackRenderer
+from common.swagger import SwaggerService
+
+
+class ChatV1MessageSearchView(BasePaginatedListView):
+    """
+    Search messages of a thread
+
+    Retrieve messages of a thread matching a full-text search query
+    The query supports web search syntax: "quoted phrases", OR and -excluded
+    Messages are ordered by relevance and paginated by cursor
+    Matches are highlighted in `headline`
+
+    Authentication is required
+    """
+
+    permission_classes = [IsAuthenticated]
+    # orjson writes small floats differently (1e-05 as 0.00001)
+    renderer_classes = [JSONRenderer, MessagePackRenderer]
+
+    name = "chat-v1-message-search"
+    tags = ["Chat"]
+
+    request_query_serializer_class = ChatV1MessageSearchRequestSerializer
+    response_body_serializer_class = ChatV1MessageSearchResponseSerializer
+    paginated_response_body_serializer_class = (
+        ChatV1MessageSearchPaginatedResponseSerializer
+    )
+
+    success_response_status = status.HTTP_200_OK
+    responses = {
+        success_response_status: paginated_response_body_serializer_class(),
+        **SwaggerService.generate_error_responses(
+            ValidationError(),
+            AuthenticationFailed(),
+            InvalidCursorException(),
+        ),
+    }
+    service_class = ChatV1MessageSearchService
+
+    @swagger_auto_schema(
+        operation_id=name,
+        tags=tags,
+        query_serializer=request_query_serializer_class(),
+        responses=responses,
+    )
+    def get(self, _, pk: int, *args, **kwargs) -> Response:
+        request_data = self._get_request_query()
+
+        result = self._service.search(
+            user=self.request.user, thread_id=pk, **request_data
+        )
+        response_data = self._get_response_body_cursor_paginated(**result)
+
+        return Response(response_data, status=self.success_response_status)
@@ -0,0 +1,69 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError, AuthenticationFailed
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from chat.v1.serializers import (
+    ChatV1MessageThreadSearchRequestSerializer,
+    ChatV1MessageThreadSearchResponseSerializer,
+    ChatV1MessageThreadSearchListResponseSerializer,
+)
+from chat.v1.services import ChatV1MessageSearchService
+from common.base.views.base import BaseView
+from common.renderers import MessagePackRenderer
+from common.swagger import SwaggerService
+
+
+class ChatV1MessageThreadSearchView(BaseView):
+    """
+    Search messages of all threads
+
+    Retrieve threads of the user with messages similar to a query
+    Threads are ordered by their most similar message
+    Each thread contains its most similar messages in `hits`
+
+    Authentication is required
+    """
+
+    permission_classes = [IsAuthenticated]
+    # orjson writes small floats differently (1e-05 as 0.00001)
+    renderer_classes = [JSONRenderer, MessagePackRenderer]
+
+    name = "chat-v1-message-thread-search"
+    tags = ["Chat"]
+
+    request_query_serializer_class = ChatV1MessageThreadSearchRequestSerializer
+    response_body_serializer_class = (
+        ChatV1MessageThreadSearchResponseSerializer
+    )
+
+    success_response_status = status.HTTP_200_OK
+    responses = {
+        success_response_status: (
+            ChatV1MessageThreadSearchListResponseSerializer()
+        ),
+        **SwaggerService.generate_error_responses(
+            ValidationError(), AuthenticationFailed()
+        ),
+    }
+    service_class = ChatV1MessageSearchService
+
+    @swagger_auto_schema(
+        operation_id=name,
+        tags=tags,
+        query_serializer=request_query_serializer_class(),
+        responses=responses,
+    )
+    def get(self, *args, **kwargs) -> Response:
+        request_data = self._get_request_query()
+
+        threads = self._service.search_threads(
+            user=self.request.user, **request_data
+        )
+
+        return Response(
+            {"results": [self._get_response_body(t) for t in threads]},
+            status=self.success_response_status,
+        )
@@ -0,0 +1,70 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import (
+    AuthenticationFailed,
+    NotFound,
+    ValidationError,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from chat.v1.serializers import (
+    ChatV1MessageWaitRequestSerializer,
+    ChatV1MessageWaitResponseSerializer,
+)
+from chat.v1.services import ChatV1MessageWaitService
+from common.base.views.async_base import AsyncBaseView
+from common.pagination.exceptions import InvalidCursorException
+from common.swagger import SwaggerService
+
+
+class ChatV1MessageWaitView(AsyncBaseView):
+    """
+    Wait for new messages in a thread
+
+    Retrieve messages of a thread created after `after` cursor
+    Returns immediately if there are such messages,
+    otherwise waits up to `timeout` seconds for a new one
+    Without `after` waits for messages newer than the latest one
+    Pass the returned `cursor` as `after` in the next request
+
+    Authentication is required
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    name = "chat-v1-message-wait"
+    tags = ["Chat"]
+
+    request_query_serializer_class = ChatV1MessageWaitRequestSerializer
+    response_body_serializer_class = ChatV1MessageWaitResponseSerializer
+
+    success_response_status = status.HTTP_200_OK
+    responses = {
+        success_response_status: response_body_serializer_class(),
+        **SwaggerService.generate_error_responses(
+            ValidationError(),
+            AuthenticationFailed(),
+            NotFound(),
+            InvalidCursorException(),
+        ),
+    }
+    service_class = ChatV1MessageWaitService
+
+    @swagger_auto_schema(
+        operation_id=name,
+        tags=tags,
+        query_serializer=request_query_serializer_class(),
+        responses=responses,
+    )
+    async def get(self, _, pk: int, *args, **kwargs) -> Response:
+        request_data = self._get_request_query()
+
+        result = await self._service.wait(
+            user=self.request.user, thread_id=pk, **request_data
+        )
+        response_data = self.response_body_serializer_class(
+            instance=result
+        ).data
+
+        return Response(response_data, status=self.success_response_status)
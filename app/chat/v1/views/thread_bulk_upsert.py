@@ -0,0 +1,62 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import (
+    AuthenticationFailed,
+    NotFound,
+    ValidationError,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from chat.v1.serializers import (
+    ChatV1ThreadBulkUpsertRequestSerializer,
+    ChatV1ThreadBulkUpsertResponseSerializer,
+    ChatV1ThreadUpsertResponseSerializer,
+)
+from chat.v1.services import ChatV1ThreadService
+from common.base.views.base import BaseView
+from common.swagger import SwaggerService
+
+
+class ChatV1ThreadBulkUpsertView(BaseView):
+    """
+    Upsert threads by participant IDs
+
+    Retrieve threads by up to 200 participant IDs if they exist
+    Create new threads if they do not exist
+    Threads are returned in the order of participant IDs
+
+    Authentication is required
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    name = "chat-v1-thread-bulk-upsert"
+    tags = ["Chat"]
+
+    request_body_serializer_class = ChatV1ThreadBulkUpsertRequestSerializer
+    response_body_serializer_class = ChatV1ThreadUpsertResponseSerializer
+
+    success_response_status = status.HTTP_200_OK
+    responses = {
+        success_response_status: ChatV1ThreadBulkUpsertResponseSerializer(),
+        **SwaggerService.generate_error_responses(
+            ValidationError(), AuthenticationFailed(), NotFound()
+        ),
+    }
+    service_class = ChatV1ThreadService
+
+    @swagger_auto_schema(
+        operation_id=name,
+        tags=tags,
+        request_body=request_body_serializer_class(),
+        responses=responses,
+    )
+    def post(self, *args, **kwargs) -> Response:
+        data = self._get_request_body()
+        threads = self._service.bulk_upsert(user=self.request.user, **data)
+
+        return Response(
+            {"results": [self._get_response_body(t) for t in threads]},
+            status=self.success_response_status,
+        )
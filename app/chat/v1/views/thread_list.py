@@ -7,18 +7,25 @@ from rest_framework.response import Response
 from chat.v1.serializers import ChatV1ThreadListRequestSerializer
 from chat.v1.serializers import (
     ChatV1ThreadListResponseSerializer,
+    ChatV1ThreadListValuesSerializer,
     ChatV1ThreadListPaginatedResponseSerializer,
 )
 from chat.v1.services import ChatV1ThreadListService
-from common.base.views.base_paginated_list import BasePaginatedListView
+from common.base.views.async_base_paginated_list import (
+    AsyncBasePaginatedListView,
+)
+from common.pagination.exceptions import InvalidCursorException
 from common.swagger import SwaggerService
 
 
-class ChatV1ThreadListView(BasePaginatedListView):
+class ChatV1ThreadListView(AsyncBasePaginatedListView):
     """
     List threads
 
     Retrieve a paginated list of threads
+    Cursor pagination is used if `pagination=cursor` or `cursor` is provided
+    Returns 304 if the list has not changed since the `If-None-Match` ETag
+    `fields` / `exclude` limit the returned (and queried) result fields
 
     Authentication is required
     """
@@ -30,6 +37,7 @@ class ChatV1ThreadListView(BasePaginatedListView):
 
     request_query_serializer_class = ChatV1ThreadListRequestSerializer
     response_body_serializer_class = ChatV1ThreadListResponseSerializer
+    response_body_values_serializer_class = ChatV1ThreadListValuesSerializer
     paginated_response_body_serializer_class = (
         ChatV1ThreadListPaginatedResponseSerializer
     )
@@ -37,9 +45,11 @@ class ChatV1ThreadListView(BasePaginatedListView):
     success_response_status = status.HTTP_200_OK
     responses = {
         success_response_status: paginated_response_body_serializer_class(),
+        status.HTTP_304_NOT_MODIFIED: "Not modified",
         **SwaggerService.generate_error_responses(
             ValidationError(),
             AuthenticationFailed(),
+            InvalidCursorException(),
         ),
     }
     service_class = ChatV1ThreadListService
@@ -50,9 +60,20 @@ class ChatV1ThreadListView(BasePaginatedListView):
         query_serializer=request_query_serializer_class(),
         responses=responses,
     )
-    def get(self, *args, **kwargs) -> Response:
+    async def get(self, *args, **kwargs) -> Response:
         request_data = self._get_request_query()
+        fields = self._pop_response_fields(request_data)
+
+        version = await self._service.aget_version(user=self.request.user)
+        etag = self._get_etag(version)
+        if self._is_not_modified(etag):
+            return self._get_response_not_modified(etag)
 
-        result = self._service.list(user=self.request.user, **request_data)
+        result = await self._service.alist(
+            user=self.request.user,
+            values=self._get_response_values(fields),
+            **request_data,
+        )
+        response = self._get_response_paginated(fields=fields, **result)
 
-        return self._get_response_paginated(**result)
+        return self._set_etag(response, etag)
@@ -0,0 +1,59 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import (
+    AuthenticationFailed,
+    NotFound,
+    ValidationError,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from chat.v1.serializers import (
+    ChatV1ThreadReadRequestSerializer,
+    ChatV1ThreadReadResponseSerializer,
+)
+from chat.v1.services import ChatV1ThreadService
+from common.base.views.base import BaseView
+from common.swagger import SwaggerService
+
+
+class ChatV1ThreadReadView(BaseView):
+    """
+    Read a thread up to a message
+
+    Mark messages of a thread as read up to the provided message ID
+    Mark all messages of a thread as read if the message ID is not provided
+
+    Authentication is required
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    name = "chat-v1-thread-read"
+    tags = ["Chat"]
+
+    request_body_serializer_class = ChatV1ThreadReadRequestSerializer
+    response_body_serializer_class = ChatV1ThreadReadResponseSerializer
+
+    success_response_status = status.HTTP_200_OK
+    responses = {
+        success_response_status: response_body_serializer_class(),
+        **SwaggerService.generate_error_responses(
+            ValidationError(), AuthenticationFailed(), NotFound()
+        ),
+    }
+    service_class = ChatV1ThreadService
+
+    @swagger_auto_schema(
+        operation_id=name,
+        tags=tags,
+        request_body=request_body_serializer_class(),
+        responses=responses,
+    )
+    def post(self, _, pk: int, *args, **kwargs) -> Response:
+        data = self._get_request_body()
+        thread_user = self._service.read(
+            user=self.request.user, thread_id=pk, **data
+        )
+
+        return self._get_response(thread_user)
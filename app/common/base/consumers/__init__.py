@@ -0,0 +1,3 @@
+from .base import BaseWebSocketConsumer
+
+__all__ = ["BaseWebSocketConsumer"]
@@ -0,0 +1,107 @@
+import json
+from logging import getLogger
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+
+class BaseWebSocketConsumer:
+    """
+    Minimal ASGI WebSocket consumer authenticated with a JWT access token
+
+    The token is taken from the `token` query parameter
+    or from the `Authorization: Bearer <token>` header
+    """
+
+    name = None
+
+    unauthorized_close_code = 4401
+
+    def __init__(self):
+        self._logger = getLogger(self.name)
+
+        self.scope = None
+        self.user = None
+        self._receive = None
+        self._send = None
+
+    def _get_raw_token(self) -> str | None:
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+        if query.get("token"):
+            return query["token"][0]
+
+        headers = dict(self.scope.get("headers", []))
+        authorization = headers.get(b"authorization", b"").decode()
+        scheme, _, token = authorization.partition(" ")
+        if scheme == "Bearer" and token:
+            return token
+
+        return None
+
+    def _get_user(self, raw_token: str):
+        authentication = JWTAuthentication()
+        # Same connection handling as Django does around requests
+        close_old_connections()
+        try:
+            validated_token = authentication.get_validated_token(raw_token)
+            return authentication.get_user(validated_token)
+        except (InvalidToken, TokenError, AuthenticationFailed):
+            return None
+        finally:
+            close_old_connections()
+
+    async def _authenticate(self):
+        raw_token = self._get_raw_token()
+        if raw_token is None:
+            return None
+
+        return await sync_to_async(self._get_user)(raw_token)
+
+    async def send_json(self, data: dict) -> None:
+        await self._send(
+            {
+                "type": "websocket.send",
+                "text": json.dumps(data, separators=(",", ":")),
+            }
+        )
+
+    async def close(self, code: int = 1000) -> None:
+        await self._send({"type": "websocket.close", "code": code})
+
+    async def receive_until_disconnect(self) -> None:
+        while True:
+            message = await self._receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+    async def handle(self) -> None:
+        raise NotImplementedError("Consumer handler is not implemented")
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.scope = scope
+        self._receive = receive
+        self._send = send
+
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        self.user = await self._authenticate()
+        if self.user is None:
+            self._logger.warn("Rejected a connection: not authenticated")
+            await self.close(self.unauthorized_close_code)
+            return
+
+        await send({"type": "websocket.accept"})
+        self._logger.info(f"Accepted a connection for {self.user}")
+        try:
+            await self.handle()
+        except OSError:
+            # Client went away while an event was being sent
+            pass
+
+        self._logger.info(f"Closed a connection for {self.user}")
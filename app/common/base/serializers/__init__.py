@@ -1,8 +1,11 @@
 from .comma_separated_list_field import CommaSeparatedListField
 from .message import MessageSerializer
+from .values import BaseValuesSerializer
 from .paginated import (
     BasePaginatedResponseSerializer,
     BasePaginatedRequestSerializer,
+    BaseCursorPaginatedResponseSerializer,
+    BaseCursorPaginatedRequestSerializer,
 )
 
 __all__ = [
@@ -10,4 +13,7 @@ __all__ = [
     "CommaSeparatedListField",
     "BasePaginatedResponseSerializer",
     "BasePaginatedRequestSerializer",
+    "BaseCursorPaginatedResponseSerializer",
+    "BaseCursorPaginatedRequestSerializer",
+    "BaseValuesSerializer",
 ]
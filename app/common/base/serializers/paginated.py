@@ -1,9 +1,17 @@
-from rest_framework.fields import IntegerField, URLField
+from rest_framework.fields import (
+    CharField,
+    ChoiceField,
+    IntegerField,
+    URLField,
+)
 from rest_framework.serializers import Serializer
 
+from common.pagination import PaginationModes, CountModes
+
 
 class BasePaginatedResponseSerializer(Serializer):
-    count = IntegerField(required=True, min_value=0)
+    count = IntegerField(allow_null=True, required=True, min_value=0)
+    count_mode = ChoiceField(choices=CountModes, required=True)
     next = URLField(allow_null=True, required=True)
     previous = URLField(allow_null=True, required=True)
 
@@ -13,3 +21,29 @@ class BasePaginatedRequestSerializer(Serializer):
     page_size = IntegerField(
         default=10, min_value=1, max_value=100, required=False
     )
+    count = ChoiceField(
+        choices=CountModes, default=CountModes.EXACT, required=False
+    )
+    count_cap = IntegerField(
+        default=1000, min_value=1, max_value=10000, required=False
+    )
+
+
+class BaseCursorPaginatedResponseSerializer(BasePaginatedResponseSerializer):
+    count = IntegerField(allow_null=True, required=False, min_value=0)
+    count_mode = ChoiceField(choices=CountModes, required=False)
+    next_cursor = CharField(allow_null=True, required=False)
+    prev_cursor = CharField(allow_null=True, required=False)
+
+
+class BaseCursorPaginatedRequestSerializer(BasePaginatedRequestSerializer):
+    pagination = ChoiceField(
+        choices=PaginationModes, default=PaginationModes.OFFSET, required=False
+    )
+    cursor = CharField(max_length=512, required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        if "cursor" in attrs:
+            attrs["pagination"] = PaginationModes.CURSOR
+
+        return attrs
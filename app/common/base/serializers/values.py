@@ -0,0 +1,38 @@
+from rest_framework.fields import DateTimeField
+
+
+class BaseValuesSerializer:
+    """
+    Builds response bodies straight from `values()` rows
+
+    A fast path for lists, skips DRF field machinery per row
+    Output has to match the model serializer of the same response
+    Every response field has a `get_<field>` method and lists
+    the `values()` names it is built from, so a subset of fields
+    also trims the query
+    """
+
+    fields = {}
+
+    def __init__(self, fields: list[str] = None):
+        self._datetime_field = DateTimeField()
+        self._getters = [
+            (name, getattr(self, f"get_{name}"))
+            for name in (self.fields if fields is None else fields)
+        ]
+
+    @classmethod
+    def get_values(cls, fields: list[str] = None) -> list[str]:
+        fields = cls.fields if fields is None else fields
+        values = [value for name in fields for value in cls.fields[name]]
+
+        return list(dict.fromkeys(values))
+
+    def to_datetime(self, value) -> str | None:
+        if value is None:
+            return None
+
+        return self._datetime_field.to_representation(value)
+
+    def to_representation(self, row: dict) -> dict:
+        return {name: getter(row) for name, getter in self._getters}
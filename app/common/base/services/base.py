@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from logging import getLogger
 
+from django.db import connection
+
 
 class BaseService(ABC):
     def __init__(self):
@@ -10,3 +12,9 @@ class BaseService(ABC):
     @abstractmethod
     def _get_name(self):
         pass
+
+    def _release_connection(self) -> None:
+        # Returns the connection to the pool before waiting for long,
+        # connections in the middle of a transaction are kept
+        if not connection.in_atomic_block:
+            connection.close()
@@ -1,4 +1,10 @@
-from .base import BaseTestCase
+from .base import BaseTestCase, BaseTransactionTestCase
 from .base_api import BaseAPITestCase
+from .websocket import WebSocketCommunicator
 
-__all__ = ["BaseTestCase", "BaseAPITestCase"]
+__all__ = [
+    "BaseTestCase",
+    "BaseTransactionTestCase",
+    "BaseAPITestCase",
+    "WebSocketCommunicator",
+]
@@ -1,6 +1,7 @@
 import logging
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
 
 
 class BaseTestCase(TestCase):
@@ -10,6 +11,42 @@ class BaseTestCase(TestCase):
         logging.disable(logging.CRITICAL)
         self.maxDiff = None
         self.override = self.settings(
-            DEBUG=True, PASSWORD_HASHING_ITERATIONS=10, SECRET_KEY="secret"
+            DEBUG=True,
+            PASSWORD_HASHING_ITERATIONS=10,
+            SECRET_KEY="secret",
+            EVENTS_BROKER="local",
+            RESPONSE_VALIDATION_SAMPLE_RATE=1.0,
+            RESPONSE_VALIDATION_STRICT=True,
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+                }
+            },
+            THREAD_LIST_CACHE_ENABLED=True,
         )
         self.override.enable()
+        cache.clear()
+
+
+class BaseTransactionTestCase(TransactionTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        logging.disable(logging.CRITICAL)
+        self.maxDiff = None
+        self.override = self.settings(
+            DEBUG=True,
+            PASSWORD_HASHING_ITERATIONS=10,
+            SECRET_KEY="secret",
+            EVENTS_BROKER="local",
+            RESPONSE_VALIDATION_SAMPLE_RATE=1.0,
+            RESPONSE_VALIDATION_STRICT=True,
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+                }
+            },
+            THREAD_LIST_CACHE_ENABLED=True,
+        )
+        self.override.enable()
+        cache.clear()
@@ -0,0 +1,44 @@
+import asyncio
+import json
+
+
+class WebSocketCommunicator:
+    """
+    Drives an ASGI WebSocket application in tests
+    """
+
+    timeout = 1
+
+    def __init__(self, application, path: str, query_string: str = ""):
+        self._application = application
+        self._scope = {
+            "type": "websocket",
+            "path": path,
+            "query_string": query_string.encode(),
+            "headers": [],
+        }
+        self._input = asyncio.Queue()
+        self._output = asyncio.Queue()
+        self._task = None
+
+    async def connect(self) -> dict:
+        self._task = asyncio.create_task(
+            self._application(self._scope, self._input.get, self._output.put)
+        )
+        await self._input.put({"type": "websocket.connect"})
+
+        return await self.receive()
+
+    async def receive(self) -> dict:
+        return await asyncio.wait_for(self._output.get(), self.timeout)
+
+    async def receive_json(self) -> dict:
+        message = await self.receive()
+        return json.loads(message["text"])
+
+    def has_output(self) -> bool:
+        return not self._output.empty()
+
+    async def disconnect(self) -> None:
+        await self._input.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self._task, self.timeout)
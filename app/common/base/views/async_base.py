@@ -0,0 +1,42 @@
+from inspect import isawaitable
+
+from asgiref.sync import sync_to_async
+
+from common.base.views.base import BaseView
+
+
+class AsyncBaseView(BaseView):
+    """
+    Base view with coroutine handlers
+
+    Authentication, permissions and throttling
+    are run in a worker thread, handlers are awaited on the event loop
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(
+            request, response, *args, **kwargs
+        )
+        return self.response
@@ -0,0 +1,8 @@
+from common.base.views.async_base import AsyncBaseView
+from common.base.views.base_paginated_list import BasePaginatedListView
+
+
+class AsyncBasePaginatedListView(AsyncBaseView, BasePaginatedListView):
+    """
+    Paginated list view with coroutine handlers
+    """
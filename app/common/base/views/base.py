@@ -1,13 +1,27 @@
+import json
+from hashlib import sha256
+from logging import getLogger
+from random import random
+
+from django.conf import settings
 from django.db.models import Model
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.base.views.response_validation import response_validation_counter
+
 
 class ResponseSerializationMismatch(Exception):
     pass
 
 
+logger = getLogger("response-validation")
+
+
 class BaseView(APIView):
     name = None
     tags = None
@@ -55,6 +69,24 @@ class BaseView(APIView):
 
         return serializer.validated_data
 
+    def _get_validated_response_body(self, data: dict) -> dict:
+        response_validation_counter.increment("validated")
+
+        serializer = self.response_body_serializer_class(data=data)
+        try:
+            serializer.is_valid(raise_exception=True)
+            return serializer.validated_data
+        except ValidationError as e:
+            response_validation_counter.increment("mismatched")
+            logger.warning(
+                f"Response of {self.name} does not match"
+                f" {self.response_body_serializer_class.__name__}: {e.detail}"
+            )
+            if settings.RESPONSE_VALIDATION_STRICT:
+                raise ResponseSerializationMismatch from e
+
+            return data
+
     def _get_response_body(self, data: dict | Model) -> dict:
         if not self.response_body_serializer_class:
             raise NotImplementedError(
@@ -66,12 +98,11 @@ class BaseView(APIView):
             return serializer.data
 
         if isinstance(data, dict):
-            serializer = self.response_body_serializer_class(data=data)
-            try:
-                serializer.is_valid(raise_exception=True)
-                return serializer.validated_data
-            except ValidationError as e:
-                raise ResponseSerializationMismatch from e
+            # Service output is trusted, only a sample is validated
+            if random() >= settings.RESPONSE_VALIDATION_SAMPLE_RATE:
+                return data
+
+            return self._get_validated_response_body(data)
 
         raise NotImplementedError("Not supported data type")
 
@@ -79,3 +110,34 @@ class BaseView(APIView):
         response_data = self._get_response_body(data=data)
 
         return Response(response_data, status=self.success_response_status)
+
+    def _get_etag(self, version) -> str:
+        # Responses also differ by query parameters and format
+        data = json.dumps(
+            [
+                version,
+                self.request.get_full_path(),
+                self.request.accepted_media_type,
+            ],
+            default=str,
+        )
+        return quote_etag(sha256(data.encode()).hexdigest()[:32])
+
+    def _is_not_modified(self, etag: str) -> bool:
+        if_none_match = self.request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+
+        etags = [e.removeprefix("W/") for e in parse_etags(if_none_match)]
+        return "*" in etags or etag in etags
+
+    def _set_etag(self, response: Response, etag: str) -> Response:
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept", "Authorization"])
+
+        return response
+
+    def _get_response_not_modified(self, etag: str) -> Response:
+        return self._set_etag(
+            Response(status=status.HTTP_304_NOT_MODIFIED), etag
+        )
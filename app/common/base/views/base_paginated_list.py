@@ -1,13 +1,60 @@
 from urllib.parse import urlencode
 
 from django.db.models import Model
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from common.base.views.base import BaseView
+from common.pagination import PaginationModes, CountModes
 
 
 class BasePaginatedListView(BaseView):
     paginated_response_body_serializer_class = None
+    # Fast path: results are `values()` rows serialized without DRF fields
+    response_body_values_serializer_class = None
+
+    def _pop_response_fields(self, request_data: dict) -> list[str] | None:
+        # Sparse fieldsets: `fields` and `exclude` query parameters
+        fields = request_data.pop("fields", None)
+        exclude = request_data.pop("exclude", None)
+        if fields is None and exclude is None:
+            return None
+
+        if fields is None:
+            fields = self.response_body_serializer_class.Meta.fields
+
+        fields = [
+            name
+            for name in dict.fromkeys(fields)
+            if name not in (exclude or [])
+        ]
+        if not fields:
+            raise ValidationError(
+                {"exclude": ["At least one response field is required."]}
+            )
+
+        return fields
+
+    def _get_response_values(
+        self, fields: list[str] = None
+    ) -> list[str] | None:
+        if self.response_body_values_serializer_class is None:
+            return None
+
+        return self.response_body_values_serializer_class.get_values(fields)
+
+    def _get_response_bodies(
+        self, results: list[dict | Model], fields: list[str] = None
+    ) -> list:
+        if self.response_body_values_serializer_class is None:
+            bodies = [self._get_response_body(data=d) for d in results]
+            if fields is None:
+                return bodies
+
+            return [{name: body[name] for name in fields} for body in bodies]
+
+        serializer = self.response_body_values_serializer_class(fields=fields)
+        return [serializer.to_representation(row) for row in results]
 
     def _build_page_url(
         self, page: int, page_size: int, count: int
@@ -23,33 +70,77 @@ class BasePaginatedListView(BaseView):
         request_url = self.request.build_absolute_uri("?")
         return f"{request_url}?{urlencode(query_params)}"
 
+    def _build_cursor_url(self, cursor: str | None) -> str | None:
+        if cursor is None:
+            return None
+
+        query_params = self.request.query_params.dict()
+        query_params.pop("page", None)
+        query_params.update(
+            {"pagination": PaginationModes.CURSOR, "cursor": cursor}
+        )
+        request_url = self.request.build_absolute_uri("?")
+        return f"{request_url}?{urlencode(query_params)}"
+
+    def _get_response_body_cursor_paginated(
+        self,
+        results: list[dict | Model],
+        next_cursor: str | None,
+        prev_cursor: str | None,
+        fields: list[str] = None,
+        **kwargs,
+    ) -> dict:
+        return {
+            "next": self._build_cursor_url(next_cursor),
+            "previous": self._build_cursor_url(prev_cursor),
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+            "results": self._get_response_bodies(results, fields),
+            **kwargs,
+        }
+
     def _get_response_body_paginated(
         self,
         results: list[dict | Model],
-        count: int,
+        count: int | None,
+        count_mode: CountModes,
+        has_next: bool,
         page: int,
         page_size: int,
+        fields: list[str] = None,
         **kwargs,
     ) -> dict:
+        exact_count = count if count_mode == CountModes.EXACT else None
+
         return {
             "count": count,
-            "next": self._build_page_url(page + 1, page_size, count),
-            "previous": self._build_page_url(page - 1, page_size, count),
-            "results": [self._get_response_body(data=d) for d in results],
+            "count_mode": count_mode,
+            "next": (
+                self._build_page_url(page + 1, page_size, exact_count)
+                if has_next
+                else None
+            ),
+            "previous": self._build_page_url(page - 1, page_size, exact_count),
+            "results": self._get_response_bodies(results, fields),
             **kwargs,
         }
 
     def _get_response_paginated(
-        self, results: list[dict | Model], count: int, **kwargs
+        self, results: list[dict | Model], **kwargs
     ) -> Response:
         request_data = self._get_request_query()
 
+        if request_data.get("pagination") == PaginationModes.CURSOR:
+            response_data = self._get_response_body_cursor_paginated(
+                results=results, **kwargs
+            )
+            return Response(response_data, status=self.success_response_status)
+
         page = request_data.get("page")
         page_size = request_data.get("page_size")
 
         response_data = self._get_response_body_paginated(
             results=results,
-            count=count,
             page=page,
             page_size=page_size,
             **kwargs,
@@ -0,0 +1,22 @@
+from threading import Lock
+
+
+class ResponseValidationCounter:
+    """
+    Process-wide counts of sampled response validations
+    """
+
+    def __init__(self):
+        self._counts = {"validated": 0, "mismatched": 0}
+        self._lock = Lock()
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def get_counts(self) -> dict:
+        with self._lock:
+            return dict(self._counts)
+
+
+response_validation_counter = ResponseValidationCounter()
@@ -0,0 +1,15 @@
+from .broker import LocalEventBroker, PostgresEventBroker, get_event_broker
+from .hub import EventHub, event_hub
+from .listener import PostgresEventListener
+from .subscription import EventSubscription, EventSubscriptionOverflow
+
+__all__ = [
+    "EventHub",
+    "event_hub",
+    "EventSubscription",
+    "EventSubscriptionOverflow",
+    "LocalEventBroker",
+    "PostgresEventBroker",
+    "PostgresEventListener",
+    "get_event_broker",
+]
@@ -0,0 +1,130 @@
+import json
+
+from django.conf import settings
+from django.db import connection
+
+from common.base.services import BaseService
+from common.events.hub import event_hub
+from common.events.listener import PostgresEventListener
+
+
+class LocalEventBroker(BaseService):
+    """
+    Delivers events to subscribers of the current process only
+    """
+
+    def _get_name(self):
+        return "local-event-broker"
+
+    def listen(self) -> None:
+        pass
+
+    def publish(self, envelopes: list[tuple[set[int], dict]]) -> None:
+        for user_ids, event in envelopes:
+            event_hub.publish(user_ids, event)
+
+
+class PostgresEventBroker(BaseService):
+    """
+    Delivers events to subscribers of every process with NOTIFY
+
+    Envelopes are packed into as few notifications as possible,
+    each payload is kept under EVENTS_NOTIFY_PAYLOAD_MAX_SIZE bytes
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.listener = PostgresEventListener()
+
+    def _get_name(self):
+        return "postgres-event-broker"
+
+    def _encode(self, data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def _get_truncated_event(self, event: dict) -> dict:
+        # Nested values are dropped, clients refetch the referenced objects
+        return {
+            **{
+                key: value
+                for key, value in event.items()
+                if not isinstance(value, (dict, list))
+            },
+            "truncated": True,
+        }
+
+    def _split(self, user_ids: list[int], event: dict) -> list[bytes]:
+        max_size = settings.EVENTS_NOTIFY_PAYLOAD_MAX_SIZE - 2
+        envelope = self._encode({"u": user_ids, "e": event})
+        if len(envelope) <= max_size:
+            return [envelope]
+
+        if len(user_ids) > 1:
+            middle = len(user_ids) // 2
+            return self._split(user_ids[:middle], event) + self._split(
+                user_ids[middle:], event
+            )
+
+        self._logger.warn(f"Truncated {event['type']} event: too large")
+        return [
+            self._encode(
+                {"u": user_ids, "e": self._get_truncated_event(event)}
+            )
+        ]
+
+    def get_payloads(
+        self, envelopes: list[tuple[set[int], dict]]
+    ) -> list[str]:
+        max_size = settings.EVENTS_NOTIFY_PAYLOAD_MAX_SIZE
+        payloads = []
+        batch = []
+        batch_size = 2
+        for user_ids, event in envelopes:
+            if not user_ids:
+                continue
+
+            for envelope in self._split(sorted(user_ids), event):
+                if batch and batch_size + len(envelope) + 1 > max_size:
+                    payloads.append(b"[" + b",".join(batch) + b"]")
+                    batch = []
+                    batch_size = 2
+
+                batch.append(envelope)
+                batch_size += len(envelope) + 1
+
+        if batch:
+            payloads.append(b"[" + b",".join(batch) + b"]")
+
+        return [payload.decode() for payload in payloads]
+
+    def listen(self) -> None:
+        self.listener.start()
+
+    def publish(self, envelopes: list[tuple[set[int], dict]]) -> None:
+        payloads = self.get_payloads(envelopes)
+        if not payloads:
+            return
+
+        # All notifications are sent in a single round trip
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload)"
+                " FROM unnest(%s::text[]) AS payload",
+                [settings.EVENTS_NOTIFY_CHANNEL, payloads],
+            )
+
+
+_brokers = {
+    "local": LocalEventBroker,
+    "postgres": PostgresEventBroker,
+}
+_broker_instances = {}
+
+
+def get_event_broker() -> LocalEventBroker | PostgresEventBroker:
+    name = settings.EVENTS_BROKER
+    if name not in _broker_instances:
+        _broker_instances[name] = _brokers[name]()
+
+    return _broker_instances[name]
@@ -0,0 +1,61 @@
+from collections import defaultdict
+from threading import Lock
+
+from django.conf import settings
+
+from common.base.services import BaseService
+from common.events.subscription import EventSubscription
+
+
+class EventHub(BaseService):
+    """
+    In-process registry of event subscriptions by user ID
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._subscriptions = defaultdict(set)
+        self._lock = Lock()
+
+    def _get_name(self):
+        return "event-hub"
+
+    def subscribe(self, user_id: int) -> EventSubscription:
+        subscription = EventSubscription(
+            user_id=user_id, max_size=settings.EVENTS_SUBSCRIPTION_MAX_SIZE
+        )
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_ids: set[int], event: dict) -> int:
+        with self._lock:
+            subscriptions = [
+                subscription
+                for user_id in user_ids
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+
+        for subscription in subscriptions:
+            subscription.put(event)
+
+        return len(subscriptions)
+
+    def get_subscription_count(self) -> int:
+        with self._lock:
+            return sum(map(len, self._subscriptions.values()))
+
+
+event_hub = EventHub()
@@ -0,0 +1,100 @@
+import json
+from threading import Event, Lock, Thread
+
+import psycopg
+from django.conf import settings
+from django.db import connections
+from psycopg import sql
+
+from common.base.services import BaseService
+from common.events.hub import event_hub
+
+
+class PostgresEventListener(BaseService):
+    """
+    Single LISTEN connection per process
+
+    Notifications are dispatched to the local event hub
+    from a daemon thread, the connection is re-established on errors
+    """
+
+    reconnect_delay = 1
+    poll_timeout = 1
+
+    def __init__(self):
+        super().__init__()
+
+        self._thread = None
+        self._lock = Lock()
+        self._stopped = Event()
+        self.ready = Event()
+
+    def _get_name(self):
+        return "postgres-event-listener"
+
+    def _get_connection_kwargs(self) -> dict:
+        settings_dict = connections["default"].settings_dict
+        kwargs = {
+            "dbname": settings_dict["NAME"],
+            "user": settings_dict["USER"],
+            "password": settings_dict["PASSWORD"],
+            "host": settings_dict["HOST"],
+            "port": settings_dict["PORT"],
+        }
+        return {key: value for key, value in kwargs.items() if value}
+
+    def _dispatch(self, payload: str) -> None:
+        # A malformed notification must not stop the listener thread
+        try:
+            envelopes = json.loads(payload)
+            for envelope in envelopes:
+                event_hub.publish(set(envelope["u"]), envelope["e"])
+        except Exception as e:
+            self._logger.warn(f"Skipped a notification: {e!r}")
+
+    def _listen(self) -> None:
+        with psycopg.connect(
+            **self._get_connection_kwargs(), autocommit=True
+        ) as conn:
+            conn.execute(
+                sql.SQL("LISTEN {}").format(
+                    sql.Identifier(settings.EVENTS_NOTIFY_CHANNEL)
+                )
+            )
+            self.ready.set()
+            self._logger.info("Listening for events")
+
+            while not self._stopped.is_set():
+                for notify in conn.notifies(timeout=self.poll_timeout):
+                    self._dispatch(notify.payload)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except psycopg.Error as e:
+                # Events sent while reconnecting are lost,
+                # clients resync on reconnect
+                self.ready.clear()
+                self._logger.warn(f"Lost the listen connection: {e}")
+                self._stopped.wait(self.reconnect_delay)
+
+        self.ready.clear()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stopped.clear()
+            self._thread = Thread(
+                target=self._run, name=self._get_name(), daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
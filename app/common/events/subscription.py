@@ -0,0 +1,41 @@
+import asyncio
+
+
+class EventSubscriptionOverflow(Exception):
+    pass
+
+
+class EventSubscription:
+    """
+    Bounded queue of events of a single subscriber
+
+    Events can be put from any thread,
+    they are delivered on the event loop of the subscriber
+    """
+
+    def __init__(self, user_id: int, max_size: int):
+        self.user_id = user_id
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=max_size)
+        self._overflowed = False
+
+    def _put(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow subscribers are dropped instead of buffering forever
+            self._overflowed = True
+
+    def put(self, event: dict) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Event loop of the subscriber is closed
+            pass
+
+    async def get(self) -> dict:
+        if self._overflowed:
+            raise EventSubscriptionOverflow()
+
+        return await self._queue.get()
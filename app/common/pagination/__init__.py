@@ -0,0 +1,3 @@
+from .modes import PaginationModes, CountModes
+
+__all__ = ["PaginationModes", "CountModes"]
@@ -0,0 +1,3 @@
+from .count_service import PaginationCountService
+
+__all__ = ["PaginationCountService"]
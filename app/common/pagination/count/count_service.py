@@ -0,0 +1,75 @@
+import json
+
+from django.db.models import QuerySet
+
+from common.base.services import BaseService
+from common.pagination.modes import CountModes
+
+
+class PaginationCountService(BaseService):
+    def __init__(self):
+        super().__init__()
+
+        self._counters = {
+            CountModes.EXACT: self._count_exact,
+            CountModes.CAPPED: self._count_capped,
+            CountModes.ESTIMATED: self._count_estimated,
+            CountModes.NONE: self._count_none,
+        }
+        self._async_counters = {
+            CountModes.EXACT: self._acount_exact,
+            CountModes.CAPPED: self._acount_capped,
+            CountModes.ESTIMATED: self._acount_estimated,
+            CountModes.NONE: self._acount_none,
+        }
+
+    def _get_name(self):
+        return "pagination-count-service"
+
+    def _count_exact(self, qs: QuerySet, cap: int) -> int:
+        return qs.count()
+
+    def _count_capped(self, qs: QuerySet, cap: int) -> int:
+        return qs.order_by()[:cap].count()
+
+    def _get_plan_rows(self, explain: str) -> int:
+        # A list of plans or a single plan, depending on the driver
+        plan = json.loads(explain)
+        if isinstance(plan, list):
+            plan = plan[0]
+
+        return plan["Plan"]["Plan Rows"]
+
+    def _count_estimated(self, qs: QuerySet, cap: int) -> int:
+        return self._get_plan_rows(qs.order_by().explain(format="json"))
+
+    def _count_none(self, qs: QuerySet, cap: int) -> None:
+        return None
+
+    async def _acount_exact(self, qs: QuerySet, cap: int) -> int:
+        return await qs.acount()
+
+    async def _acount_capped(self, qs: QuerySet, cap: int) -> int:
+        return await qs.order_by()[:cap].acount()
+
+    async def _acount_estimated(self, qs: QuerySet, cap: int) -> int:
+        return self._get_plan_rows(await qs.order_by().aexplain(format="json"))
+
+    async def _acount_none(self, qs: QuerySet, cap: int) -> None:
+        return None
+
+    def count(
+        self,
+        qs: QuerySet,
+        mode: CountModes = CountModes.EXACT,
+        cap: int = 1000,
+    ) -> int | None:
+        return self._counters[mode](qs, cap=cap)
+
+    async def acount(
+        self,
+        qs: QuerySet,
+        mode: CountModes = CountModes.EXACT,
+        cap: int = 1000,
+    ) -> int | None:
+        return await self._async_counters[mode](qs, cap=cap)
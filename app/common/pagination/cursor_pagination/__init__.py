@@ -0,0 +1,3 @@
+from .base_paginated import CursorPaginationService
+
+__all__ = ["CursorPaginationService"]
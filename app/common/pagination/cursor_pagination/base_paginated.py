@@ -0,0 +1,216 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q, QuerySet
+
+from common.base.services import BaseService
+from common.pagination.exceptions import InvalidCursorException
+
+
+class CursorPaginationService(BaseService):
+    def _get_name(self):
+        return "cursor-pagination-service"
+
+    def _encode_value(self, value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        return value
+
+    def encode_cursor(self, values: list, reverse: bool = False) -> str:
+        payload = {
+            "v": [self._encode_value(value) for value in values],
+            "r": reverse,
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode()
+
+        return urlsafe_b64encode(data).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str, size: int) -> tuple[list, bool]:
+        try:
+            data = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(data)
+            values, reverse = payload["v"], payload["r"]
+        except (ValueError, TypeError, KeyError):
+            raise InvalidCursorException()
+
+        if not isinstance(values, list) or len(values) != size:
+            raise InvalidCursorException()
+
+        if not isinstance(reverse, bool):
+            raise InvalidCursorException()
+
+        return values, reverse
+
+    def _is_nullable(self, qs: QuerySet, name: str) -> bool:
+        try:
+            return qs.model._meta.get_field(name).null
+        except FieldDoesNotExist:
+            # Annotations can always produce NULL
+            return True
+
+    def get_ordering(self, ordering: str, unique_key: str = "id") -> list[str]:
+        if ordering.startswith("-"):
+            return [ordering, f"-{unique_key}"]
+
+        return [ordering, unique_key]
+
+    def _parse_ordering(self, ordering: list[str]) -> list[tuple[str, bool]]:
+        return [(key.lstrip("-"), key.startswith("-")) for key in ordering]
+
+    def _get_after_q(
+        self, name: str, value, descending: bool, nullable: bool
+    ) -> Q | None:
+        # NULL is the greatest value (PostgreSQL default ordering)
+        if descending:
+            if value is None:
+                return Q(**{f"{name}__isnull": False})
+
+            return Q(**{f"{name}__lt": value})
+
+        if value is None:
+            return None
+
+        after_q = Q(**{f"{name}__gt": value})
+        if nullable:
+            after_q |= Q(**{f"{name}__isnull": True})
+
+        return after_q
+
+    def _get_equal_q(self, name: str, value) -> Q:
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+
+        return Q(**{name: value})
+
+    def _get_bound_q(self, name: str, value, descending: bool) -> Q:
+        # Redundant range condition on the leading key,
+        # lets the planner use an index range scan
+        if descending:
+            return Q(**{f"{name}__lte": value})
+
+        return Q(**{f"{name}__gte": value})
+
+    def _get_seek_qs(
+        self,
+        qs: QuerySet,
+        ordering: list[str],
+        values: list,
+        reverse: bool,
+    ) -> QuerySet:
+        keys = self._parse_ordering(ordering)
+
+        seek_q = None
+        equal_q = Q()
+        for (name, descending), value in zip(keys, values):
+            nullable = self._is_nullable(qs, name)
+            after_q = self._get_after_q(
+                name, value, descending != reverse, nullable
+            )
+            if after_q is not None:
+                seek_q = (
+                    equal_q & after_q
+                    if seek_q is None
+                    else seek_q | (equal_q & after_q)
+                )
+
+            equal_q &= self._get_equal_q(name, value)
+
+        if seek_q is None:
+            return qs.none()
+
+        name, descending = keys[0]
+        if values[0] is not None and not self._is_nullable(qs, name):
+            seek_q &= self._get_bound_q(name, values[0], descending != reverse)
+
+        try:
+            return qs.filter(seek_q)
+        except (ValidationError, ValueError, TypeError):
+            raise InvalidCursorException()
+
+    def _get_ordered_qs(
+        self, qs: QuerySet, ordering: list[str], reverse: bool
+    ) -> QuerySet:
+        return qs.order_by(
+            *[
+                F(name).desc() if descending != reverse else F(name).asc()
+                for name, descending in self._parse_ordering(ordering)
+            ]
+        )
+
+    def _get_values(self, item, ordering: list[str]) -> list:
+        names = [name for name, _ in self._parse_ordering(ordering)]
+        if isinstance(item, dict):
+            return [item[name] for name in names]
+
+        return [getattr(item, name) for name in names]
+
+    def _get_page_qs(
+        self, qs: QuerySet, ordering: list[str], cursor: str | None
+    ) -> tuple[QuerySet, bool]:
+        reverse = False
+        if cursor is not None:
+            values, reverse = self.decode_cursor(cursor, size=len(ordering))
+            qs = self._get_seek_qs(qs, ordering, values, reverse)
+
+        return self._get_ordered_qs(qs, ordering, reverse), reverse
+
+    def _get_page(
+        self,
+        results: list,
+        ordering: list[str],
+        cursor: str | None,
+        reverse: bool,
+        page_size: int,
+    ) -> dict:
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        has_next = cursor is not None if reverse else has_more
+        has_previous = has_more if reverse else cursor is not None
+
+        next_cursor = None
+        if has_next and results:
+            next_cursor = self.encode_cursor(
+                self._get_values(results[-1], ordering)
+            )
+
+        prev_cursor = None
+        if has_previous and results:
+            prev_cursor = self.encode_cursor(
+                self._get_values(results[0], ordering), reverse=True
+            )
+
+        return {
+            "results": results,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
+
+    def paginate(
+        self,
+        qs: QuerySet,
+        ordering: list[str],
+        cursor: str | None,
+        page_size: int,
+    ) -> dict:
+        ordered_qs, reverse = self._get_page_qs(qs, ordering, cursor)
+        results = list(ordered_qs[: page_size + 1])
+
+        return self._get_page(results, ordering, cursor, reverse, page_size)
+
+    async def apaginate(
+        self,
+        qs: QuerySet,
+        ordering: list[str],
+        cursor: str | None,
+        page_size: int,
+    ) -> dict:
+        ordered_qs, reverse = self._get_page_qs(qs, ordering, cursor)
+        results = [item async for item in ordered_qs[: page_size + 1]]
+
+        return self._get_page(results, ordering, cursor, reverse, page_size)
@@ -0,0 +1,3 @@
+from .invalid_cursor import InvalidCursorException
+
+__all__ = ["InvalidCursorException"]
@@ -0,0 +1,7 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class InvalidCursorException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = "Invalid cursor"
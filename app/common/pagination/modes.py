@@ -0,0 +1,13 @@
+from django.db.models import TextChoices
+
+
+class PaginationModes(TextChoices):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class CountModes(TextChoices):
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATED = "estimated"
+    NONE = "none"
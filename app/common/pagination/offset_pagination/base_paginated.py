@@ -10,3 +10,21 @@ class OffsetPaginationService(BaseService):
         result = iterable[offset : offset + page_size]
 
         return result
+
+    def paginate_lookahead(
+        self, iterable: iter, page: int, page_size: int
+    ) -> tuple[list, bool]:
+        offset = (page - 1) * page_size
+        result = list(iterable[offset : offset + page_size + 1])
+
+        return result[:page_size], len(result) > page_size
+
+    async def apaginate_lookahead(
+        self, iterable: iter, page: int, page_size: int
+    ) -> tuple[list, bool]:
+        offset = (page - 1) * page_size
+        result = [
+            item async for item in iterable[offset : offset + page_size + 1]
+        ]
+
+        return result[:page_size], len(result) > page_size
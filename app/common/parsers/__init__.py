@@ -0,0 +1,4 @@
+from .fast_json import FastJSONParser
+from .msgpack import MessagePackParser
+
+__all__ = ["FastJSONParser", "MessagePackParser"]
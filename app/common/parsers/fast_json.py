@@ -0,0 +1,38 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from common.renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSON parser built on orjson, falls back to the stock parser
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def _is_supported(self, encoding: str) -> bool:
+        return (
+            orjson is not None
+            and self.strict
+            and codecs.lookup(encoding).name == "utf-8"
+        )
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not self._is_supported(encoding):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
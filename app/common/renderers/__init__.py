@@ -0,0 +1,4 @@
+from .fast_json import FastJSONRenderer
+from .msgpack import MessagePackRenderer
+
+__all__ = ["FastJSONRenderer", "MessagePackRenderer"]
@@ -0,0 +1,51 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer built on orjson, falls back to the stock renderer
+
+    Output matches JSONRenderer, values orjson formats differently
+    (dates, times, dataclasses) are passed to the DRF encoder
+    """
+
+    def _is_supported(self, indent: int | None) -> bool:
+        return (
+            orjson is not None
+            and indent is None
+            and self.compact
+            and self.strict
+            and not self.ensure_ascii
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if not self._is_supported(indent):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # E.g. integers wider than 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping as JSONRenderer, output is a strict javascript subset
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
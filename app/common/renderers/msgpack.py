@@ -0,0 +1,25 @@
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer, selected with `Accept: application/msgpack`
+
+    Values msgpack has no type for (datetimes, decimals, UUIDs)
+    are converted the same way as in JSON responses
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return msgpack.packb(
+            data, default=JSONEncoder().default, use_bin_type=True
+        )
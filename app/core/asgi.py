@@ -4,4 +4,24 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Django has to be set up before consumers are imported
+from chat.v1.consumers import ChatV1EventsConsumer  # noqa: E402
+
+websocket_routes = {
+    "/chat/v1/events/": ChatV1EventsConsumer,
+}
+
+
+async def application(scope, receive, send):
+    if scope["type"] != "websocket":
+        return await django_application(scope, receive, send)
+
+    consumer_class = websocket_routes.get(scope["path"])
+    if consumer_class is None:
+        await receive()
+        await send({"type": "websocket.close", "code": 4404})
+        return
+
+    return await consumer_class()(scope, receive, send)
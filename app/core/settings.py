@@ -31,6 +31,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third parties
     "corsheaders",
     "rest_framework",
@@ -139,7 +140,18 @@ CORS_ALLOWED_ORIGINS = config("CORS_ALLOWED_ORIGINS", default="").split(",")
 
 # REST framework
 REST_FRAMEWORK = {
-    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    # orjson based, fall back to the stock JSON renderer and parser
+    # MessagePack is selected with Accept / Content-Type
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.FastJSONRenderer",
+        "common.renderers.MessagePackRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.FastJSONParser",
+        "common.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ],
@@ -169,6 +181,55 @@ SIMPLE_JWT = {
     ),
 }
 
+# Response validation
+# Share of dict responses validated against their serializers,
+# mismatches are counted and logged, and raised in strict mode
+RESPONSE_VALIDATION_SAMPLE_RATE = config(
+    "RESPONSE_VALIDATION_SAMPLE_RATE",
+    cast=float,
+    default=1.0 if DEBUG else 0.0,
+)
+RESPONSE_VALIDATION_STRICT = config(
+    "RESPONSE_VALIDATION_STRICT", cast=bool, default=DEBUG
+)
+
+# Cache
+CACHE_BACKEND = config(
+    "CACHE_BACKEND", default="django.core.cache.backends.dummy.DummyCache"
+)
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+# Invalidation has to reach every process, thread lists are only cached
+# with a shared backend (e.g. Redis), per process caches would serve
+# stale lists from other workers
+THREAD_LIST_CACHE_ENABLED = config(
+    "THREAD_LIST_CACHE_ENABLED",
+    cast=bool,
+    default=CACHE_BACKEND
+    not in [
+        "django.core.cache.backends.dummy.DummyCache",
+        "django.core.cache.backends.locmem.LocMemCache",
+    ],
+)
+THREAD_LIST_CACHE_TIMEOUT = config(
+    "THREAD_LIST_CACHE_TIMEOUT", cast=int, default=300
+)
+
+# Events
+EVENTS_BROKER = config("EVENTS_BROKER", default="postgres")
+EVENTS_NOTIFY_CHANNEL = config("EVENTS_NOTIFY_CHANNEL", default="chat_events")
+# PostgreSQL limits NOTIFY payloads to 8000 bytes
+EVENTS_NOTIFY_PAYLOAD_MAX_SIZE = config(
+    "EVENTS_NOTIFY_PAYLOAD_MAX_SIZE", cast=int, default=7900
+)
+EVENTS_SUBSCRIPTION_MAX_SIZE = config(
+    "EVENTS_SUBSCRIPTION_MAX_SIZE", cast=int, default=1000
+)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,